@@ -0,0 +1,19 @@
+"""Fixtures for the benchmark suite.
+
+Run with ``make bench``; ``make bench-save`` records a new baseline under
+``benchmarks/baselines`` and ``make bench`` compares against the latest one.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def run() -> Iterator[Callable[[Awaitable[Any]], Any]]:
+    """Run awaitables to completion on one event loop kept for the whole test."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
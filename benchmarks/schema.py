@@ -0,0 +1,47 @@
+"""Synthetic SQLAlchemy schemas shared by the benchmarks and ``scripts/``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, mapped_column, relationship
+
+from enrichmcp.sqlalchemy import EnrichSQLAlchemyMixin
+
+
+def build_schema(count: int) -> type[DeclarativeBase]:
+    """Return a declarative base with ``count`` chained models."""
+
+    class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+        pass
+
+    # The registry only holds weak references to mapped classes.
+    Base.models = []  # type: ignore[attr-defined]
+    for i in range(count):
+        attrs: dict[str, Any] = {
+            "__tablename__": f"table_{i}",
+            "__doc__": f"Synthetic model {i}",
+            "id": mapped_column(Integer, primary_key=True, info={"description": "ID"}),
+            "name": mapped_column(String, index=True, info={"description": "Name"}),
+            "status": mapped_column(String, index=True, info={"description": "Status"}),
+            "amount": mapped_column(Integer, info={"description": "Amount"}),
+        }
+        if i:
+            attrs["parent_id"] = mapped_column(
+                ForeignKey(f"table_{i - 1}.id"),
+                info={"description": "Parent"},
+            )
+            attrs["parent"] = relationship(
+                f"Model{i - 1}",
+                back_populates="children",
+                info={"description": "Parent record"},
+            )
+        if i < count - 1:
+            attrs["children"] = relationship(
+                f"Model{i + 1}",
+                back_populates="parent",
+                info={"description": "Child records"},
+            )
+        Base.models.append(type(f"Model{i}", (Base,), attrs))  # type: ignore[attr-defined]
+    return Base
@@ -0,0 +1,31 @@
+"""Cache backend throughput, 1000 set/get pairs per round."""
+
+import fakeredis.aioredis
+import pytest
+
+from enrichmcp.cache import MemoryCache, RedisCache
+
+OPS = 1000
+
+
+async def set_and_get(cache) -> int:
+    hits = 0
+    for i in range(OPS):
+        await cache.set("bench", f"key{i}", {"id": i, "name": "value"})
+        hits += await cache.get("bench", f"key{i}") is not None
+    return hits
+
+
+@pytest.mark.parametrize(
+    "make_cache",
+    [
+        pytest.param(MemoryCache, id="memory"),
+        pytest.param(
+            lambda: RedisCache("redis://", redis_client=fakeredis.aioredis.FakeRedis()),
+            id="fakeredis",
+        ),
+    ],
+)
+def test_cache_throughput(benchmark, run, make_cache) -> None:
+    cache = make_cache()
+    assert benchmark(lambda: run(set_and_get(cache))) == OPS
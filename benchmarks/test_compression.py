@@ -0,0 +1,88 @@
+"""Compression of large ``PageResult`` tool responses over streamable HTTP.
+
+Each run records the compressed response size in ``extra_info`` next to the
+round-trip latency, so ``--benchmark-compare`` shows both the bandwidth saved
+and the CPU time it costs.
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, PageResult
+from enrichmcp.compression import Compression, available_encodings
+
+ROWS = 1000
+
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "list_orders", "arguments": {"page_size": ROWS}},
+}
+
+
+def create_app() -> EnrichMCP:
+    app = EnrichMCP("Bench API", instructions="Benchmark API")
+
+    @app.entity
+    class Order(EnrichModel):
+        """Order."""
+
+        id: int = Field(description="ID")
+        customer: str = Field(description="Customer name")
+        status: str = Field(description="Status")
+        total: float = Field(description="Total")
+
+    @app.retrieve(description="List orders")
+    async def list_orders(page_size: int) -> PageResult[Order]:
+        items = [
+            Order(id=i, customer=f"customer {i % 97}", status="shipped", total=i * 1.25)
+            for i in range(page_size)
+        ]
+        return PageResult.create(items=items, page=1, page_size=page_size, has_next=True)
+
+    return app
+
+
+async def start(asgi: Any) -> tuple[asyncio.Event, asyncio.Task[None]]:
+    """Run the app's lifespan in a task that lives until the returned event is set."""
+    started, stop = asyncio.Event(), asyncio.Event()
+
+    async def serve() -> None:
+        async with asgi.router.lifespan_context(asgi):
+            started.set()
+            await stop.wait()
+
+    task = asyncio.create_task(serve())
+    await started.wait()
+    return stop, task
+
+
+@pytest.mark.parametrize("encoding", ["identity", *available_encodings()])
+def test_page_response(benchmark, run, encoding) -> None:
+    compression = Compression() if encoding != "identity" else False
+    asgi = create_app().http_app(
+        compression=compression,
+        json_response=True,
+        stateless_http=True,
+    )
+    stop, server = run(start(asgi))
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi), base_url="http://test")
+    headers = {"accept": "application/json, text/event-stream", "accept-encoding": encoding}
+
+    try:
+        response = benchmark(lambda: run(http.post("/mcp", json=CALL, headers=headers)))
+    finally:
+        run(http.aclose())
+        stop.set()
+        run(server)
+
+    wire_bytes = int(response.headers["content-length"])
+    benchmark.extra_info["wire_bytes"] = wire_bytes
+    benchmark.extra_info["ratio"] = round(len(response.content) / wire_bytes, 2)
+    assert response.headers.get("content-encoding", "identity") == encoding
+    assert len(response.json()["result"]["structuredContent"]["items"]) == ROWS
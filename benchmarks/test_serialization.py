@@ -0,0 +1,54 @@
+"""Serialization of large result pages."""
+
+import pytest
+from pydantic import Field
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichModel, PageResult
+from enrichmcp.sqlalchemy import EnrichSQLAlchemyMixin
+from enrichmcp.sqlalchemy.auto import _sa_to_enrich
+
+ROWS = 1000
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Product(Base):
+    """Product."""
+
+    __tablename__ = "products"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+    price: Mapped[float] = mapped_column(info={"description": "Price"})
+    sku: Mapped[str] = mapped_column(info={"description": "SKU"})
+
+
+ProductModel = Product.__enrich_model__()
+
+
+class Item(EnrichModel):
+    """Item."""
+
+    id: int = Field(description="ID")
+    name: str = Field(description="Name")
+    price: float = Field(description="Price")
+    sku: str = Field(description="SKU")
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[Product]:
+    return [Product(id=i, name=f"product {i}", price=i / 3, sku=f"SKU-{i:06}") for i in range(ROWS)]
+
+
+def test_page_serialization(benchmark) -> None:
+    items = [Item(id=i, name=f"item {i}", price=i / 3, sku=f"SKU-{i:06}") for i in range(ROWS)]
+    page = PageResult.create(items=items, page=1, page_size=ROWS, has_next=False)
+    data = benchmark(page.model_dump_json)
+    assert data.count('"sku"') == ROWS
+
+
+def test_sa_to_enrich(benchmark, rows) -> None:
+    items = benchmark(lambda: [_sa_to_enrich(row, ProductModel) for row in rows])
+    assert len(items) == ROWS
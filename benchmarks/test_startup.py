@@ -0,0 +1,33 @@
+"""Startup cost on a synthetic 500-table SQLite schema."""
+
+import pytest
+from sqlalchemy import create_engine
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import include_sqlalchemy_models
+
+from .schema import build_schema
+
+MODELS = 500
+
+
+@pytest.fixture(scope="module")
+def base():
+    base = build_schema(MODELS)
+    base.metadata.create_all(create_engine("sqlite://"))
+    return base
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_include_sqlalchemy_models(benchmark, base, lazy) -> None:
+    def setup():
+        return (EnrichMCP("Bench", instructions="Startup", lazy_tools=lazy), base), {}
+
+    benchmark.pedantic(include_sqlalchemy_models, setup=setup, rounds=3)
+
+
+def test_describe_model(benchmark, base) -> None:
+    app = EnrichMCP("Bench", instructions="Startup", lazy_tools=True)
+    include_sqlalchemy_models(app, base)
+    description = benchmark(app.describe_model)
+    assert description.count("## ") >= MODELS
@@ -0,0 +1,56 @@
+"""In-process tool dispatch through the FastMCP client."""
+
+from contextlib import AsyncExitStack
+
+import pytest
+from fastmcp import Client
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship
+
+
+def create_app() -> EnrichMCP:
+    app = EnrichMCP("Bench API", instructions="Benchmark API")
+
+    @app.entity
+    class Order(EnrichModel):
+        """Order."""
+
+        id: int = Field(description="ID")
+        total: float = Field(description="Total")
+
+    @app.entity
+    class User(EnrichModel):
+        """User."""
+
+        id: int = Field(description="ID")
+        name: str = Field(description="Name")
+        orders: list[Order] = Relationship(description="Orders")
+
+    @app.retrieve(description="Get a user")
+    async def get_user(user_id: int) -> User:
+        return User(id=user_id, name="Alice")
+
+    @User.orders.resolver(name="get")
+    async def get_orders(user_id: int) -> list[Order]:
+        return [Order(id=i, total=i * 1.5) for i in range(20)]
+
+    return app
+
+
+@pytest.fixture
+def client(run):
+    stack = AsyncExitStack()
+    client = run(stack.enter_async_context(Client(create_app().mcp)))
+    yield client
+    run(stack.aclose())
+
+
+def test_call_retriever(benchmark, run, client) -> None:
+    result = benchmark(lambda: run(client.call_tool("get_user", {"user_id": 1})))
+    assert result.data.name == "Alice"
+
+
+def test_call_resolver(benchmark, run, client) -> None:
+    result = benchmark(lambda: run(client.call_tool("get_user_orders", {"user_id": 1})))
+    assert len(result.structured_content["result"]) == 20
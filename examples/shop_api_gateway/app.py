@@ -148,12 +148,13 @@ async def get_order_products(order_id: int, ctx: Context) -> list[Product]:
     resp = await client.get(f"/orders/{order_id}")
     resp.raise_for_status()
     data = resp.json()
-    products = []
-    for pid in data.get("product_ids", []):
+
+    async def fetch_product(pid: int) -> Product:
         r = await client.get(f"/products/{pid}")
         r.raise_for_status()
-        products.append(Product(**r.json()))
-    return products
+        return Product(**r.json())
+
+    return await app.gather(fetch_product(pid) for pid in data.get("product_ids", []))
 
 
 if __name__ == "__main__":
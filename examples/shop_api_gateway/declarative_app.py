@@ -0,0 +1,78 @@
+"""Declarative variant of the API gateway example.
+
+Instead of hand-written resolvers this version maps each entity and
+relationship onto the backend's REST endpoints with ``HTTPGateway``. The
+generated tools share one pooled HTTP client, cache responses according to
+their ``Cache-Control`` headers and coalesce duplicate in-flight requests.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship
+from enrichmcp.http import HTTPGateway
+
+gateway = HTTPGateway("http://localhost:8001", max_connections=50)
+
+app = EnrichMCP(
+    title="Shop API Gateway",
+    instructions="EnrichMCP front-end for a FastAPI backend",
+    lifespan=gateway.lifespan,
+)
+
+
+@app.entity()
+class User(EnrichModel):
+    """Customer account."""
+
+    id: int = Field(description="User ID")
+    username: str = Field(description="Username")
+    email: str = Field(description="Email")
+    full_name: str = Field(description="Full name")
+    created_at: datetime = Field(description="Account created")
+
+    orders: list[Order] = Relationship(description="Orders for the user")
+
+
+@app.entity()
+class Product(EnrichModel):
+    """Product for sale."""
+
+    id: int = Field(description="Product ID")
+    sku: str = Field(description="SKU")
+    name: str = Field(description="Name")
+    price: float = Field(description="Price in USD")
+
+
+@app.entity()
+class Order(EnrichModel):
+    """Customer order."""
+
+    id: int = Field(description="Order ID")
+    order_number: str = Field(description="Order number")
+    user_id: int = Field(description="Owner user ID")
+    created_at: datetime = Field(description="Created timestamp")
+    status: str = Field(description="Status")
+    total_amount: float = Field(description="Total amount")
+
+    user: User = Relationship(description="User who placed the order")
+    products: list[Product] = Relationship(description="Products in the order")
+
+
+app.rebuild_models()
+
+gateway.entity(User, path="/users")
+gateway.entity(Product, path="/products")
+gateway.entity(Order, path="/orders", list_params={"user_id": int})
+
+gateway.relationship(User.orders, path="/orders", params={"user_id": "{id}"})
+gateway.relationship(Order.user, via="user_id")
+gateway.relationship(Order.products, via="product_ids")
+
+
+if __name__ == "__main__":
+    print("Starting declarative Shop API Gateway...")
+    app.run()
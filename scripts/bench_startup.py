@@ -0,0 +1,51 @@
+"""Measure registration time of ``include_sqlalchemy_models`` on a large schema.
+
+Builds a synthetic declarative schema of ``--models`` tables, each with a few
+indexed columns, a many-to-one relationship to the previous table and the
+matching one-to-many back reference, then times tool generation and prints
+the per-phase startup profile of the last run.
+
+Usage::
+
+    python scripts/bench_startup.py --models 500 --repeat 3 [--lazy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.schema import build_schema
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import include_sqlalchemy_models
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--lazy", action="store_true", help="use lazy_tools=True")
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        base = build_schema(args.models)
+        app = EnrichMCP("Bench", "Startup benchmark", lazy_tools=args.lazy)
+        start = time.perf_counter()
+        include_sqlalchemy_models(app, base)
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"{args.models} models, {len(app.tool_defs)} tools: "
+        f"median {statistics.median(timings):.3f}s, best {min(timings):.3f}s",
+    )
+    print(app.startup_profile.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,63 +5,97 @@ as entities with relationships between them, making it easier for AI
 assistants to interact with structured data.
 """
 
-# Version handling
-__version__: str
-try:
-    # If installed, setuptools_scm will have generated this
-    from ._version import __version__  # pyright: ignore
-except ImportError:
-    try:
-        # During development/editable installs
-        from setuptools_scm import get_version  # pyright: ignore[reportMissingImports]
+from __future__ import annotations
 
-        __version__ = get_version(root="../..", relative_to=__file__)  # pyright: ignore[reportUnknownVariableType]
-    except (ImportError, LookupError):
-        # Fallback
-        __version__ = "0.0.0+unknown"
-
-# Public exports
-from typing import TYPE_CHECKING
-
-from mcp.types import ModelPreferences
-
-from .app import EnrichMCP
-from .cache import MemoryCache, RedisCache
-from .context import (
-    get_enrich_context,
-    prefer_fast_model,
-    prefer_medium_model,
-    prefer_smart_model,
-)
-from .datamodel import (
-    DataModelSummary,
-    EntityDescription,
-    FieldDescription,
-    ModelDescription,
-    RelationshipDescription,
-)
-from .entity import EnrichModel
-from .lifespan import combine_lifespans
-from .pagination import CursorParams, CursorResult, PageResult, PaginatedResult, PaginationParams
-from .parameter import EnrichParameter
-from .relationship import (
-    Relationship,
-)
-from .tool import ToolDef, ToolKind
+import importlib
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .sqlalchemy import EnrichSQLAlchemyMixin, sqlalchemy_lifespan
+    from mcp.types import ModelPreferences
 
-# Optional SQLAlchemy integration
-has_sqlalchemy: bool = False
-try:  # pragma: no cover - optional dependency
+    # Computed on first access by __getattr__
+    __version__: str
+
+    from .admission import ConcurrencyLimit
+    from .app import EnrichMCP
+    from .cache import MemoryCache, RedisCache
+    from .concurrency import gather_bounded
+    from .context import (
+        get_enrich_context,
+        prefer_fast_model,
+        prefer_medium_model,
+        prefer_smart_model,
+    )
+    from .datamodel import (
+        DataModelSummary,
+        EntityDescription,
+        FieldDescription,
+        ModelDescription,
+        RelationshipDescription,
+    )
+    from .entity import EnrichModel
+    from .executors import ExecutorPools
+    from .lifespan import combine_lifespans
+    from .limits import ResultLimits
+    from .pagination import (
+        CursorParams,
+        CursorResult,
+        PageResult,
+        PaginatedResult,
+        PaginationParams,
+    )
+    from .parameter import EnrichParameter
+    from .relationship import Relationship
     from .sqlalchemy import EnrichSQLAlchemyMixin, sqlalchemy_lifespan  # noqa: F401
-except ImportError:  # pragma: no cover - optional dependency
-    pass
-else:
-    has_sqlalchemy = True
+    from .tool import ToolDef, ToolKind
+
+# Public exports are imported on first access so that ``import enrichmcp``
+# does not pull in FastMCP, SQLAlchemy or redis until they are used. This
+# matters for stdio servers that are spawned once per agent session.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ConcurrencyLimit": ".admission",
+    "CursorParams": ".pagination",
+    "CursorResult": ".pagination",
+    "DataModelSummary": ".datamodel",
+    "EnrichMCP": ".app",
+    "EnrichModel": ".entity",
+    "EnrichParameter": ".parameter",
+    "EntityDescription": ".datamodel",
+    "ExecutorPools": ".executors",
+    "FieldDescription": ".datamodel",
+    "MemoryCache": ".cache",
+    "ModelDescription": ".datamodel",
+    "ModelPreferences": "mcp.types",
+    "PageResult": ".pagination",
+    "PaginatedResult": ".pagination",
+    "PaginationParams": ".pagination",
+    "RedisCache": ".cache",
+    "Relationship": ".relationship",
+    "RelationshipDescription": ".datamodel",
+    "ResultLimits": ".limits",
+    "ToolDef": ".tool",
+    "ToolKind": ".tool",
+    "combine_lifespans": ".lifespan",
+    "gather_bounded": ".concurrency",
+    "get_enrich_context": ".context",
+    "prefer_fast_model": ".context",
+    "prefer_medium_model": ".context",
+    "prefer_smart_model": ".context",
+}
+
+# Optional SQLAlchemy integration
+has_sqlalchemy: bool = find_spec("sqlalchemy") is not None
+if has_sqlalchemy:
+    _LAZY_EXPORTS.update(
+        {
+            "EnrichSQLAlchemyMixin": ".sqlalchemy",
+            "sqlalchemy_lifespan": ".sqlalchemy",
+        },
+    )
 
 __all__ = [
+    "ConcurrencyLimit",
     "CursorParams",
     "CursorResult",
     "DataModelSummary",
@@ -69,6 +103,7 @@ __all__ = [
     "EnrichModel",
     "EnrichParameter",
     "EntityDescription",
+    "ExecutorPools",
     "FieldDescription",
     "MemoryCache",
     "ModelDescription",
@@ -79,10 +114,12 @@ __all__ = [
     "RedisCache",
     "Relationship",
     "RelationshipDescription",
+    "ResultLimits",
     "ToolDef",
     "ToolKind",
     "__version__",
     "combine_lifespans",
+    "gather_bounded",
     "get_enrich_context",
     "prefer_fast_model",
     "prefer_medium_model",
@@ -92,3 +129,37 @@ __all__ = [
 # Add SQLAlchemy to exports if available
 if has_sqlalchemy:
     __all__.extend(["EnrichSQLAlchemyMixin", "sqlalchemy_lifespan"])
+
+
+def _get_version() -> str:
+    try:
+        # If installed, setuptools_scm will have generated this
+        from ._version import __version__  # pyright: ignore
+
+        return __version__
+    except ImportError:
+        pass
+    try:
+        # During development/editable installs
+        from setuptools_scm import get_version  # pyright: ignore[reportMissingImports]
+
+        return get_version(root="../..", relative_to=__file__)  # pyright: ignore[reportUnknownVariableType]
+    except (ImportError, LookupError):
+        # Fallback
+        return "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _get_version()
+    elif name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,137 @@
+"""Per-tool concurrency limits and load shedding.
+
+A :class:`ConcurrencyLimit` caps how many calls run at once, how many more
+may wait for a slot and for how long. Calls beyond that are rejected right
+away with :class:`~enrichmcp.errors.ToolOverloadedError`, a "retry later"
+error agents can act on, instead of piling up on database connections or
+LLM sampling and starving cheap tools.
+
+Limits apply per tool, set with ``concurrency=`` on ``@app.retrieve``,
+``@app.create``, ``@app.update``, ``@app.delete`` and
+``Relationship.resolver``, and through ``EnrichMCP(concurrency={...})``
+keyed by tool name (for generated tools) or by :class:`~enrichmcp.ToolKind`
+to share one limit across every tool of that kind. A call takes a slot from
+its tool limit first and then from its kind limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware
+
+from .errors import ToolOverloadedError
+from .tool import ToolKind
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+
+    from .app import EnrichMCP
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimit:
+    """How many calls may run at once and how many may queue behind them.
+
+    ``max_concurrent`` calls run at a time and up to ``max_waiting`` more
+    wait for a slot, each for at most ``wait_timeout`` seconds (``None``
+    waits indefinitely). Other calls are rejected with
+    :class:`~enrichmcp.errors.ToolOverloadedError`, advising clients to retry
+    after ``retry_after`` seconds.
+    """
+
+    max_concurrent: int
+    max_waiting: int = 0
+    wait_timeout: float | None = None
+    retry_after: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        if self.max_waiting < 0:
+            raise ValueError("max_waiting must be >= 0")
+
+
+class _Gate:
+    """Admits calls within one :class:`ConcurrencyLimit`."""
+
+    def __init__(self, limit: ConcurrencyLimit) -> None:
+        self.limit = limit
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit.max_concurrent)
+
+    @asynccontextmanager
+    async def admit(self, tool: str) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self.waiting >= self.limit.max_waiting:
+                raise ToolOverloadedError(tool, self.limit.retry_after)
+            self.waiting += 1
+            try:
+                async with asyncio.timeout(self.limit.wait_timeout):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                raise ToolOverloadedError(tool, self.limit.retry_after) from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+class AdmissionMiddleware(Middleware):
+    """Enforce the concurrency limits of the tools on ``app``."""
+
+    def __init__(
+        self,
+        app: EnrichMCP,
+        limits: Mapping[ToolKind | str, ConcurrencyLimit] | None = None,
+    ) -> None:
+        self.app = app
+        self.kind_limits: dict[ToolKind, ConcurrencyLimit] = {}
+        self.tool_limits: dict[str, ConcurrencyLimit] = {}
+        for key, limit in (limits or {}).items():
+            if isinstance(key, ToolKind):
+                self.kind_limits[key] = limit
+            else:
+                self.tool_limits[key] = limit
+        self._tool_gates: dict[str, _Gate] = {}
+        self._kind_gates: dict[ToolKind, _Gate] = {}
+
+    def _gates(self, name: str) -> list[_Gate]:
+        tool_def = self.app.tool_defs.get(name)
+        if tool_def is None:
+            return []
+        gates = []
+        tool_limit = tool_def.concurrency or self.tool_limits.get(name)
+        if tool_limit is not None:
+            if name not in self._tool_gates:
+                self._tool_gates[name] = _Gate(tool_limit)
+            gates.append(self._tool_gates[name])
+        kind_limit = self.kind_limits.get(tool_def.kind)
+        if kind_limit is not None:
+            if tool_def.kind not in self._kind_gates:
+                self._kind_gates[tool_def.kind] = _Gate(kind_limit)
+            gates.append(self._kind_gates[tool_def.kind])
+        return gates
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        name = context.message.name
+        gates = self._gates(name)
+        if not gates:
+            return await call_next(context)
+        async with AsyncExitStack() as stack:
+            for gate in gates:
+                await stack.enter_async_context(gate.admit(name))
+            return await call_next(context)
@@ -3,14 +3,20 @@
 Provides the EnrichMCP class for creating MCP applications.
 """
 
+import functools
 import inspect
+import os
 import warnings
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     Protocol,
     TypeVar,
+    cast,
     get_args,
     get_origin,
     overload,
@@ -20,9 +26,11 @@ from uuid import uuid4
 
 from fastmcp import FastMCP
 from fastmcp.tools import FunctionTool
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, PydanticUndefinedAnnotation, PydanticUserError, create_model
 
+from .admission import AdmissionMiddleware, ConcurrencyLimit
 from .cache import CacheBackend, ContextCache, MemoryCache
+from .concurrency import DEFAULT_FANOUT_LIMIT, gather_bounded
 from .context import EnrichContext
 from .datamodel import (
     DataModelSummary,
@@ -31,15 +39,30 @@ from .datamodel import (
     ModelDescription,
     RelationshipDescription,
 )
+from .encoding import Encoding, encode_results
 from .entity import EnrichModel
+from .executors import Executor, ExecutorPools, offload
+from .limits import CONTINUATION_TOOL, ResultLimits, ResultStore, limit_results
+from .manifest import ToolManifest, load_manifest
+from .metrics import ToolMetrics, install_metrics
+from .pagination import CursorResult
 from .parameter import EnrichParameter
+from .profiling import ProfilingMiddleware, SlowCallProfiler
 from .relationship import Relationship  # noqa: TC001
+from .startup import LazyToolsMiddleware, PendingTool, StartupProfile
 from .tool import ToolDef, ToolKind
+from .tracing import TracingMiddleware, tracing_available
+
+if TYPE_CHECKING:
+    from .compression import Compression
 
 # Type variables
 T = TypeVar("T", bound=EnrichModel)
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Pydantic error codes of annotations that rebuild_models() may resolve
+_FORWARD_REFERENCE_ERRORS = ("undefined-annotation", "class-not-fully-defined")
+
 
 @runtime_checkable
 class DecoratorCallable(Protocol):
@@ -63,6 +86,15 @@ class EnrichMCP:
         lifespan: Any = None,
         cache_backend: CacheBackend | None = None,
         description: str | None = None,
+        fanout_limit: int = DEFAULT_FANOUT_LIMIT,
+        lazy_tools: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
+        metrics: bool | ToolMetrics = False,
+        profiler: SlowCallProfiler | None = None,
+        result_limits: ResultLimits | None = None,
+        encoding: Encoding | None = None,
+        executors: ExecutorPools | None = None,
+        concurrency: Mapping[ToolKind | str, ConcurrencyLimit] | None = None,
     ):
         """Initialize the EnrichMCP application.
 
@@ -70,6 +102,30 @@ class EnrichMCP:
             title: API title shown in documentation
             instructions: Instructions for interacting with the API
             lifespan: Optional async context manager for startup/shutdown lifecycle
+            cache_backend: Backend used by request, user and global caches
+            fanout_limit: Default concurrency limit for :meth:`gather`
+            lazy_tools: Defer building tools and their JSON schemas until
+                they are first listed or called
+            manifest: Path of a tool manifest written by
+                :func:`enrichmcp.manifest.write_manifest`; implies
+                ``lazy_tools`` and builds tools from its stored schemas when
+                it matches the app
+            metrics: Record per-tool call metrics; pass a
+                :class:`~enrichmcp.metrics.ToolMetrics` to configure the
+                Prometheus route and exporters
+            profiler: Sample every tool call and persist the profiles of
+                calls slower than its threshold
+            result_limits: Default :class:`~enrichmcp.limits.ResultLimits` for
+                tools returning lists; oversized results are truncated to a
+                ``CursorResult`` continued by the ``next_result_page`` tool
+            encoding: Default result encoding of tools, ``"json"`` or
+                ``"compact"``; either lets clients pick per request, see
+                :mod:`enrichmcp.encoding`
+            executors: Thread and process pools for tools declared with
+                ``executor=``; see :mod:`enrichmcp.executors`
+            concurrency: Concurrency limits keyed by tool name, or by
+                :class:`ToolKind` to share one limit across every tool of
+                that kind; see :mod:`enrichmcp.admission`
 
         """
         if description is not None:
@@ -87,10 +143,12 @@ class EnrichMCP:
         self.instructions = instructions
         self._cache_id = uuid4().hex[:8]
         self.cache_backend = cache_backend or MemoryCache()
+        self.fanout_limit = fanout_limit
+        self.executors = executors or ExecutorPools()
         # FastMCP renamed the ``description`` parameter to ``instructions`` in
         # mcp-python 0.1.4. ``EnrichMCP`` now follows this naming but continues
         # to accept the old parameter name for backward compatibility.
-        self.mcp = FastMCP(name=title, instructions=instructions, lifespan=lifespan)
+        self.mcp = FastMCP(name=title, instructions=instructions, lifespan=self._lifespan(lifespan))
         self.name = title  # Required for mcp install
 
         # Registries
@@ -98,10 +156,77 @@ class EnrichMCP:
         self.resolvers: dict[tuple[str, str], dict[str, Any]] = {}
         self.relationships: dict[str, set[Relationship]] = {}
         self.resources: dict[str, FunctionTool] = {}
+        self.tool_defs: dict[str, ToolDef] = {}
+
+        # Tool call spans; no-ops until an OpenTelemetry SDK is configured
+        if tracing_available():
+            self.mcp.add_middleware(TracingMiddleware(self))
+
+        # Startup
+        self.lazy_tools = lazy_tools or manifest is not None
+        self.manifest_path = manifest
+        self._manifest: ToolManifest | None = None
+        self._manifest_checked = False
+        self.startup_profile = StartupProfile()
+        self._pending_tools: dict[str, tuple[Callable[..., Any], ToolDef]] = {}
+        if self.lazy_tools:
+            self.mcp.add_middleware(LazyToolsMiddleware(self))
+
+        # Metrics
+        if metrics is True:
+            metrics = ToolMetrics()
+        self.metrics: ToolMetrics | None = metrics or None
+        if self.metrics is not None:
+            install_metrics(self, self.metrics)
+        self.profiler = profiler
+        if profiler is not None:
+            self.mcp.add_middleware(ProfilingMiddleware(profiler))
+
+        # Result size limits
+        self.result_limits = result_limits
+        self.result_store = ResultStore(
+            self.cache_backend,
+            f"enrichmcp:results:{self._cache_id}",
+        )
+
+        if encoding is not None and encoding not in get_args(Encoding):
+            raise ValueError(f"Unknown encoding {encoding!r}; use 'json' or 'compact'")
+        self.encoding: Encoding | None = encoding
+
+        # Concurrency limits
+        self._admission: AdmissionMiddleware | None = None
+        if concurrency:
+            self._admission_middleware(concurrency)
 
         # Register built-in resources
         self._register_builtin_resources()
 
+    def _lifespan(self, lifespan: Any) -> Any:
+        """Wrap ``lifespan`` to open the executor pools used by tools around it."""
+
+        @asynccontextmanager
+        async def run(server: Any) -> AsyncIterator[Any]:
+            used: set[Executor] = {
+                tool_def.executor for tool_def in self.tool_defs.values() if tool_def.executor
+            }
+            async with self.executors.running(used):
+                if lifespan is None:
+                    yield {}
+                    return
+                async with lifespan(server) as context:
+                    yield context
+
+        return run
+
+    def _admission_middleware(
+        self,
+        limits: Mapping[ToolKind | str, ConcurrencyLimit] | None = None,
+    ) -> AdmissionMiddleware:
+        if self._admission is None:
+            self._admission = AdmissionMiddleware(self, limits)
+            self.mcp.add_middleware(self._admission)
+        return self._admission
+
     def rebuild_models(self) -> None:
         """Rebuild all registered models to resolve forward references."""
         for entity_cls in self.entities.values():
@@ -139,6 +264,22 @@ class EnrichMCP:
                 ),
             )
 
+    def _register_continuation_tool(self) -> None:
+        """Register the tool that pages through truncated results."""
+        if CONTINUATION_TOOL in self.tool_defs:
+            return
+
+        @self.retrieve(
+            name=CONTINUATION_TOOL,
+            description=(
+                "Fetch the next page of a result that was too large to return at once."
+                " Pass the next_cursor of the truncated result; keep calling with each"
+                " new next_cursor until it is null."
+            ),
+        )
+        async def next_result_page(cursor: str) -> CursorResult[Any]:  # pyright: ignore[reportUnusedFunction]
+            return await self.result_store.next_page(cursor)
+
     @overload
     def entity(self, cls: type[T]) -> type[T]: ...
 
@@ -328,6 +469,8 @@ class EnrichMCP:
 
     def describe_model(self) -> str:
         """Return a Markdown description of the entire data model."""
+        if self._manifest is not None:
+            return self._manifest.data_model
         return str(self.describe_model_struct())
 
     def _append_enrichparameter_hints(self, description: str, fn: Callable[..., Any]) -> str:
@@ -376,13 +519,101 @@ class EnrichMCP:
         return description
 
     def _register_tool_def(self, fn: F, tool_def: ToolDef) -> FunctionTool:  # type: ignore[reportInvalidTypeVarUse]
-        """Register ``fn`` as a tool using ``tool_def``."""
-        desc = self._append_enrichparameter_hints(tool_def.final_description(self), fn)
-        mcp_tool = self.mcp.tool(name=tool_def.name, description=desc)
-        function_tool = mcp_tool(fn)  # type: ignore[return-value]
+        """Register ``fn`` as a tool using ``tool_def``.
+
+        With ``lazy_tools`` the tool is only queued and a
+        :class:`~enrichmcp.startup.PendingTool` standing in for it is
+        returned; see :meth:`register_pending_tools`. Tools with an
+        executor are wrapped to run in its pool, tools returning a list to
+        enforce ``tool_def.limits`` or the app's ``result_limits``, and tools
+        with an encoding to apply it.
+        """
+        with self.startup_profile.phase("tool registration"):
+            tool_fn: Callable[..., Any] = fn
+            if tool_def.executor is not None:
+                on_wait = None
+                if self.metrics is not None:
+                    on_wait = functools.partial(
+                        self.metrics.record_queue_wait,
+                        tool_def.name,
+                        tool_def.kind.value,
+                    )
+                tool_fn = offload(fn, self.executors, tool_def.executor, on_wait=on_wait)
+            limits = tool_def.limits or self.result_limits
+            limited = limit_results(tool_fn, self.result_store, limits) if limits else None
+            if limited is not None:
+                tool_fn = limited
+                tool_def = replace(
+                    tool_def,
+                    description=(
+                        f"{tool_def.description} Large results are truncated to a"
+                        f" CursorResult; call {CONTINUATION_TOOL} with its next_cursor"
+                        " for the rest."
+                    ).strip(),
+                )
+                self._register_continuation_tool()
+            encoding = tool_def.encoding or self.encoding
+            encoded = encode_results(tool_fn, encoding) if encoding else None
+            if encoded is not None:
+                tool_fn = encoded
+            self.tool_defs[tool_def.name] = tool_def
+            if tool_def.concurrency is not None:
+                self._admission_middleware()
+            if self.lazy_tools:
+                self._pending_tools[tool_def.name] = (tool_fn, tool_def)
+                return cast("FunctionTool", PendingTool(self, tool_def.name))
+            return self._build_tool(tool_fn, tool_def)
+
+    def _build_tool(self, fn: Callable[..., Any], tool_def: ToolDef) -> FunctionTool:
+        stored = self._manifest.tools.get(tool_def.name) if self._manifest else None
+        if stored is not None:
+            with self.startup_profile.phase("manifest"):
+                function_tool = FunctionTool(
+                    fn=fn,
+                    name=tool_def.name,
+                    description=stored.description,
+                    parameters=stored.parameters,
+                    output_schema=stored.output_schema,
+                )
+                self.mcp.add_tool(function_tool)
+            self.resources[tool_def.name] = function_tool
+            return function_tool
+
+        with self.startup_profile.phase("schema"):
+            desc = self._append_enrichparameter_hints(tool_def.final_description(self), fn)
+            mcp_tool = self.mcp.tool(name=tool_def.name, description=desc)
+            function_tool = mcp_tool(fn)  # type: ignore[return-value]
         self.resources[tool_def.name] = function_tool
         return function_tool
 
+    def register_pending_tools(self, names: Iterable[str] | None = None) -> None:
+        """Build tools queued by ``lazy_tools``, or only those in ``names``.
+
+        This runs automatically on the first ``tools/list`` request and on
+        each tool's first call. Call it directly before inspecting
+        ``app.mcp`` tools outside of a request, or at the end of startup to
+        build every tool ahead of the first client.
+        """
+        if not self._pending_tools:
+            return
+        if self.manifest_path is not None and not self._manifest_checked:
+            self._manifest_checked = True
+            with self.startup_profile.phase("manifest"):
+                self._manifest = load_manifest(self, self.manifest_path)
+        selected = list(self._pending_tools) if names is None else names
+        for name in selected:
+            pending = self._pending_tools.pop(name, None)
+            if pending is None:
+                continue
+            try:
+                self._build_tool(*pending)
+            except (PydanticUndefinedAnnotation, PydanticUserError) as exc:
+                # Forward references may only resolve once every entity exists
+                if exc.code not in _FORWARD_REFERENCE_ERRORS:
+                    raise
+                self.rebuild_models()
+                self._build_tool(*pending)
+
     def _tool_decorator(
         self,
         kind: ToolKind,
@@ -390,6 +621,10 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        limits: ResultLimits | None = None,
+        encoding: Encoding | None = None,
+        executor: Executor | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> FunctionTool | Callable[[F], FunctionTool]:
         """Return a decorator that registers a tool of the given ``kind``."""
 
@@ -405,7 +640,15 @@ class EnrichMCP:
             if tool_desc == fn.__doc__ and tool_desc:
                 tool_desc = tool_desc.strip()
 
-            tool_def = ToolDef(kind=kind, name=tool_name, description=tool_desc)
+            tool_def = ToolDef(
+                kind=kind,
+                name=tool_name,
+                description=tool_desc,
+                limits=limits,
+                encoding=encoding,
+                executor=executor,
+                concurrency=concurrency,
+            )
             return self._register_tool_def(fn, tool_def)
 
         if func is not None:
@@ -423,6 +666,10 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        limits: ResultLimits | None = None,
+        encoding: Encoding | None = None,
+        executor: Executor | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> Callable[[F], FunctionTool]: ...  # type: ignore[reportInvalidTypeVarUse]
 
     def retrieve(
@@ -431,6 +678,10 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        limits: ResultLimits | None = None,
+        encoding: Encoding | None = None,
+        executor: Executor | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> FunctionTool | Callable[[F], FunctionTool]:
         """Register a function as an MCP resource.
 
@@ -449,6 +700,14 @@ class EnrichMCP:
             func: The function to register (when used without parentheses)
             name: Override function name (default: function.__name__)
             description: Override description (default: function.__doc__)
+            limits: Result size limits for this tool, replacing the app's
+                ``result_limits``
+            encoding: Result encoding for this tool, replacing the app's
+                ``encoding``
+            executor: Run the tool in the app's ``"thread"`` or ``"process"``
+                pool instead of on the event loop
+            concurrency: Cap on concurrent calls of this tool; calls over it
+                are rejected with :class:`~enrichmcp.errors.ToolOverloadedError`
 
         Returns:
             Decorated function or decorator
@@ -457,7 +716,16 @@ class EnrichMCP:
             ValueError: If no description is provided (neither in decorator nor docstring)
 
         """
-        return self._tool_decorator(ToolKind.RETRIEVER, func, name=name, description=description)
+        return self._tool_decorator(
+            ToolKind.RETRIEVER,
+            func,
+            name=name,
+            description=description,
+            limits=limits,
+            encoding=encoding,
+            executor=executor,
+            concurrency=concurrency,
+        )
 
     def resource(self, *args: Any, **kwargs: Any) -> Any:
         """Deprecated alias for :meth:`retrieve`. Use :meth:`retrieve` instead."""
@@ -479,6 +747,7 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> Callable[[F], FunctionTool]: ...  # type: ignore[reportInvalidTypeVarUse]
 
     def create(
@@ -487,9 +756,16 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> FunctionTool | Callable[[F], FunctionTool]:
         """Register a create operation."""
-        return self._tool_decorator(ToolKind.CREATOR, func, name=name, description=description)
+        return self._tool_decorator(
+            ToolKind.CREATOR,
+            func,
+            name=name,
+            description=description,
+            concurrency=concurrency,
+        )
 
     @overload
     def update(self, func: F) -> FunctionTool: ...  # type: ignore[reportInvalidTypeVarUse]
@@ -501,6 +777,7 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> Callable[[F], FunctionTool]: ...  # type: ignore[reportInvalidTypeVarUse]
 
     def update(
@@ -509,9 +786,16 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> FunctionTool | Callable[[F], FunctionTool]:
         """Register an update operation."""
-        return self._tool_decorator(ToolKind.UPDATER, func, name=name, description=description)
+        return self._tool_decorator(
+            ToolKind.UPDATER,
+            func,
+            name=name,
+            description=description,
+            concurrency=concurrency,
+        )
 
     @overload
     def delete(self, func: F) -> FunctionTool: ...  # type: ignore[reportInvalidTypeVarUse]
@@ -523,6 +807,7 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> Callable[[F], FunctionTool]: ...  # type: ignore[reportInvalidTypeVarUse]
 
     def delete(
@@ -531,9 +816,16 @@ class EnrichMCP:
         *,
         name: str | None = None,
         description: str | None = None,
+        concurrency: ConcurrencyLimit | None = None,
     ) -> FunctionTool | Callable[[F], FunctionTool]:
         """Register a delete operation."""
-        return self._tool_decorator(ToolKind.DELETER, func, name=name, description=description)
+        return self._tool_decorator(
+            ToolKind.DELETER,
+            func,
+            name=name,
+            description=description,
+            concurrency=concurrency,
+        )
 
     # ------------------------------------------------------------------
     # Direct FastMCP tool wrapper
@@ -578,11 +870,49 @@ class EnrichMCP:
                 "Use dependency injection instead: add 'ctx: Context' parameter to your function.",
             ) from e
 
+    async def gather(
+        self,
+        aws: Iterable[Awaitable[Any]],
+        *,
+        limit: int | None = None,
+        timeout: float | None = None,
+    ) -> list[Any]:
+        """Await ``aws`` concurrently using the app's fan-out limit.
+
+        This is a thin wrapper around :func:`enrichmcp.concurrency.gather_bounded`
+        that defaults ``limit`` to ``fanout_limit``. The limit applies to each
+        call separately: concurrent tool calls that each gather get their own
+        ``limit`` slots, so nested gathers cannot deadlock on a shared pool.
+        Use ``concurrency=`` limits on tools to cap the app as a whole.
+        """
+        return await gather_bounded(
+            aws,
+            limit=limit if limit is not None else self.fanout_limit,
+            timeout=timeout,
+        )
+
+    def http_app(self, *, compression: "bool | Compression" = False, **options: Any) -> Any:
+        """Return the Starlette app serving this server over HTTP.
+
+        Use it to run the server under an external ASGI server. ``options``
+        are forwarded to ``FastMCP.http_app``; ``compression`` compresses
+        responses as with :meth:`run`.
+        """
+        from .compression import compression_middleware
+
+        options["middleware"] = [
+            *compression_middleware(compression),
+            *(options.get("middleware") or []),
+        ]
+        return self.mcp.http_app(**options)
+
     def run(
         self,
         *,
         transport: str | None = None,
         mount_path: str | None = None,
+        compression: "bool | Compression" = False,
+        workers: int = 1,
         **options: Any,
     ) -> Any:
         """Start the MCP server.
@@ -592,15 +922,28 @@ class EnrichMCP:
                 Supported values are "stdio", "sse", and "streamable-http".
                 If not provided, the default from ``FastMCP`` is used.
             mount_path: Optional mount path for SSE transport.
+            compression: Compress HTTP responses with zstd, Brotli or gzip as
+                negotiated with the client; pass a
+                :class:`~enrichmcp.compression.Compression` to configure the
+                encodings and minimum size. Requires an HTTP transport.
+            workers: Number of pre-forked worker processes serving the
+                streamable HTTP transport; see :mod:`enrichmcp.workers`.
             **options: Additional options forwarded to ``FastMCP.run``.
 
         Returns:
             Result from FastMCP.run()
 
         Raises:
-            ValueError: If any relationships are missing resolvers
+            ValueError: If any relationships are missing resolvers, or
+                compression is requested for the stdio transport, or
+                workers for a transport other than streamable HTTP
 
         """
+        if compression and transport in (None, "stdio"):
+            raise ValueError("compression requires an HTTP transport")
+        if workers > 1 and transport not in ("http", "streamable-http"):
+            raise ValueError("workers require the streamable-http transport")
+
         # Check that all relationships have resolvers
         unresolved: list[str] = []
         for entity_name, entity_cls in self.entities.items():
@@ -619,11 +962,27 @@ class EnrichMCP:
         for entity_cls in self.entities.values():
             entity_cls.model_rebuild()
 
+        # Validate and apply the tool manifest before accepting requests
+        if self.manifest_path is not None:
+            self.register_pending_tools()
+
+        if workers > 1:
+            from .workers import serve_workers
+
+            return serve_workers(self, workers=workers, compression=compression, **options)
+
         # Forward transport options to FastMCP
         if transport is not None:
             options.setdefault("transport", transport)
         if mount_path is not None:
             options.setdefault("mount_path", mount_path)
+        if compression:
+            from .compression import compression_middleware
+
+            options["middleware"] = [
+                *compression_middleware(compression),
+                *(options.get("middleware") or []),
+            ]
 
         # Run the MCP server
         return self.mcp.run(**options)
@@ -12,14 +12,11 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from enrichmcp.tracing import start_span
+
 if TYPE_CHECKING:  # pragma: no cover - used for type hints
     from collections.abc import Callable
 
-try:
-    import redis.asyncio as redis  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    redis = None  # type: ignore
-
 
 class CacheBackend(ABC):
     """Abstract cache backend interface."""
@@ -95,8 +92,10 @@ class RedisCache(CacheBackend):
         if redis_client is not None:
             self._redis = redis_client
             return
-        if redis is None:  # pragma: no cover - optional dependency
-            raise ImportError("redis package is required for RedisCache")
+        try:
+            import redis.asyncio as redis  # type: ignore
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("redis package is required for RedisCache") from exc
         self._redis = redis.from_url(url)
 
     async def get(self, namespace: str, key: str) -> Any | None:
@@ -184,9 +183,13 @@ class ContextCache:
         ttl: int | None = None,
     ) -> Any:
         """Return cached ``key`` or compute and store it using ``factory``."""
-        cached = await self.get(key, scope)
-        if cached is not None:
-            return cached
-        value = await factory()
-        await self.set(key, value, scope, ttl)
-        return value
+        attributes = {"enrichmcp.cache.key": key, "enrichmcp.cache.scope": scope}
+        with start_span("enrichmcp.cache.get_or_set", attributes) as span:
+            cached = await self.get(key, scope)
+            if span is not None:
+                span.set_attribute("enrichmcp.cache.hit", cached is not None)
+            if cached is not None:
+                return cached
+            value = await factory()
+            await self.set(key, value, scope, ttl)
+            return value
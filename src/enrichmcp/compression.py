@@ -0,0 +1,258 @@
+"""Response compression for HTTP transports.
+
+:class:`CompressionMiddleware` is a pure ASGI middleware that compresses
+responses with the best encoding both sides support, chosen from the
+client's ``Accept-Encoding`` (honoring ``q`` values) and the server's
+preference order: zstd (needs ``zstandard``), Brotli (needs ``brotli``) and
+gzip. Complete responses smaller than ``minimum_size`` are sent as is.
+Streamed responses, including the Server-Sent Events used by the
+``streamable-http`` and ``sse`` transports, are compressed chunk by chunk and
+flushed after every chunk so events are not held back.
+
+Enable it with ``app.run(transport="streamable-http", compression=True)`` or
+``app.http_app(compression=Compression(...))``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Types that are already compressed are left alone
+_SKIPPED_TYPES = ("image/", "audio/", "video/", "application/zip", "application/gzip")
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+# content-coding -> (encoder, module it needs)
+_ENCODERS: dict[str, tuple[Callable[[int], _Encoder], str | None]] = {
+    "zstd": (_ZstdEncoder, "zstandard"),
+    "br": (_BrotliEncoder, "brotli"),
+    "gzip": (_GzipEncoder, None),
+}
+
+
+def _installed(module: str | None) -> bool:
+    if module is None:
+        return True
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        return False
+    return True
+
+
+def available_encodings() -> list[str]:
+    """Return the supported content-codings whose libraries are installed."""
+    return [name for name, (_, module) in _ENCODERS.items() if _installed(module)]
+
+
+@dataclass(frozen=True)
+class Compression:
+    """Settings for :class:`CompressionMiddleware`.
+
+    ``encodings`` lists the content-codings to offer in order of preference;
+    by default every installed one from :func:`available_encodings`.
+    ``minimum_size`` is the smallest complete response body, in bytes, worth
+    compressing. ``levels`` overrides the compression level per coding.
+    """
+
+    encodings: Sequence[str] | None = None
+    minimum_size: int = DEFAULT_MINIMUM_SIZE
+    levels: dict[str, int] | None = None
+
+    def resolved_encodings(self) -> list[str]:
+        if self.encodings is None:
+            return available_encodings()
+        for name in self.encodings:
+            if name not in _ENCODERS:
+                raise ValueError(f"Unsupported content-coding {name!r}")
+            module = _ENCODERS[name][1]
+            if not _installed(module):
+                raise ImportError(f"{module} is required for {name} compression")
+        return list(self.encodings)
+
+    def level(self, name: str) -> int:
+        defaults = {"gzip": 6, "zstd": 3, "br": 4}
+        return (self.levels or {}).get(name, defaults[name])
+
+
+def negotiate(accept_encoding: str, offered: Sequence[str]) -> str | None:
+    """Return the first of ``offered`` that ``accept_encoding`` allows."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    for name in offered:
+        if weights.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses as configured by :class:`Compression`."""
+
+    def __init__(self, app: ASGIApp, config: Compression | None = None) -> None:
+        self.app = app
+        self.config = config or Compression()
+        self.encodings = self.config.resolved_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        encoding = negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding, self.config)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Wraps ``send`` for one response."""
+
+    def __init__(self, send: Send, encoding: str, config: Compression) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._config = config
+        self._start: Message | None = None
+        self._encoder: _Encoder | None = None
+        self._passthrough = False
+
+    def _new_encoder(self) -> _Encoder:
+        factory = _ENCODERS[self._encoding][0]
+        return factory(self._config.level(self._encoding))
+
+    def _vary_headers(self, start: Message) -> list[tuple[bytes, bytes]]:
+        """Return the headers of ``start`` with ``Accept-Encoding`` added to ``Vary``."""
+        headers = [
+            (key, value) for key, value in start.get("headers", []) if key.lower() != b"vary"
+        ]
+        vary = [value for key, value in start.get("headers", []) if key.lower() == b"vary"]
+        headers.append((b"vary", b", ".join([*vary, b"Accept-Encoding"])))
+        return headers
+
+    def _headers(self, start: Message, length: int | None) -> list[tuple[bytes, bytes]]:
+        headers = [
+            (key, value)
+            for key, value in self._vary_headers(start)
+            if key.lower() != b"content-length"
+        ]
+        headers.append((b"content-encoding", self._encoding.encode()))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode()))
+        return headers
+
+    def _compressible(self, start: Message) -> bool:
+        headers = {key.lower(): value for key, value in start.get("headers", [])}
+        if b"content-encoding" in headers or start["status"] in (204, 304):
+            return False
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        return not content_type.startswith(_SKIPPED_TYPES)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._compressible(message)
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        start = self._start
+        assert start is not None
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._encoder is None and not more_body:
+            # Complete response in one message
+            if len(body) < self._config.minimum_size:
+                # Caches must still key on Accept-Encoding for uncompressed bodies
+                await self._send({**start, "headers": self._vary_headers(start)})
+                await self._send(message)
+                return
+            encoder = self._new_encoder()
+            compressed = encoder.compress(body) + encoder.finish()
+            await self._send({**start, "headers": self._headers(start, len(compressed))})
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        if self._encoder is None:
+            self._encoder = self._new_encoder()
+            await self._send({**start, "headers": self._headers(start, None)})
+        chunk = self._encoder.compress(body) if body else b""
+        if not more_body:
+            chunk += self._encoder.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+def compression_middleware(compression: bool | Compression) -> list[Any]:
+    """Return the Starlette middleware list enabling ``compression``."""
+    if compression is False:
+        return []
+    from starlette.middleware import Middleware
+
+    config = Compression() if compression is True else compression
+    return [Middleware(CompressionMiddleware, config=config)]
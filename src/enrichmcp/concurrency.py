@@ -0,0 +1,67 @@
+"""Bounded concurrency helpers for resolver fan-out.
+
+Resolvers frequently need to fetch several independent objects, for example
+every product referenced by an order. :func:`gather_bounded` runs those
+fetches concurrently while capping how many are in flight at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover - used for type hints
+    from collections.abc import Awaitable, Iterable
+
+T = TypeVar("T")
+
+DEFAULT_FANOUT_LIMIT = 10
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    *,
+    limit: int = DEFAULT_FANOUT_LIMIT,
+    timeout: float | None = None,
+) -> list[T]:
+    """Await ``aws`` concurrently with at most ``limit`` running at once.
+
+    Results are returned in the same order as ``aws``. The first failure
+    cancels all outstanding work and is re-raised. ``timeout`` bounds the
+    whole batch and raises :class:`TimeoutError` when exceeded.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+
+    pending_aws = list(aws)
+    if not pending_aws:
+        return []
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(_run(aw)) for aw in pending_aws]
+    try:
+        async with asyncio.timeout(timeout):
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore[misc]
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        _close_unstarted(pending_aws)
+
+
+def _close_unstarted(aws: list[Any]) -> None:
+    """Close coroutines that were cancelled before they started running."""
+    for aw in aws:
+        if inspect.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+            aw.close()
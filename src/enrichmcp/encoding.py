@@ -0,0 +1,169 @@
+"""Compact encoding of tool results.
+
+By default tool results are serialized as full Pydantic JSON, repeating every
+field name for every item of a list. The ``compact`` encoding trades that for
+a smaller payload:
+
+- lists of models, and the items of ``PageResult``/``CursorResult``, become a
+  :class:`CompactResult` with ``columns`` and one row of values per item;
+  columns that are null or at their default in every row move to
+  ``constants``, and the pagination fields go to ``pagination``
+- a single model is dumped without the fields left at their default
+
+The encoding is chosen per app (``EnrichMCP(..., encoding=...)``), per tool
+(``@app.retrieve(encoding=...)``) or per request by sending
+``{"enrichmcp/encoding": "compact"}`` (or ``"json"``) in the request
+``_meta``. Only tools with an encoding set honor the request, since their
+output schema is widened to admit :class:`CompactResult`.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import types
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin, get_type_hints
+
+from pydantic import BaseModel, Field
+from pydantic_core import PydanticUndefined, to_jsonable_python
+
+from .pagination import CursorResult, PageResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+Encoding = Literal["json", "compact"]
+
+ENCODING_META_KEY = "enrichmcp/encoding"
+
+
+class CompactResult(BaseModel):
+    """Columnar encoding of a list of models."""
+
+    columns: list[str] = Field(description="Field names, in the order of each row")
+    rows: list[list[Any]] = Field(description="One list of values per item")
+    constants: dict[str, Any] | None = Field(
+        None,
+        description="Fields left out of rows because every item has this null or default value",
+    )
+    pagination: dict[str, Any] | None = Field(
+        None,
+        description="Pagination fields of the result, such as has_next or next_cursor",
+    )
+
+
+def _field_default(model: type[BaseModel], name: str) -> Any:
+    field = model.model_fields.get(name)
+    if field is None or field.default is PydanticUndefined:
+        return PydanticUndefined
+    return to_jsonable_python(field.default)
+
+
+def compact_items(items: list[BaseModel]) -> dict[str, Any]:
+    """Return ``items`` as the ``columns``/``rows``/``constants`` of a :class:`CompactResult`."""
+    dumped = [item.model_dump(mode="json") for item in items]
+    columns = list(dict.fromkeys(name for data in dumped for name in data))
+    constants: dict[str, Any] = {}
+    if dumped:
+        model = type(items[0])
+        for name in columns:
+            value = dumped[0].get(name)
+            if (value is None or value == _field_default(model, name)) and all(
+                data.get(name) == value for data in dumped
+            ):
+                constants[name] = value
+    columns = [name for name in columns if name not in constants]
+    encoded: dict[str, Any] = {
+        "columns": columns,
+        "rows": [[data.get(name) for name in columns] for data in dumped],
+    }
+    if constants:
+        encoded["constants"] = constants
+    return encoded
+
+
+def compact(result: Any) -> Any:
+    """Return the compact encoding of a tool ``result``.
+
+    Values other than models, lists of models and paginated results are
+    returned unchanged.
+    """
+    pagination = None
+    if isinstance(result, PageResult | CursorResult):
+        items = result.items
+        pagination = result.model_dump(mode="json", exclude={"items"}, exclude_none=True)
+    elif isinstance(result, list):
+        items = result
+    elif isinstance(result, BaseModel):
+        return result.model_dump(mode="json", exclude_defaults=True)
+    else:
+        return result
+    if not all(isinstance(item, BaseModel) for item in items):
+        return result
+    encoded = compact_items(items)
+    if pagination is not None:
+        encoded["pagination"] = pagination
+    return encoded
+
+
+def requested_encoding() -> Encoding | None:
+    """Return the encoding asked for in the current request's ``_meta``."""
+    from fastmcp.server.dependencies import get_context
+
+    try:
+        request_context = get_context().request_context
+    except RuntimeError:
+        return None
+    meta = request_context.meta if request_context is not None else None
+    if meta is None:
+        return None
+    value = (meta.model_extra or {}).get(ENCODING_META_KEY)
+    if value is None:
+        return None
+    if value not in get_args(Encoding):
+        raise ValueError(f"Unknown {ENCODING_META_KEY} {value!r}; use 'json' or 'compact'")
+    return value
+
+
+def _is_collection(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is list:
+        return True
+    if origin is Union or origin is types.UnionType:
+        return any(_is_collection(arg) for arg in get_args(annotation))
+    cls = origin or annotation
+    return isinstance(cls, type) and issubclass(cls, PageResult | CursorResult)
+
+
+def encode_results(fn: Callable[..., Any], encoding: Encoding) -> Callable[..., Any] | None:
+    """Wrap ``fn`` to return its result in ``encoding`` unless the request asks otherwise.
+
+    Returns ``None`` when the return annotation of ``fn`` cannot be resolved.
+    For lists and paginated results the return annotation is widened with
+    :class:`CompactResult`. Raises :class:`ValueError` for unknown encodings.
+    """
+    if encoding not in get_args(Encoding):
+        raise ValueError(f"Unknown encoding {encoding!r}; use 'json' or 'compact'")
+    try:
+        returns = get_type_hints(fn).get("return")
+    except Exception:
+        return None
+    if returns is None:
+        return None
+    if _is_collection(returns):
+        returns = returns | CompactResult
+
+    @functools.wraps(fn)
+    async def encoded(*args: Any, **kwargs: Any) -> Any:
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        if (requested_encoding() or encoding) == "compact":
+            return compact(result)
+        return result
+
+    encoded.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]
+        return_annotation=returns,
+    )
+    encoded.__annotations__ = {**fn.__annotations__, "return": returns}
+    return encoded
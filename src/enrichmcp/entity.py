@@ -7,7 +7,6 @@ from collections.abc import Callable
 from typing import Any, Literal, cast, get_args, get_origin
 
 import pydantic
-from packaging import version
 from pydantic import BaseModel, ConfigDict
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic.main import IncEx
@@ -113,7 +112,7 @@ class EnrichModel(BaseModel, metaclass=EnrichModelMeta):
     # Without this setting, Pydantic uses default serialization which may vary.
     # We conditionally apply this to maintain compatibility with older Pydantic versions
     # that don't recognize this parameter (like 2.11.x used by some dependencies).
-    if version.parse(pydantic.__version__) >= version.parse("2.12.0"):
+    if tuple(int(part) for part in pydantic.VERSION.split(".")[:2]) >= (2, 12):
         _config_dict["ser_json_temporal"] = "iso8601"
 
     model_config = ConfigDict(**_config_dict)
@@ -2,3 +2,33 @@
 
 Provides standard error classes for common scenarios.
 """
+
+from __future__ import annotations
+
+import json
+
+from fastmcp.exceptions import ToolError
+
+
+class ToolOverloadedError(ToolError):
+    """A tool call was rejected because the tool is at its concurrency limit.
+
+    The message is a JSON object with ``error``, ``tool``, ``retry_after``
+    (seconds) and ``message`` keys, so agents can tell it apart from other
+    failures and back off before calling the tool again. Being a
+    ``ToolError``, it is not masked by ``mask_error_details``.
+    """
+
+    def __init__(self, tool: str, retry_after: float) -> None:
+        self.tool = tool
+        self.retry_after = retry_after
+        super().__init__(
+            json.dumps(
+                {
+                    "error": "tool_overloaded",
+                    "tool": tool,
+                    "retry_after": retry_after,
+                    "message": f"Too many concurrent calls of {tool}; retry later",
+                }
+            )
+        )
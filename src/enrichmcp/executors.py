@@ -0,0 +1,196 @@
+"""Run CPU-bound tools in thread or process pools.
+
+Sync tools, and async tools that compute rather than await, run on the event
+loop and hold up every other concurrent call. Declaring a tool with
+``@app.retrieve(executor="thread")`` or ``executor="process"`` (or the same
+on ``Relationship.resolver``) runs it in one of the app's
+:class:`ExecutorPools` instead. Async tools run to completion on a private
+event loop inside the pool.
+
+Process pools pickle the call arguments and the result, so both must be
+picklable, and the tool must be defined at module level and must not take a
+``Context`` parameter. Child processes find the tool by its module and
+qualified name, importing the module when the pool does not fork.
+
+Pools are created when the app's lifespan starts and shut down when it
+exits, so each worker of :func:`~enrichmcp.workers.serve_workers` gets its
+own. With metrics enabled, the time a call waits for a free pool worker is
+recorded as ``queue_wait_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import inspect
+import sys
+import time
+from concurrent.futures import Executor as PoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+Executor = Literal["thread", "process"]
+
+# Tools offloaded to process pools by "module:qualname"
+_TARGETS: dict[str, Callable[..., Any]] = {}
+
+
+def _target_key(fn: Callable[..., Any]) -> str:
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+def _resolve(key: str) -> Callable[..., Any]:
+    fn = _TARGETS.get(key)
+    if fn is not None:
+        return fn
+    module, _, qualname = key.partition(":")
+    # Spawned children import the main script as __mp_main__
+    if module == "__main__" and "__mp_main__" in sys.modules:
+        module = "__mp_main__"
+    importlib.import_module(module)
+    fn = _TARGETS.get(f"{module}:{qualname}")
+    if fn is None:
+        raise LookupError(f"Tool function {key} is not defined at module level")
+    return fn
+
+
+def _call(
+    fn: Callable[..., Any] | str,
+    submitted: float,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[float, Any]:
+    """Run ``fn`` in a pool worker and return its queue wait and result."""
+    waited = time.monotonic() - submitted
+    if isinstance(fn, str):
+        fn = _resolve(fn)
+    if inspect.iscoroutinefunction(fn):
+        return waited, asyncio.run(fn(*args, **kwargs))
+    return waited, fn(*args, **kwargs)
+
+
+class ExecutorPools:
+    """The thread and process pools running tools declared with ``executor=``.
+
+    ``max_threads`` and ``max_processes`` size the pools (``None`` uses the
+    :mod:`concurrent.futures` defaults) and ``mp_context`` names the
+    :mod:`multiprocessing` start method of the process pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int | None = None,
+        max_processes: int | None = None,
+        mp_context: str | None = None,
+    ) -> None:
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.mp_context = mp_context
+        self._pools: dict[Executor, PoolExecutor] = {}
+
+    def pool(self, executor: Executor) -> PoolExecutor:
+        """Return the pool for ``executor``, creating it if needed."""
+        pool = self._pools.get(executor)
+        if pool is not None:
+            return pool
+        if executor == "thread":
+            pool = ThreadPoolExecutor(self.max_threads, thread_name_prefix="enrichmcp")
+        elif executor == "process":
+            # Imported here so apps without process tools skip multiprocessing
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            context = multiprocessing.get_context(self.mp_context)
+            pool = ProcessPoolExecutor(self.max_processes, mp_context=context)
+        else:
+            raise ValueError(f"Unknown executor {executor!r}; use 'thread' or 'process'")
+        self._pools[executor] = pool
+        return pool
+
+    def start(self, executors: Iterable[Executor]) -> None:
+        """Create the pools for ``executors`` ahead of the first call."""
+        for executor in executors:
+            self.pool(executor)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut every pool down, cancelling calls that have not started."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    @asynccontextmanager
+    async def running(self, executors: Iterable[Executor]) -> AsyncIterator[None]:
+        """Keep the pools for ``executors`` open for the duration of the block."""
+        self.start(executors)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self.shutdown)
+
+    async def run(
+        self,
+        executor: Executor,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        on_wait: Callable[[float], None] | None = None,
+    ) -> Any:
+        """Call ``fn`` in the ``executor`` pool and return its result.
+
+        ``on_wait`` receives the seconds the call spent queued for a pool
+        worker once it completes.
+        """
+        target: Callable[..., Any] | str = fn
+        if executor == "process":
+            target = _target_key(fn)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(_call, target, time.monotonic(), args, kwargs)
+        if executor == "thread":
+            # Keep contextvars such as the current request visible in the thread
+            call = functools.partial(contextvars.copy_context().run, call)
+        waited, result = await loop.run_in_executor(self.pool(executor), call)
+        if on_wait is not None:
+            on_wait(waited)
+        return result
+
+
+def offload(
+    fn: Callable[..., Any],
+    pools: ExecutorPools,
+    executor: Executor,
+    *,
+    on_wait: Callable[[float], None] | None = None,
+) -> Callable[..., Any]:
+    """Wrap ``fn`` in an async function that runs it in the ``executor`` pool.
+
+    The wrapper keeps the signature of ``fn``. Raises :class:`ValueError`
+    for unknown executors and for process-pool tools that take a
+    ``Context`` parameter or are not defined at module level.
+    """
+    if executor not in get_args(Executor):
+        raise ValueError(f"Unknown executor {executor!r}; use 'thread' or 'process'")
+    if executor == "process":
+        from fastmcp.server.context import Context
+        from fastmcp.utilities.types import find_kwarg_by_type
+
+        if find_kwarg_by_type(fn, kwarg_type=Context):
+            raise ValueError(f"Tool {fn.__name__} takes a Context and cannot run in a process")
+        if "<locals>" in fn.__qualname__:
+            raise ValueError(
+                f"Tool {fn.__name__} must be defined at module level to run in a process"
+            )
+        _TARGETS[_target_key(fn)] = fn
+
+    @functools.wraps(fn)
+    async def offloaded(*args: Any, **kwargs: Any) -> Any:
+        return await pools.run(executor, fn, args, kwargs, on_wait=on_wait)
+
+    return offloaded
@@ -0,0 +1,10 @@
+"""HTTP API gateway integration for EnrichMCP.
+
+This module maps entities and relationships onto REST endpoints and provides a
+pooled, caching HTTP client shared through the app lifespan.
+"""
+
+from .client import GatewayClient, parse_cache_control
+from .gateway import EndpointMapping, HTTPGateway
+
+__all__ = ["EndpointMapping", "GatewayClient", "HTTPGateway", "parse_cache_control"]
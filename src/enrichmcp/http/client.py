@@ -0,0 +1,191 @@
+"""Pooled HTTP client used by the gateway integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from enrichmcp.concurrency import DEFAULT_FANOUT_LIMIT, gather_bounded
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from enrichmcp.cache import CacheBackend
+
+# How long entries with a validator (ETag) are kept for revalidation after
+# they stop being fresh.
+DEFAULT_REVALIDATE_TTL = 300
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a ``Cache-Control`` header into a directive mapping."""
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+
+def _max_age(directives: Mapping[str, str | None]) -> int:
+    """Return the freshness lifetime in seconds described by ``directives``."""
+    if "no-cache" in directives:
+        return 0
+    for name in ("s-maxage", "max-age"):
+        raw = directives.get(name)
+        if raw is not None:
+            try:
+                return max(int(raw), 0)
+            except ValueError:
+                return 0
+    return 0
+
+
+class GatewayClient:
+    """Shared ``httpx.AsyncClient`` with response caching and request coalescing.
+
+    ``GET`` requests for the same URL that are in flight at the same time are
+    coalesced into a single backend call. Responses are cached in a
+    :class:`~enrichmcp.cache.CacheBackend` according to their ``Cache-Control``
+    header, and entries carrying an ``ETag`` are revalidated with
+    ``If-None-Match`` once they go stale.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        cache_backend: CacheBackend | None = None,
+        namespace: str = "enrichmcp:http",
+        revalidate_ttl: int = DEFAULT_REVALIDATE_TTL,
+        fanout_limit: int = DEFAULT_FANOUT_LIMIT,
+        max_batch_size: int = 100,
+    ) -> None:
+        self.client = client
+        self.cache_backend = cache_backend
+        self.namespace = namespace
+        self.revalidate_ttl = revalidate_ttl
+        self.fanout_limit = fanout_limit
+        self.max_batch_size = max_batch_size
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def get_json(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        allow_missing: bool = False,
+    ) -> Any:
+        """Return the decoded JSON body for ``GET path``.
+
+        When ``allow_missing`` is true a ``404`` response yields ``None``
+        instead of raising :class:`httpx.HTTPStatusError`.
+        """
+        request = self.client.build_request("GET", path, params=_clean_params(params))
+        key = str(request.url)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        try:
+            return await asyncio.shield(task)
+        except httpx.HTTPStatusError as exc:
+            if allow_missing and exc.response.status_code == 404:
+                return None
+            raise
+
+    async def get_many(
+        self,
+        path: str,
+        ids: Iterable[Any],
+        *,
+        batch_param: str | None = None,
+        id_field: str = "id",
+    ) -> list[Any]:
+        """Fetch the objects identified by ``ids`` below ``path``.
+
+        With ``batch_param`` the IDs are sent in chunks as
+        ``GET path?{batch_param}=1,2,3``. Otherwise each object is fetched from
+        ``path/{id}`` concurrently. Results follow the order of ``ids`` and
+        missing objects are skipped.
+        """
+        wanted = list(dict.fromkeys(ids))
+        if not wanted:
+            return []
+
+        if batch_param is None:
+            items = await gather_bounded(
+                (self.get_json(f"{path.rstrip('/')}/{i}", allow_missing=True) for i in wanted),
+                limit=self.fanout_limit,
+            )
+            return [item for item in items if item is not None]
+
+        chunks = [
+            wanted[i : i + self.max_batch_size] for i in range(0, len(wanted), self.max_batch_size)
+        ]
+        pages = await gather_bounded(
+            (
+                self.get_json(path, {batch_param: ",".join(str(i) for i in chunk)})
+                for chunk in chunks
+            ),
+            limit=self.fanout_limit,
+        )
+        by_id = {str(item[id_field]): item for page in pages for item in page}
+        return [by_id[str(i)] for i in wanted if str(i) in by_id]
+
+    def _finish(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a completed in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter went away.
+            task.exception()
+
+    async def _fetch(self, key: str, request: httpx.Request) -> Any:
+        """Perform ``request`` honouring cached freshness and validators."""
+        entry = await self.cache_backend.get(self.namespace, key) if self.cache_backend else None
+        if entry is not None:
+            if entry["expires"] > time.time():
+                return entry["body"]
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+
+        response = await self.client.send(request)
+        if response.status_code == 304 and entry is not None:
+            await self._store(key, response, entry["body"], entry.get("etag"))
+            return entry["body"]
+
+        response.raise_for_status()
+        body = response.json()
+        await self._store(key, response, body, response.headers.get("ETag"))
+        return body
+
+    async def _store(self, key: str, response: httpx.Response, body: Any, etag: str | None) -> None:
+        """Cache ``body`` if the response headers allow it."""
+        if self.cache_backend is None:
+            return
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives or "private" in directives:
+            await self.cache_backend.delete(self.namespace, key)
+            return
+        max_age = _max_age(directives)
+        if max_age == 0 and not etag:
+            return
+        entry = {"body": body, "etag": etag, "expires": time.time() + max_age}
+        ttl = max_age + (self.revalidate_ttl if etag else 0)
+        await self.cache_backend.set(self.namespace, key, entry, ttl=ttl)
+
+
+def _clean_params(params: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    """Drop ``None`` values and sort keys so equal queries share a cache key."""
+    if not params:
+        return None
+    return {k: params[k] for k in sorted(params) if params[k] is not None}
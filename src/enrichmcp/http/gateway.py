@@ -0,0 +1,361 @@
+"""Declarative mapping of entities and relationships onto REST endpoints."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, get_args, get_origin
+
+import httpx
+from fastmcp import Context
+
+from enrichmcp.cache import MemoryCache
+from enrichmcp.concurrency import DEFAULT_FANOUT_LIMIT
+from enrichmcp.context import get_enrich_context
+from enrichmcp.tool import make_tool_function
+
+from .client import DEFAULT_REVALIDATE_TTL, GatewayClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from enrichmcp import EnrichMCP
+    from enrichmcp.relationship import Relationship
+
+
+@dataclass
+class EndpointMapping:
+    """REST endpoints backing a single entity."""
+
+    entity: type
+    path: str
+    id_field: str = "id"
+    batch_param: str | None = None
+    list_params: dict[str, type] = field(default_factory=dict)
+
+    @property
+    def id_type(self) -> Any:
+        """Return the type of the entity's ID field, ``int`` when it is not a field."""
+        id_field = self.entity.model_fields.get(self.id_field)
+        return id_field.annotation if id_field is not None and id_field.annotation else int
+
+    def item_path(self, entity_id: Any) -> str:
+        """Return the path of a single object."""
+        return f"{self.path.rstrip('/')}/{entity_id}"
+
+    def to_entity(self, data: Any) -> Any:
+        """Convert a decoded JSON object into the mapped entity."""
+        return self.entity.model_validate(data)
+
+
+class HTTPGateway:
+    """Expose a REST backend through generated EnrichMCP tools.
+
+    The gateway owns a pooled :class:`httpx.AsyncClient` created by
+    :meth:`lifespan` and shared by every generated tool through the lifespan
+    context. Pass ``gateway.lifespan`` to :class:`~enrichmcp.EnrichMCP` and then
+    describe how entities and relationships map onto endpoints::
+
+        gateway = HTTPGateway("http://localhost:8001")
+        app = EnrichMCP("Shop", "Shop gateway", lifespan=gateway.lifespan)
+        ...
+        gateway.entity(User, path="/users")
+        gateway.relationship(
+            User.orders, path="/orders", params={"user_id": "{id}"}
+        )
+        gateway.relationship(Order.products, via="product_ids")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        client_key: str = "http_client",
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        headers: dict[str, str] | None = None,
+        cache_responses: bool = True,
+        revalidate_ttl: int = DEFAULT_REVALIDATE_TTL,
+        max_batch_size: int = 100,
+        client_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        self.base_url = base_url
+        self.client_key = client_key
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.headers = headers or {}
+        self.cache_responses = cache_responses
+        self.revalidate_ttl = revalidate_ttl
+        self.max_batch_size = max_batch_size
+        self.client_kwargs = client_kwargs or {}
+        self.mappings: dict[str, EndpointMapping] = {}
+        self._app: EnrichMCP | None = None
+
+    @asynccontextmanager
+    async def lifespan(self, app: EnrichMCP) -> AsyncIterator[dict[str, Any]]:
+        """Open the shared client pool for the lifetime of the server."""
+        # FastMCP passes its own server object to lifespans, so fall back to the
+        # EnrichMCP app recorded when the first entity was mapped.
+        owner = app if hasattr(app, "cache_backend") else self._app
+        cache_backend = None
+        if self.cache_responses:
+            cache_backend = owner.cache_backend if owner is not None else MemoryCache()
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            headers=self.headers,
+            **self.client_kwargs,
+        ) as client:
+            yield {
+                self.client_key: GatewayClient(
+                    client,
+                    cache_backend=cache_backend,
+                    namespace=f"enrichmcp:http:{owner._cache_id if owner else 'default'}",
+                    revalidate_ttl=self.revalidate_ttl,
+                    fanout_limit=owner.fanout_limit if owner else DEFAULT_FANOUT_LIMIT,
+                    max_batch_size=self.max_batch_size,
+                ),
+            }
+
+    def entity(
+        self,
+        entity_cls: type,
+        *,
+        path: str,
+        id_field: str = "id",
+        batch_param: str | None = None,
+        list_params: dict[str, type] | None = None,
+        list_tool: bool = True,
+    ) -> EndpointMapping:
+        """Map ``entity_cls`` onto ``path`` and register its tools.
+
+        ``get_<entity>`` fetches ``path/{id}`` and ``get_<entity>s_by_ids``
+        fetches many objects at once, using ``?{batch_param}=1,2,3`` when the
+        backend supports it. Unless ``list_tool`` is false ``list_<entity>s``
+        fetches ``path`` and forwards the optional ``list_params`` as query
+        parameters.
+        """
+        app = getattr(entity_cls, "_app", None)
+        if app is None:
+            raise ValueError(f"{entity_cls.__name__} must be registered with @app.entity first")
+
+        self._app = app
+        mapping = EndpointMapping(
+            entity=entity_cls,
+            path=path,
+            id_field=id_field,
+            batch_param=batch_param,
+            list_params=dict(list_params or {}),
+        )
+        self.mappings[entity_cls.__name__] = mapping
+        _register_entity_tools(app, mapping, self.client_key, list_tool=list_tool)
+        return mapping
+
+    def relationship(
+        self,
+        relationship: Relationship,
+        *,
+        path: str | None = None,
+        params: dict[str, Any] | None = None,
+        via: str | None = None,
+    ) -> None:
+        """Register a resolver for ``relationship`` backed by HTTP calls.
+
+        Either give ``path`` (and optional query ``params``) of an endpoint
+        returning the related data, formatted with ``{id}`` as the parent ID,
+        or ``via``: the key on the parent's JSON object holding the related
+        ID or list of IDs. ``via`` requires both entities to be mapped with
+        :meth:`entity` and batches lookups of ID lists.
+        """
+        if (path is None) == (via is None):
+            raise ValueError("Provide exactly one of 'path' or 'via'")
+        owner = relationship.owner_cls
+        if owner is None or owner.__name__ not in self.mappings:
+            raise ValueError("The relationship's owner entity must be mapped with entity() first")
+
+        target, many = _relationship_target(relationship)
+        owner_mapping = self.mappings[owner.__name__]
+        target_mapping = self.mappings.get(target.__name__)
+        if via is not None and target_mapping is None:
+            raise ValueError(f"{target.__name__} must be mapped with entity() to use 'via'")
+
+        field_name = relationship.field_name or "field"
+        param = f"{owner.__name__.lower()}_id"
+        client_key = self.client_key
+        query = dict(params or {})
+
+        async def fetch(parent_id: Any, ctx: Context) -> Any:
+            client = _client(ctx, client_key)
+            if path is not None:
+                data = await client.get_json(
+                    path.format(id=parent_id),
+                    {
+                        k: v.format(id=parent_id) if isinstance(v, str) else v
+                        for k, v in query.items()
+                    },
+                    allow_missing=True,
+                )
+                if data is None:
+                    return [] if many else None
+                if many:
+                    return [target.model_validate(item) for item in data]
+                return target.model_validate(data)
+
+            assert target_mapping is not None
+            parent = await client.get_json(owner_mapping.item_path(parent_id), allow_missing=True)
+            value = parent.get(via) if parent else None
+            if isinstance(value, list):
+                items = await client.get_many(
+                    target_mapping.path,
+                    value,
+                    batch_param=target_mapping.batch_param,
+                    id_field=target_mapping.id_field,
+                )
+                return [target_mapping.to_entity(item) for item in items]
+            if value is None:
+                return [] if many else None
+            data = await client.get_json(target_mapping.item_path(value), allow_missing=True)
+            return target_mapping.to_entity(data) if data is not None else None
+
+        async def resolve(parent_id: Any, ctx: Context | None) -> Any:
+            if ctx is None:
+                ctx = get_enrich_context()
+            return await fetch(parent_id, ctx)
+
+        resolver = make_tool_function(
+            resolve,
+            name=f"get_{owner.__name__.lower()}_{field_name}",
+            parameters=[(param, owner_mapping.id_type), ("ctx", Context | None, None)],
+            returns=list[target] if many else target | None,
+            doc=(
+                f"Fetches the '{field_name}' for a '{owner.__name__}'. "
+                f"Provide ID of parent '{owner.__name__}' via param key '{param}'."
+            ),
+        )
+        relationship.resolver(name="get")(resolver)
+
+
+def _client(ctx: Context, client_key: str) -> GatewayClient:
+    """Return the gateway client opened by the lifespan of the current request."""
+    if ctx.request_context is None:
+        raise RuntimeError("No request context available; HTTPGateway tools need an MCP request")
+    return ctx.request_context.lifespan_context[client_key]
+
+
+def _relationship_target(relationship: Relationship) -> tuple[type, bool]:
+    """Return the target entity class and whether the relationship is a list."""
+    annotation = relationship.target_type or getattr(relationship, "_annotation", None)
+    if isinstance(annotation, str):
+        # Postponed annotations such as "list[Order]" are resolved by name.
+        name = annotation.replace(" ", "")
+        many = name.startswith("list[") and name.endswith("]")
+        name = (name[5:-1] if many else name).strip("'\"")
+        entities = getattr(relationship.app, "entities", {})
+        if name not in entities:
+            raise ValueError(f"Unknown relationship target '{annotation}'")
+        return entities[name], many
+
+    many = get_origin(annotation) is list
+    if many:
+        annotation = get_args(annotation)[0]
+    if isinstance(annotation, str):
+        entities = getattr(relationship.app, "entities", {})
+        if annotation not in entities:
+            raise ValueError(f"Unknown relationship target '{annotation}'")
+        annotation = entities[annotation]
+    if not isinstance(annotation, type):
+        raise TypeError(f"Unsupported relationship type {relationship.target_type!r}")
+    return annotation, many
+
+
+def _register_entity_tools(
+    app: EnrichMCP,
+    mapping: EndpointMapping,
+    client_key: str,
+    *,
+    list_tool: bool,
+) -> None:
+    """Register ``get``, ``by_ids`` and ``list`` tools for ``mapping``."""
+    entity_cls = mapping.entity
+    model_name = entity_cls.__name__.lower()
+    param_name = f"{model_name}_id"
+
+    async def fetch_one(entity_id: Any, ctx: Context) -> Any:
+        client = _client(ctx, client_key)
+        data = await client.get_json(mapping.item_path(entity_id), allow_missing=True)
+        return mapping.to_entity(data) if data is not None else None
+
+    async def fetch_many(ids: list[Any], ctx: Context) -> list[Any]:
+        client = _client(ctx, client_key)
+        items = await client.get_many(
+            mapping.path,
+            ids,
+            batch_param=mapping.batch_param,
+            id_field=mapping.id_field,
+        )
+        return [mapping.to_entity(item) for item in items]
+
+    async def fetch_list(params: dict[str, Any], ctx: Context) -> list[Any]:
+        client = _client(ctx, client_key)
+        data = await client.get_json(mapping.path, params)
+        return [mapping.to_entity(item) for item in data]
+
+    async def get_one(entity_id: Any, ctx: Context | None) -> Any:
+        return await fetch_one(entity_id, ctx or get_enrich_context())
+
+    async def get_many(ids: list[Any], ctx: Context | None) -> list[Any]:
+        return await fetch_many(ids, ctx or get_enrich_context())
+
+    async def list_all(*args: Any) -> list[Any]:
+        *values, ctx = args
+        params = dict(zip(mapping.list_params, values, strict=True))
+        return await fetch_list(params, ctx or get_enrich_context())
+
+    get_name = f"get_{model_name}"
+    by_ids_name = f"get_{model_name}s_by_ids"
+    list_name = f"list_{model_name}s"
+    id_type = mapping.id_type
+    ctx_param = ("ctx", Context | None, None)
+
+    tools = {
+        get_name: make_tool_function(
+            get_one,
+            name=get_name,
+            parameters=[(param_name, id_type), ctx_param],
+            returns=entity_cls | None,
+        ),
+        by_ids_name: make_tool_function(
+            get_many,
+            name=by_ids_name,
+            parameters=[("ids", list[id_type]), ctx_param],  # type: ignore[valid-type]
+            returns=list[entity_cls],  # type: ignore[valid-type]
+        ),
+        list_name: make_tool_function(
+            list_all,
+            name=list_name,
+            parameters=[
+                *((name, tp | None, None) for name, tp in mapping.list_params.items()),
+                ctx_param,
+            ],
+            returns=list[entity_cls],  # type: ignore[valid-type]
+        ),
+    }
+
+    name = entity_cls.__name__
+    app.retrieve(name=get_name, description=f"Get a single {name} by ID")(tools[get_name])
+    app.retrieve(
+        name=by_ids_name,
+        description=f"Get several {name} records by ID in one call",
+    )(tools[by_ids_name])
+    if list_tool:
+        app.retrieve(name=list_name, description=f"List {name} records")(tools[list_name])
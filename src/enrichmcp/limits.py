@@ -0,0 +1,152 @@
+"""Result size limits for list-returning tools.
+
+Tools annotated as returning ``list[T]`` can be capped by item count and
+serialized size with :class:`ResultLimits`, set for the whole app
+(``EnrichMCP(..., result_limits=...)``) or per tool
+(``@app.retrieve(limits=...)``). A result within the limits is returned
+unchanged; an oversized one is cut to the first page and returned as a
+:class:`~enrichmcp.pagination.CursorResult`, with the remainder kept in a
+:class:`ResultStore` for ``ttl`` seconds. Agents fetch further pages by
+passing ``next_cursor`` to the ``next_result_page`` tool.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, get_args, get_origin, get_type_hints
+from uuid import uuid4
+
+from pydantic_core import from_json, to_json
+
+from .pagination import CursorResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .cache import CacheBackend
+
+CONTINUATION_TOOL = "next_result_page"
+
+
+@dataclass(frozen=True)
+class ResultLimits:
+    """Limits on the size of a single tool result.
+
+    ``max_items`` caps the number of list items and ``max_bytes`` their
+    serialized JSON size; ``None`` leaves that dimension unlimited. The
+    first page always holds at least one item. ``ttl`` is how long, in
+    seconds, the remainder of a truncated result can be fetched.
+    """
+
+    max_items: int | None = None
+    max_bytes: int | None = None
+    ttl: int = 300
+
+    def __post_init__(self) -> None:
+        if self.max_items is not None and self.max_items < 1:
+            raise ValueError("max_items must be >= 1")
+        if self.max_bytes is not None and self.max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+    def page_length(self, items: list[Any]) -> int:
+        """Return how many leading ``items`` fit within the limits."""
+        count = len(items) if self.max_items is None else min(len(items), self.max_items)
+        if self.max_bytes is None:
+            return count
+        size = 0
+        for index, item in enumerate(items[:count]):
+            # Items are joined by commas inside the JSON array
+            size += len(to_json(item)) + 1
+            if size > self.max_bytes:
+                return max(index, 1)
+        return count
+
+
+class ResultStore:
+    """Holds the remainder of truncated results until they expire.
+
+    Entries live in ``backend`` (the app's cache backend by default) under
+    ``namespace``; each page fetched hands out a fresh cursor for the next.
+    The remainder is stored as JSON, so backends that pickle values such as
+    :class:`~enrichmcp.cache.RedisCache` work with any item type, including
+    the generated SQLAlchemy entities, and later pages hold plain JSON items.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str) -> None:
+        self.backend = backend
+        self.namespace = namespace
+
+    async def paginate(self, items: list[Any], limits: ResultLimits) -> list[Any] | CursorResult:
+        """Return ``items`` unchanged, or their first page if they exceed ``limits``."""
+        length = limits.page_length(items)
+        if length >= len(items):
+            return items
+        return await self._page(items, length, limits)
+
+    async def next_page(self, cursor: str) -> CursorResult:
+        """Return the page stored under ``cursor``."""
+        entry = await self.backend.get(self.namespace, cursor)
+        if entry is None:
+            raise ValueError(
+                "Unknown or expired result cursor; call the original tool again",
+            )
+        await self.backend.delete(self.namespace, cursor)
+        items = from_json(entry["items"])
+        limits = ResultLimits(**entry["limits"])
+        return await self._page(items, limits.page_length(items), limits)
+
+    async def _page(self, items: list[Any], length: int, limits: ResultLimits) -> CursorResult:
+        next_cursor = None
+        if length < len(items):
+            next_cursor = uuid4().hex
+            await self.backend.set(
+                self.namespace,
+                next_cursor,
+                {"items": to_json(items[length:]), "limits": asdict(limits)},
+                limits.ttl,
+            )
+        return CursorResult.create(items=items[:length], next_cursor=next_cursor, page_size=length)
+
+
+def list_item_type(fn: Callable[..., Any]) -> Any:
+    """Return ``T`` if ``fn`` is annotated as returning ``list[T]``, else ``None``."""
+    try:
+        returns = get_type_hints(fn).get("return")
+    except Exception:
+        return None
+    if get_origin(returns) is not list:
+        return None
+    args = get_args(returns)
+    return args[0] if args else Any
+
+
+def limit_results(
+    fn: Callable[..., Any],
+    store: ResultStore,
+    limits: ResultLimits,
+) -> Callable[..., Any] | None:
+    """Wrap a ``list[T]`` tool so oversized results become ``CursorResult[T]``.
+
+    Returns ``None`` when ``fn`` does not return a list. The wrapper keeps the
+    signature of ``fn`` with the return annotation widened to
+    ``list[T] | CursorResult[T]`` so the output schema admits both shapes.
+    """
+    item_type = list_item_type(fn)
+    if item_type is None:
+        return None
+    returns = list[item_type] | CursorResult[item_type]
+
+    @functools.wraps(fn)
+    async def limited(*args: Any, **kwargs: Any) -> Any:
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return await store.paginate(result, limits)
+
+    limited.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]
+        return_annotation=returns,
+    )
+    limited.__annotations__ = {**fn.__annotations__, "return": returns}
+    return limited
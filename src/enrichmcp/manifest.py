@@ -0,0 +1,191 @@
+"""Precomputed tool manifests.
+
+A manifest snapshots everything FastMCP derives from an app at startup: tool
+names, descriptions, input/output JSON schemas and the data model Markdown.
+It is stored together with a hash of the tool signatures and entity fields,
+including field constraints and validators, which is cheap to compute because
+it only uses ``repr`` of annotations rather than generating JSON schemas.
+``EnrichMCP(..., manifest=path)`` loads it and builds tools from the stored
+schemas when the hash still matches, skipping schema generation entirely.
+
+Build a manifest as part of a deploy::
+
+    python -m enrichmcp.manifest myservice.server:app tools.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import importlib
+import inspect
+import json
+import re
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, get_args
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    import os
+
+    from .app import EnrichMCP
+
+MANIFEST_FORMAT = 1
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+class ManifestTool(BaseModel):
+    """Serialized FastMCP tool definition."""
+
+    description: str
+    parameters: dict[str, Any]
+    output_schema: dict[str, Any] | None = None
+
+
+class ToolManifest(BaseModel):
+    """Serialized tool manifest of an :class:`~enrichmcp.EnrichMCP` app."""
+
+    format: int = MANIFEST_FORMAT
+    schema_hash: str = Field(description="schema_hash() of the app the manifest was built from")
+    tools: dict[str, ManifestTool]
+    data_model: str
+
+
+def _repr(value: Any) -> str:
+    return _ADDRESS.sub("", repr(value))
+
+
+def _collect_models(annotation: Any, models: dict[str, Any]) -> None:
+    """Record the fields of every Pydantic model reachable from ``annotation``."""
+    for arg in get_args(annotation):
+        _collect_models(arg, models)
+    if not isinstance(annotation, type) or not issubclass(annotation, BaseModel):
+        return
+    key = f"{annotation.__module__}.{annotation.__qualname__}"
+    if key in models:
+        return
+    models[key] = None
+    fields = {}
+    for name, field in annotation.model_fields.items():
+        fields[name] = [
+            _repr(field.annotation),
+            field.description,
+            _repr(field.default),
+            # Constraints such as ge= and everything else shaping the schema
+            _repr(field.metadata),
+            field.alias,
+            field.title,
+            _repr(field.examples),
+            _repr(field.json_schema_extra),
+        ]
+        _collect_models(field.annotation, models)
+    decorators = annotation.__pydantic_decorators__
+    validators = sorted(
+        [kind.name, name, _repr(decorator.info)]
+        for kind in dataclasses.fields(decorators)
+        for name, decorator in getattr(decorators, kind.name).items()
+    )
+    models[key] = {
+        "fields": fields,
+        "validators": validators,
+        "config": _repr(annotation.model_config.get("json_schema_extra")),
+    }
+
+
+def schema_hash(app: EnrichMCP) -> str:
+    """Return a hash of everything a manifest is derived from.
+
+    Covers the app title and instructions, each tool's name, kind,
+    description and signature, and the fields (with their constraints),
+    validators and serializers of every model used by a signature or
+    registered as an entity.
+    """
+    functions = {name: fn for name, (fn, _) in app._pending_tools.items()}
+    functions.update({name: tool.fn for name, tool in app.resources.items()})
+
+    models: dict[str, Any] = {}
+    for entity in app.entities.values():
+        _collect_models(entity, models)
+
+    tools = {}
+    for name, tool_def in sorted(app.tool_defs.items()):
+        signature = inspect.signature(functions[name])
+        for param in signature.parameters.values():
+            _collect_models(param.annotation, models)
+        _collect_models(signature.return_annotation, models)
+        tools[name] = [tool_def.kind.value, tool_def.description, _repr(signature)]
+
+    payload = {
+        "format": MANIFEST_FORMAT,
+        "title": app.title,
+        "instructions": app.instructions,
+        "tools": tools,
+        "models": dict(sorted(models.items())),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def build_manifest(app: EnrichMCP) -> ToolManifest:
+    """Build every pending tool on ``app`` and snapshot the result."""
+    app.register_pending_tools()
+    return ToolManifest(
+        schema_hash=schema_hash(app),
+        tools={
+            name: ManifestTool(
+                description=tool.description or "",
+                parameters=tool.parameters,
+                output_schema=tool.output_schema,
+            )
+            for name, tool in sorted(app.resources.items())
+        },
+        data_model=app.describe_model(),
+    )
+
+
+def write_manifest(app: EnrichMCP, path: str | os.PathLike[str]) -> ToolManifest:
+    """Write the manifest of ``app`` to ``path`` as JSON."""
+    manifest = build_manifest(app)
+    Path(path).write_text(manifest.model_dump_json(indent=1))
+    return manifest
+
+
+def load_manifest(app: EnrichMCP, path: str | os.PathLike[str]) -> ToolManifest | None:
+    """Return the manifest at ``path`` if it was built from the same schema as ``app``.
+
+    A missing, unreadable or stale manifest returns ``None`` with a warning
+    so the app falls back to introspection.
+    """
+    try:
+        manifest = ToolManifest.model_validate_json(Path(path).read_bytes())
+    except (OSError, ValueError) as exc:
+        warnings.warn(f"Ignoring tool manifest {path}: {exc}", RuntimeWarning, stacklevel=2)
+        return None
+    if manifest.format != MANIFEST_FORMAT or manifest.schema_hash != schema_hash(app):
+        warnings.warn(
+            f"Ignoring stale tool manifest {path}; rebuild it with python -m enrichmcp.manifest",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return None
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Write the tool manifest of an EnrichMCP app.")
+    parser.add_argument("app", help="import path of the app, e.g. package.module:app")
+    parser.add_argument("output", help="manifest file to write")
+    args = parser.parse_args(argv)
+
+    module_name, _, attr = args.app.partition(":")
+    app = getattr(importlib.import_module(module_name), attr or "app")
+    manifest = write_manifest(app, args.output)
+    print(f"Wrote {len(manifest.tools)} tools to {args.output} ({manifest.schema_hash[:12]})")
+
+
+if __name__ == "__main__":
+    main()
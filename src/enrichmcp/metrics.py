@@ -0,0 +1,350 @@
+"""Per-tool call metrics.
+
+:class:`MetricsMiddleware` times every tool call and records the call count,
+error count, latency, serialized result size and, for ``PageResult`` and
+``CursorResult`` responses, the number of items. Tools run in an executor
+pool also record how long each call waited for a pool worker. Calls naming
+a tool the app does not define are recorded together as ``"unknown"``, so
+clients cannot grow the registry. Observations are kept in a
+:class:`ToolMetrics` registry that can be read in-process with
+:meth:`ToolMetrics.snapshot`, scraped as Prometheus text from ``/metrics`` on
+HTTP transports, and forwarded to any number of :class:`MetricsExporter`
+instances such as :class:`OpenTelemetryExporter`.
+
+Enable it with ``EnrichMCP(..., metrics=True)`` or pass a configured
+``ToolMetrics``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from fastmcp.server.middleware import Middleware
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+
+    from .app import EnrichMCP
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Label of calls to tools the app does not define, which clients can name freely
+UNKNOWN_TOOL = "unknown"
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    buckets: Sequence[float]
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, count)`` pairs including ``+Inf``."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts, strict=True):
+            total += count
+            pairs.append((f"{bound:g}", total))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+@dataclass
+class ToolStats:
+    """Metrics recorded for one tool."""
+
+    kind: str
+    calls: int = 0
+    errors: int = 0
+    items: int = 0
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    result_bytes: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    queue_wait: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+
+
+@runtime_checkable
+class MetricsExporter(Protocol):
+    """Receives every observation recorded by :class:`ToolMetrics`.
+
+    Exporters may also define ``record_queue_wait(tool, kind, seconds)`` to
+    receive executor queue waits.
+    """
+
+    def record(
+        self,
+        tool: str,
+        kind: str,
+        seconds: float,
+        result_bytes: int | None,
+        items: int | None,
+        error: BaseException | None,
+    ) -> None: ...
+
+
+class ToolMetrics:
+    """Registry of per-tool metrics.
+
+    ``route`` is the HTTP path serving Prometheus text (``None`` disables
+    it); ``exporters`` receive each observation as it is recorded.
+    """
+
+    def __init__(
+        self,
+        *,
+        route: str | None = "/metrics",
+        exporters: Iterable[MetricsExporter] = (),
+    ) -> None:
+        self.route = route
+        self.exporters = list(exporters)
+        self.tools: dict[str, ToolStats] = {}
+
+    def record(
+        self,
+        tool: str,
+        kind: str,
+        seconds: float,
+        *,
+        result_bytes: int | None = None,
+        items: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        stats = self._stats(tool, kind)
+        stats.calls += 1
+        stats.latency.observe(seconds)
+        if error is not None:
+            stats.errors += 1
+        if result_bytes is not None:
+            stats.result_bytes.observe(result_bytes)
+        if items is not None:
+            stats.items += items
+        for exporter in self.exporters:
+            exporter.record(tool, kind, seconds, result_bytes, items, error)
+
+    def record_queue_wait(self, tool: str, kind: str, seconds: float) -> None:
+        """Record how long a call of ``tool`` waited for an executor pool worker."""
+        self._stats(tool, kind).queue_wait.observe(seconds)
+        for exporter in self.exporters:
+            record = getattr(exporter, "record_queue_wait", None)
+            if record is not None:
+                record(tool, kind, seconds)
+
+    def _stats(self, tool: str, kind: str) -> ToolStats:
+        stats = self.tools.get(tool)
+        if stats is None:
+            stats = self.tools[tool] = ToolStats(kind)
+        return stats
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a plain-data copy of the metrics, keyed by tool name."""
+        return {
+            name: {
+                "kind": stats.kind,
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "items": stats.items,
+                "latency_seconds": {
+                    "sum": stats.latency.sum,
+                    "buckets": dict(stats.latency.cumulative()),
+                },
+                "result_bytes": {
+                    "sum": stats.result_bytes.sum,
+                    "count": stats.result_bytes.count,
+                    "buckets": dict(stats.result_bytes.cumulative()),
+                },
+                "queue_wait_seconds": {
+                    "sum": stats.queue_wait.sum,
+                    "count": stats.queue_wait.count,
+                    "buckets": dict(stats.queue_wait.cumulative()),
+                },
+            }
+            for name, stats in self.tools.items()
+        }
+
+    def render_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP enrichmcp_tool_{name} {help_text}")
+            lines.append(f"# TYPE enrichmcp_tool_{name} {kind}")
+
+        def labels(tool: str, stats: ToolStats, **extra: str) -> str:
+            pairs = {"tool": tool, "kind": stats.kind, **extra}
+            return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+        counters = (
+            ("calls_total", "Tool calls", "calls"),
+            ("errors_total", "Tool calls that raised", "errors"),
+            ("result_items_total", "Items returned in paginated results", "items"),
+        )
+        for name, help_text, attr in counters:
+            header(name, "counter", help_text)
+            for tool, stats in self.tools.items():
+                lines.append(
+                    f"enrichmcp_tool_{name}{{{labels(tool, stats)}}} {getattr(stats, attr)}"
+                )
+
+        histograms = (
+            ("latency_seconds", "Tool call latency", "latency"),
+            ("result_bytes", "Serialized tool result size", "result_bytes"),
+            ("queue_wait_seconds", "Time offloaded calls waited for a pool worker", "queue_wait"),
+        )
+        for name, help_text, attr in histograms:
+            header(name, "histogram", help_text)
+            for tool, stats in self.tools.items():
+                histogram: Histogram = getattr(stats, attr)
+                for le, count in histogram.cumulative():
+                    lines.append(
+                        f"enrichmcp_tool_{name}_bucket{{{labels(tool, stats, le=le)}}} {count}",
+                    )
+                lines.append(
+                    f"enrichmcp_tool_{name}_sum{{{labels(tool, stats)}}} {histogram.sum:g}"
+                )
+                lines.append(
+                    f"enrichmcp_tool_{name}_count{{{labels(tool, stats)}}} {histogram.count}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def result_size(result: Any) -> tuple[int | None, int | None]:
+    """Return the serialized size and paginated item count of a ``ToolResult``."""
+    content = getattr(result, "content", None)
+    if content is None:
+        return None, None
+    size = sum(len(text.encode()) for block in content if (text := getattr(block, "text", None)))
+    items = None
+    structured = getattr(result, "structured_content", None)
+    # PageResult and CursorResult both carry ``items`` and ``page_size``
+    if (
+        isinstance(structured, dict)
+        and isinstance(structured.get("items"), list)
+        and "page_size" in structured
+    ):
+        items = len(structured["items"])
+    return size, items
+
+
+class OpenTelemetryExporter:
+    """Forward observations to OpenTelemetry instruments.
+
+    Requires ``opentelemetry-api``; without a configured SDK the instruments
+    are no-ops.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter("enrichmcp")
+        self.calls = meter.create_counter("enrichmcp.tool.calls", description="Tool calls")
+        self.errors = meter.create_counter("enrichmcp.tool.errors", description="Tool errors")
+        self.items = meter.create_counter(
+            "enrichmcp.tool.result_items",
+            description="Items returned in paginated results",
+        )
+        self.latency = meter.create_histogram(
+            "enrichmcp.tool.latency",
+            unit="s",
+            description="Tool call latency",
+        )
+        self.result_bytes = meter.create_histogram(
+            "enrichmcp.tool.result_size",
+            unit="By",
+            description="Serialized tool result size",
+        )
+        self.queue_wait = meter.create_histogram(
+            "enrichmcp.tool.queue_wait",
+            unit="s",
+            description="Time offloaded calls waited for a pool worker",
+        )
+
+    def record(
+        self,
+        tool: str,
+        kind: str,
+        seconds: float,
+        result_bytes: int | None,
+        items: int | None,
+        error: BaseException | None,
+    ) -> None:
+        attributes = {"tool": tool, "kind": kind}
+        self.calls.add(1, attributes)
+        self.latency.record(seconds, attributes)
+        if error is not None:
+            self.errors.add(1, {**attributes, "error": type(error).__name__})
+        if result_bytes is not None:
+            self.result_bytes.record(result_bytes, attributes)
+        if items is not None:
+            self.items.add(items, attributes)
+
+    def record_queue_wait(self, tool: str, kind: str, seconds: float) -> None:
+        self.queue_wait.record(seconds, {"tool": tool, "kind": kind})
+
+
+class MetricsMiddleware(Middleware):
+    """Record a :class:`ToolMetrics` observation for every tool call on ``app``."""
+
+    def __init__(self, app: EnrichMCP, metrics: ToolMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        tool_def = self.app.tool_defs.get(context.message.name)
+        name = tool_def.name if tool_def else UNKNOWN_TOOL
+        kind = tool_def.kind.value if tool_def else "tool"
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception as exc:
+            self.metrics.record(name, kind, time.perf_counter() - start, error=exc)
+            raise
+        seconds = time.perf_counter() - start
+        size, items = result_size(result)
+        self.metrics.record(name, kind, seconds, result_bytes=size, items=items)
+        return result
+
+
+def install_metrics(app: EnrichMCP, metrics: ToolMetrics) -> None:
+    """Add :class:`MetricsMiddleware` and the Prometheus route to ``app``."""
+    app.mcp.add_middleware(MetricsMiddleware(app, metrics))
+    if metrics.route is None:
+        return
+
+    from starlette.responses import PlainTextResponse
+
+    @app.mcp.custom_route(metrics.route, methods=["GET"], include_in_schema=False)
+    async def prometheus_metrics(  # pyright: ignore[reportUnusedFunction]
+        request: Any,
+    ) -> PlainTextResponse:
+        return PlainTextResponse(
+            metrics.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
@@ -0,0 +1,197 @@
+"""Sampling profiler for slow tool calls.
+
+:class:`SlowCallProfiler` samples the stack of every tool call from a
+background thread. Calls that finish faster than ``threshold`` are
+discarded; slower ones are written to ``directory`` in the folded-stack
+format read by ``flamegraph.pl``, speedscope and most flame graph viewers,
+named after the tool and a hash of its arguments, and listed in
+``index.jsonl`` next to them. Files are written off the event loop.
+
+Samples follow the tool call's own coroutine: while it runs they are taken
+from the event loop thread's stack, and while it is suspended from its chain
+of awaited coroutines, so time spent waiting on a database or HTTP call
+shows up under the ``await`` that was waiting. Concurrent tool calls do not
+pollute each other's profiles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from fastmcp.server.middleware import Middleware
+
+if TYPE_CHECKING:
+    import os
+    from types import FrameType
+
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+
+DEFAULT_INTERVAL = 0.005
+
+# Characters kept from tool names in file names; clients choose the name
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class _Target:
+    """A tool call being sampled."""
+
+    def __init__(self, frame: FrameType, task: asyncio.Task[Any], thread_id: int) -> None:
+        self.frame = frame
+        self.task = task
+        self.thread_id = thread_id
+        self.samples: Counter[str] = Counter()
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{frame.f_lineno})"
+
+
+def _stack(target: _Target, thread_frames: dict[int, FrameType]) -> list[FrameType]:
+    """Return the frames of ``target``'s call, outermost first."""
+    frames = []
+    frame = thread_frames.get(target.thread_id)
+    while frame is not None and frame is not target.frame:
+        frames.append(frame)
+        frame = frame.f_back
+    if frame is not None:
+        frames.append(frame)
+        return frames[::-1]
+
+    # Suspended: follow the await chain down from the task's coroutine
+    frames = []
+    awaitable: Any = target.task.get_coro()
+    found = False
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            break
+        found = found or frame is target.frame
+        if found:
+            frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return frames
+
+
+class SlowCallProfiler:
+    """Profile tool calls and keep those slower than ``threshold`` seconds."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = "profiles",
+        *,
+        threshold: float = 1.0,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.directory = Path(directory)
+        self.threshold = threshold
+        self.interval = interval
+        self._targets: set[_Target] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._index_lock = threading.Lock()
+
+    def _start(self, target: _Target) -> None:
+        with self._lock:
+            self._targets.add(target)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="enrichmcp-profiler",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _stop(self, target: _Target) -> None:
+        with self._lock:
+            self._targets.discard(target)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._targets:
+                    self._thread = None
+                    return
+                targets = list(self._targets)
+            thread_frames = sys._current_frames()
+            for target in targets:
+                stack = _stack(target, thread_frames)
+                if stack:
+                    target.samples[";".join(_label(frame) for frame in stack)] += 1
+
+    async def profile(self, name: str, arguments: Any, call: Any) -> Any:
+        """Await ``call`` and persist its profile if it took longer than ``threshold``."""
+        task = asyncio.current_task()
+        if task is None:  # pragma: no cover - always inside a task under FastMCP
+            return await call
+        target = _Target(sys._getframe(), task, threading.get_ident())
+        self._start(target)
+        start = time.perf_counter()
+        try:
+            return await call
+        finally:
+            seconds = time.perf_counter() - start
+            self._stop(target)
+            if seconds >= self.threshold and target.samples:
+                await asyncio.to_thread(self.write, name, arguments, seconds, target.samples)
+
+    def write(
+        self,
+        name: str,
+        arguments: Any,
+        seconds: float,
+        samples: Counter[str],
+    ) -> Path:
+        """Write folded stacks for one call and append it to ``index.jsonl``.
+
+        Characters other than letters, digits, ``_`` and ``-`` in ``name``
+        are replaced in the file name, and a random suffix keeps concurrent
+        calls with the same arguments from overwriting each other.
+        """
+        encoded = json.dumps(arguments, sort_keys=True, default=str).encode()
+        arguments_hash = hashlib.sha256(encoded).hexdigest()[:12]
+        timestamp = time.strftime("%Y%m%dT%H%M%S")
+        safe_name = _UNSAFE_NAME.sub("_", name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{timestamp}-{safe_name}-{arguments_hash}-{uuid4().hex[:8]}.folded"
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in samples.items()))
+        record = {
+            "tool": name,
+            "arguments_hash": arguments_hash,
+            "seconds": round(seconds, 6),
+            "samples": sum(samples.values()),
+            "interval": self.interval,
+            "path": path.name,
+            "timestamp": timestamp,
+        }
+        with self._index_lock, (self.directory / "index.jsonl").open("a") as index:
+            index.write(json.dumps(record) + "\n")
+        return path
+
+
+class ProfilingMiddleware(Middleware):
+    """Run every tool call under a :class:`SlowCallProfiler`."""
+
+    def __init__(self, profiler: SlowCallProfiler) -> None:
+        self.profiler = profiler
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        message = context.message
+        return await self.profiler.profile(message.name, message.arguments, call_next(context))
@@ -3,16 +3,27 @@
 Provides field factories for defining entity relationships.
 """
 
+import types
 from collections.abc import Callable
 from typing import (
+    TYPE_CHECKING,
     Any,
+    ForwardRef,
     TypeVar,
+    Union,
     get_args,
     get_origin,
 )
 
+from .encoding import Encoding
+from .executors import Executor
+from .limits import ResultLimits
+from .pagination import CursorResult, PageResult
 from .tool import ToolDef, ToolKind
 
+if TYPE_CHECKING:
+    from .admission import ConcurrencyLimit
+
 T = TypeVar("T")
 
 
@@ -64,6 +75,10 @@ class Relationship:
         func: Callable[..., Any] | None = None,
         *,
         name: str | None = None,
+        limits: ResultLimits | None = None,
+        encoding: Encoding | None = None,
+        executor: Executor | None = None,
+        concurrency: "ConcurrencyLimit | None" = None,
     ) -> Callable[..., Any]:
         """Register a resolver function for this relationship.
 
@@ -76,6 +91,12 @@ class Relationship:
             @User.posts.resolver(name="get_by_date")
             def get_posts_by_date(user_id: int, date: date) -> List[Post]:
                 ...
+
+        ``limits`` caps the size of list results and ``encoding`` selects
+        the result encoding, replacing the app's ``result_limits`` and
+        ``encoding``. ``executor`` runs the resolver in the app's
+        ``"thread"`` or ``"process"`` pool and ``concurrency`` caps how many
+        calls run at once.
         """
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -109,6 +130,10 @@ class Relationship:
                     kind=ToolKind.RESOLVER,
                     name=resource_name,
                     description=resource_description,
+                    limits=limits,
+                    encoding=encoding,
+                    executor=executor,
+                    concurrency=concurrency,
                 )
                 try:
                     return self.app._register_tool_def(func, tool_def)
@@ -150,10 +175,15 @@ class Relationship:
     def _is_compatible_type(self, return_type: Any, target_type: Any) -> bool:
         """Check if return_type is compatible with target_type."""
         # Handle string forward references
-        if isinstance(return_type, str) or isinstance(target_type, str):
+        if isinstance(return_type, str | ForwardRef) or isinstance(target_type, str | ForwardRef):
             # Can't reliably check string types at runtime
             return True
 
+        # Paginated results are valid for list relationships
+        page_args = _page_item_args(return_type)
+        if page_args and get_origin(target_type) is list:
+            return self._is_compatible_type(page_args[0], get_args(target_type)[0])
+
         # Check for non-type objects (numbers, strings, etc.)
         if (not isinstance(return_type, type) and not hasattr(return_type, "__origin__")) or (
             not isinstance(target_type, type) and not hasattr(target_type, "__origin__")
@@ -165,6 +195,18 @@ class Relationship:
         return_origin = get_origin(return_type) if hasattr(return_type, "__origin__") else None
         target_origin = get_origin(target_type) if hasattr(target_type, "__origin__") else None
 
+        # Same generic container (e.g. list[Order] vs list["Order"]): compare items
+        if (
+            return_origin is not None
+            and return_origin == target_origin
+            and return_origin not in (Union, types.UnionType)
+            and len(get_args(return_type)) == len(get_args(target_type))
+        ):
+            return all(
+                self._is_compatible_type(r, t)
+                for r, t in zip(get_args(return_type), get_args(target_type), strict=True)
+            )
+
         # If both are union types, check if they're compatible
         if return_origin is not None and target_origin is not None:
             # Special case for Optional (Union with None)
@@ -216,3 +258,11 @@ class Relationship:
     def is_resolved(self) -> bool:
         """Check if this relationship has at least one resolver."""
         return len(self.resolvers) > 0
+
+
+def _page_item_args(return_type: Any) -> tuple[Any, ...]:
+    """Return the item type arguments of a parametrized ``PageResult``/``CursorResult``."""
+    metadata = getattr(return_type, "__pydantic_generic_metadata__", None)
+    if not metadata or metadata.get("origin") not in (PageResult, CursorResult):
+        return ()
+    return tuple(metadata.get("args", ()))
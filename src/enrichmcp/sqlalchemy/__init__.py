@@ -6,5 +6,13 @@ This module provides utilities to convert SQLAlchemy models to EnrichModel repre
 from .auto import include_sqlalchemy_models
 from .lifecycle import sqlalchemy_lifespan
 from .mixin import EnrichSQLAlchemyMixin
+from .session import SessionScopeMiddleware, session_scope, tool_session
 
-__all__ = ["EnrichSQLAlchemyMixin", "include_sqlalchemy_models", "sqlalchemy_lifespan"]
+__all__ = [
+    "EnrichSQLAlchemyMixin",
+    "SessionScopeMiddleware",
+    "include_sqlalchemy_models",
+    "session_scope",
+    "sqlalchemy_lifespan",
+    "tool_session",
+]
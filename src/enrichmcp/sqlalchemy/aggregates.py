@@ -0,0 +1,102 @@
+"""Count and ``GROUP BY`` aggregate support for generated SQLAlchemy tools."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from sqlalchemy import func, inspect, select
+
+from .filters import filterable_columns
+from .mixin import _sqlalchemy_type_to_python
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column
+
+DEFAULT_MAX_GROUPS = 100
+
+AggregateFunction = Literal["count", "sum", "avg", "min", "max"]
+
+
+class AggregateResult(BaseModel):
+    """Rows produced by an aggregate query."""
+
+    groups: list[dict[str, Any]] = Field(
+        description="One row per group with the group_by values and metric results",
+    )
+    truncated: bool = Field(
+        description="Whether more groups exist than were returned; narrow with filters",
+    )
+
+
+def numeric_columns(sa_model: type) -> dict[str, Column[Any]]:
+    """Return the columns of ``sa_model`` that metrics can be computed over."""
+    columns: dict[str, Column[Any]] = {}
+    for prop in inspect(sa_model).column_attrs:
+        column = prop.columns[0]
+        if column.info.get("exclude"):
+            continue
+        if _sqlalchemy_type_to_python(column.type) in (int, float):
+            columns[prop.key] = column
+    return columns
+
+
+def build_metric_model(sa_model: type) -> type[BaseModel]:
+    """Create the ``<Model>Metric`` input model for ``sa_model``."""
+    numeric = tuple(numeric_columns(sa_model))
+    field_type: Any = Literal[numeric] | None if numeric else None  # type: ignore[valid-type]
+    model = create_model(
+        f"{sa_model.__name__}Metric",
+        __config__=ConfigDict(extra="forbid"),
+        fn=(AggregateFunction, Field(description="Aggregate function")),
+        field=(
+            field_type,
+            Field(None, description="Numeric column to aggregate; omit for count"),
+        ),
+    )
+    model.__doc__ = f"Metric computed over {sa_model.__name__} records"
+    return model
+
+
+def group_by_type(sa_model: type) -> Any:
+    """Return a ``Literal`` of the columns ``sa_model`` can be grouped by."""
+    return Literal[tuple(filterable_columns(sa_model))]  # type: ignore[valid-type]
+
+
+def metric_name(metric: Any) -> str:
+    """Return the result key for ``metric``, e.g. ``count`` or ``sum_total``."""
+    return metric.fn if metric.field is None else f"{metric.fn}_{metric.field}"
+
+
+def build_aggregate_query(
+    sa_model: type,
+    group_by: list[str],
+    metrics: list[Any],
+) -> Any:
+    """Return a ``SELECT ... GROUP BY`` statement for ``group_by`` and ``metrics``."""
+    groupable = filterable_columns(sa_model)
+    numeric = numeric_columns(sa_model)
+    group_columns = []
+    for name in group_by:
+        if name not in groupable:
+            raise ValueError(f"Cannot group {sa_model.__name__} by '{name}'")
+        group_columns.append(getattr(sa_model, name).label(name))
+
+    selected = []
+    for metric in metrics or []:
+        if metric.field is None:
+            if metric.fn != "count":
+                raise ValueError(f"Metric '{metric.fn}' requires a field")
+            expr = func.count()
+        else:
+            if metric.field not in numeric:
+                raise ValueError(f"Cannot aggregate {sa_model.__name__}.{metric.field}")
+            expr = getattr(func, metric.fn)(getattr(sa_model, metric.field))
+        selected.append(expr.label(metric_name(metric)))
+    if not selected:
+        selected.append(func.count().label("count"))
+
+    stmt = select(*group_columns, *selected).select_from(sa_model)
+    if group_columns:
+        stmt = stmt.group_by(*group_columns).order_by(*group_columns)
+    return stmt
@@ -2,20 +2,55 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from fastmcp import Context
+from pydantic import Field
 from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import MANYTOONE, ONETOMANY
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
-    from sqlalchemy.orm import DeclarativeBase
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import DeclarativeBase, RelationshipProperty
 
 from enrichmcp import EnrichMCP, PageResult
 from enrichmcp.context import get_enrich_context
-
+from enrichmcp.tool import make_tool_function
+
+from .aggregates import (
+    DEFAULT_MAX_GROUPS,
+    AggregateResult,
+    build_aggregate_query,
+    build_metric_model,
+    group_by_type,
+)
+from .filters import (
+    MAX_IN_VALUES,
+    apply_filters,
+    apply_order,
+    build_filter_model,
+    filterable_columns,
+    order_by_type,
+)
+from .keys import identity_of, key_of, primary_key_in, primary_key_type, primary_key_where
 from .mixin import EnrichSQLAlchemyMixin
+from .session import install_session_scope, tool_session
+from .streaming import DEFAULT_CHUNK_SIZE, INLINE_LIMIT, StreamResult, stream_entities
+
+_MISSING = object()
+
+
+def _retain(session: AsyncSession, objs: Sequence[Any]) -> Sequence[Any]:
+    """Keep ``objs`` alive for the session's lifetime.
+
+    The identity map only holds weak references; pinning what generated tools
+    load lets nested resolvers in the same tool call find it without a query.
+    """
+    session.info.setdefault("enrichmcp_loaded", []).extend(o for o in objs if o is not None)
+    return objs
 
 
 def _sa_to_enrich(instance: Any, model_cls: type) -> Any:
@@ -29,6 +64,71 @@ def _sa_to_enrich(instance: Any, model_cls: type) -> Any:
     return model_cls(**data)
 
 
+async def _load_related_one(
+    session: AsyncSession,
+    model: type,
+    ident: Any,
+    relation: RelationshipProperty[Any],
+) -> Any:
+    """Load the single object ``relation`` refers to from parent ``ident``.
+
+    The session's identity map is consulted first: an already loaded
+    relationship is returned as is, and a many-to-one is fetched by its
+    foreign key through ``session.get``. Otherwise the target is selected in
+    one query, joined through the parent only when the foreign key lives there.
+    """
+    mapper = inspect(model)
+    target_sa = relation.mapper.class_
+    parent = session.identity_map.get(
+        mapper.identity_key_from_primary_key(list(identity_of(model, ident))),
+    )
+    if parent is not None:
+        loaded = inspect(parent).dict
+        if relation.key in loaded:
+            return loaded[relation.key]
+        if relation.direction is MANYTOONE:
+            by_remote = {
+                remote: loaded.get(mapper.get_property_by_column(local).key, _MISSING)
+                for local, remote in relation.local_remote_pairs
+            }
+            target_pk = relation.mapper.primary_key
+            if set(by_remote) == set(target_pk) and _MISSING not in by_remote.values():
+                fk = tuple(by_remote[col] for col in target_pk)
+                if None in fk:
+                    return None
+                return await session.get(target_sa, fk)
+
+    result = await session.execute(_related_stmt(model, ident, relation).limit(1))
+    return result.scalars().first()
+
+
+def _related_stmt(model: type, ident: Any, relation: RelationshipProperty[Any]) -> Select[Any]:
+    """Select the targets of ``relation`` for the parent ``ident``.
+
+    When the foreign key on the target references the parent's primary key
+    the parent table is not joined at all.
+    """
+    target_sa = relation.mapper.class_
+    pairs = relation.local_remote_pairs
+    primary_key = inspect(model).primary_key
+    if (
+        relation.direction is ONETOMANY
+        and len(pairs) == len(primary_key)
+        and all(local is col for (local, _), col in zip(pairs, primary_key, strict=True))
+    ):
+        remote = [remote for _, remote in pairs]
+        values = identity_of(model, ident)
+        return select(target_sa).where(
+            *(col == value for col, value in zip(remote, values, strict=True)),
+        )
+    return (
+        select(target_sa)
+        .select_from(model)
+        .join(getattr(model, relation.key))
+        .where(primary_key_where(model, ident))
+    )
+
+
 def _register_default_resources(
     app: EnrichMCP,
     sa_model: type,
@@ -41,25 +141,46 @@ def _register_default_resources(
     get_name = f"get_{model_name}"
     param_name = f"{model_name}_id"
 
-    list_description = f"List {sa_model.__name__} records"
-    get_description = f"Get a single {sa_model.__name__} by ID"
+    list_description = (
+        f"List {sa_model.__name__} records. Narrow results with `filters` and sort "
+        f"with `order_by` instead of paging through everything; only "
+        f"{', '.join(filterable_columns(sa_model))} can be filtered and sorted on."
+    )
+    key_columns = [col.key for col in inspect(sa_model).primary_key]
+    if len(key_columns) == 1:
+        get_description = f"Get a single {sa_model.__name__} by ID"
+    else:
+        get_description = (
+            f"Get a single {sa_model.__name__} by its primary key, given as "
+            f"[{', '.join(key_columns)}]"
+        )
+    pk_type = primary_key_type(sa_model)
+    filter_model = build_filter_model(sa_model)
 
     async def list_resource(
         ctx: Context | None = None,
         page: int = 1,
         page_size: int = 20,
+        filters: Any = None,
+        order_by: Any = None,
+        order_direction: Literal["asc", "desc"] = "asc",
     ) -> PageResult[enrich_model]:  # type: ignore[name-defined]
         if ctx is None:
             ctx = get_enrich_context()
         if ctx.request_context is None:
             raise RuntimeError("No request context available")
-        session_factory = ctx.request_context.lifespan_context[session_key]
-        async with session_factory() as session:
-            total = await session.scalar(select(func.count()).select_from(sa_model))
+        async with tool_session(ctx, session_key) as session:
+            filtered = apply_filters(select(sa_model), sa_model, filters)
+            total = await session.scalar(
+                select(func.count()).select_from(filtered.subquery()),
+            )
             result = await session.execute(
-                select(sa_model).offset((page - 1) * page_size).limit(page_size),
+                apply_order(filtered, sa_model, order_by, order_direction)
+                .offset((page - 1) * page_size)
+                .limit(page_size),
             )
-            items = [_sa_to_enrich(obj, enrich_model) for obj in result.scalars().all()]
+            objs = _retain(session, result.scalars().all())
+            items = [_sa_to_enrich(obj, enrich_model) for obj in objs]
             has_next = page * page_size < int(total or 0)
             return PageResult.create(
                 items=items,
@@ -71,40 +192,183 @@ def _register_default_resources(
 
     # Set annotations
     list_resource.__annotations__["ctx"] = Context | None
+    list_resource.__annotations__["filters"] = filter_model | None
+    list_resource.__annotations__["order_by"] = order_by_type(sa_model) | None
+    list_resource.__annotations__["order_direction"] = Literal["asc", "desc"]
     list_resource.__annotations__["return"] = PageResult[enrich_model]
 
     app.retrieve(name=list_name, description=list_description)(list_resource)
 
-    # Create function dynamically with the correct parameter name
-    func_code = f"""
-async def {get_name}({param_name}: int, ctx: "Context | None" = None) -> enrich_model | None:
-    if ctx is None:
-        ctx = get_enrich_context()
-    if ctx.request_context is None:
-        raise RuntimeError("No request context available")
-    session_factory = ctx.request_context.lifespan_context[session_key]
-    async with session_factory() as session:
-        obj = await session.get(sa_model, {param_name})
-        return _sa_to_enrich(obj, enrich_model) if obj else None
-"""
-
-    # Execute the function definition
-    namespace = {
-        "Context": Context,
-        "get_enrich_context": get_enrich_context,
-        "enrich_model": enrich_model,
-        "session_key": session_key,
-        "sa_model": sa_model,
-        "_sa_to_enrich": _sa_to_enrich,
-    }
-    exec(func_code, namespace)
-    get_resource = namespace[get_name]
-
-    function_tool = app.mcp.tool(
+    async def get_one(ident: Any, ctx: Context | None) -> Any:
+        if ctx is None:
+            ctx = get_enrich_context()
+        async with tool_session(ctx, session_key) as session:
+            obj = await session.get(sa_model, ident)
+            _retain(session, [obj])
+            return _sa_to_enrich(obj, enrich_model) if obj else None
+
+    get_resource = make_tool_function(
+        get_one,
         name=get_name,
-        description=get_description,
-    )(get_resource)
-    app.resources[get_name] = function_tool
+        parameters=[(param_name, pk_type), ("ctx", Context | None, None)],
+        returns=enrich_model | None,
+    )
+
+    app.retrieve(name=get_name, description=get_description)(get_resource)
+
+    async def get_by_ids_resource(
+        ids: Any,
+        ctx: Context | None = None,
+    ) -> list[enrich_model]:  # type: ignore[valid-type]
+        if ctx is None:
+            ctx = get_enrich_context()
+        async with tool_session(ctx, session_key) as session:
+            result = await session.execute(
+                select(sa_model).where(primary_key_in(sa_model, ids)),
+            )
+            found = {key_of(obj): obj for obj in _retain(session, result.scalars().all())}
+        keys = [tuple(ident) if len(key_columns) > 1 else ident for ident in ids]
+        return [_sa_to_enrich(found[key], enrich_model) for key in keys if key in found]
+
+    get_by_ids_resource.__annotations__["ids"] = Annotated[
+        list[pk_type],  # type: ignore[valid-type]
+        Field(min_length=1, max_length=MAX_IN_VALUES),
+    ]
+    get_by_ids_resource.__annotations__["ctx"] = Context | None
+    get_by_ids_resource.__annotations__["return"] = list[enrich_model]  # type: ignore[valid-type]
+
+    app.retrieve(
+        name=f"get_{model_name}s_by_ids",
+        description=(
+            f"Get several {sa_model.__name__} records by primary key in one query. "
+            f"Missing keys are skipped; results follow the order of `ids`."
+        ),
+    )(get_by_ids_resource)
+
+
+def _register_stream_resource(
+    app: EnrichMCP,
+    sa_model: type,
+    enrich_model: type,
+    session_key: str,
+) -> None:
+    """Register a ``stream_<model>s`` tool for ``sa_model``."""
+    model_name = sa_model.__name__.lower()
+    description = (
+        f"Stream {sa_model.__name__} records for exports and other large reads. "
+        f"Pass a progress token to receive items in chunks as progress notifications, "
+        f"each message a JSON array of {sa_model.__name__} objects; the result then "
+        f"only reports how many were sent. Without a progress token up to "
+        f"{INLINE_LIMIT} items are returned inline. Accepts the same `filters` and "
+        f"`order_by` as list_{model_name}s."
+    )
+    filter_model = build_filter_model(sa_model)
+
+    async def stream_resource(
+        ctx: Context | None = None,
+        filters: Any = None,
+        order_by: Any = None,
+        order_direction: Literal["asc", "desc"] = "asc",
+        limit: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StreamResult[enrich_model]:  # type: ignore[name-defined]
+        if ctx is None:
+            ctx = get_enrich_context()
+        stmt = apply_order(
+            apply_filters(select(sa_model), sa_model, filters),
+            sa_model,
+            order_by,
+            order_direction,
+        )
+        async with tool_session(ctx, session_key) as session:
+            return await stream_entities(
+                ctx,
+                session,
+                stmt,
+                lambda obj: _sa_to_enrich(obj, enrich_model),
+                limit=limit,
+                chunk_size=chunk_size,
+            )
+
+    stream_resource.__annotations__["ctx"] = Context | None
+    stream_resource.__annotations__["filters"] = filter_model | None
+    stream_resource.__annotations__["order_by"] = order_by_type(sa_model) | None
+    stream_resource.__annotations__["order_direction"] = Literal["asc", "desc"]
+    stream_resource.__annotations__["limit"] = int | None
+    stream_resource.__annotations__["chunk_size"] = int
+    stream_resource.__annotations__["return"] = StreamResult[enrich_model]
+
+    app.retrieve(name=f"stream_{model_name}s", description=description)(stream_resource)
+
+
+def _register_aggregate_resources(
+    app: EnrichMCP,
+    sa_model: type,
+    session_key: str,
+    max_groups: int,
+) -> None:
+    """Register ``count_<model>s`` and ``aggregate_<model>s`` for ``sa_model``."""
+    model_name = sa_model.__name__.lower()
+    filter_model = build_filter_model(sa_model)
+    metric_model = build_metric_model(sa_model)
+
+    count_description = (
+        f"Count {sa_model.__name__} records matching `filters` in a single query. "
+        f"Prefer this over paging through list_{model_name}s."
+    )
+    aggregate_description = (
+        f"Group {sa_model.__name__} records by one or more columns and compute "
+        f"count/sum/avg/min/max metrics per group in a single query. "
+        f"At most {max_groups} groups are returned; `truncated` is set when more exist."
+    )
+
+    async def count_resource(ctx: Context | None = None, filters: Any = None) -> int:
+        if ctx is None:
+            ctx = get_enrich_context()
+        if ctx.request_context is None:
+            raise RuntimeError("No request context available")
+        async with tool_session(ctx, session_key) as session:
+            filtered = apply_filters(select(sa_model), sa_model, filters)
+            total = await session.scalar(
+                select(func.count()).select_from(filtered.subquery()),
+            )
+            return int(total or 0)
+
+    async def aggregate_resource(
+        group_by: Any,
+        metrics: Any = None,
+        ctx: Context | None = None,
+        filters: Any = None,
+        limit: int = max_groups,
+    ) -> AggregateResult:
+        if limit < 1 or limit > max_groups:
+            raise ValueError(f"limit must be between 1 and {max_groups}")
+        if ctx is None:
+            ctx = get_enrich_context()
+        if ctx.request_context is None:
+            raise RuntimeError("No request context available")
+        stmt = build_aggregate_query(sa_model, group_by, metrics or [])
+        stmt = apply_filters(stmt, sa_model, filters).limit(limit + 1)
+        async with tool_session(ctx, session_key) as session:
+            result = await session.execute(stmt)
+            rows = [dict(row) for row in result.mappings().all()]
+        return AggregateResult(groups=rows[:limit], truncated=len(rows) > limit)
+
+    count_resource.__annotations__["ctx"] = Context | None
+    count_resource.__annotations__["filters"] = filter_model | None
+    count_resource.__annotations__["return"] = int
+
+    aggregate_resource.__annotations__["group_by"] = list[group_by_type(sa_model)]
+    aggregate_resource.__annotations__["metrics"] = list[metric_model] | None
+    aggregate_resource.__annotations__["ctx"] = Context | None
+    aggregate_resource.__annotations__["filters"] = filter_model | None
+    aggregate_resource.__annotations__["limit"] = int
+    aggregate_resource.__annotations__["return"] = AggregateResult
+
+    app.retrieve(name=f"count_{model_name}s", description=count_description)(count_resource)
+    app.retrieve(name=f"aggregate_{model_name}s", description=aggregate_description)(
+        aggregate_resource,
+    )
 
 
 def _register_relationship_resolvers(
@@ -135,124 +399,79 @@ def _register_relationship_resolvers(
         if rel.uselist:
 
             def _create_list_resolver(
-                f_name: str = field_name,
                 model: type = sa_model,
                 target: type = target_model,
-                param: str = param_name,
                 relation=rel,
-                target_sa: type = rel.mapper.class_,
             ) -> Callable[..., Awaitable[PageResult[Any]]]:
-                # Create function dynamically with the correct parameter name
-                func_code = f"""
-async def resolver_func(
-    {param}: int,
-    page: int = 1,
-    page_size: int = 20,
-    ctx: Context | None = None,
-) -> PageResult[target]:
-    if page < 1 or page_size < 1:
-        raise ValueError("page and page_size must be >= 1")
-
-    if ctx is None:
-        ctx = get_enrich_context()
-    session_factory = ctx.request_context.lifespan_context[session_key]
-    async with session_factory() as session:
-        primary_col = inspect(model).primary_key[0]
-        back_attr = getattr(target_sa, relation.back_populates)
-
-        offset = (page - 1) * page_size
-
-        stmt = (
-            select(target_sa)
-            .join(back_attr)
-            .where(primary_col == {param})
-            .offset(offset)
-            .limit(page_size + 1)
-        )
-        result = await session.execute(stmt)
-        values = result.scalars().all()
-
-        has_next = len(values) > page_size
-        items = values[:page_size]
-
-        if not items and page > 1:
-            return PageResult.create(
-                items=[],
-                page=page,
-                page_size=page_size,
-                has_next=False,
-                total_items=None,
-            )
-
-        items = [_sa_to_enrich(v, target) for v in items]
-        return PageResult.create(
-            items=items,
-            page=page,
-            page_size=page_size,
-            has_next=has_next,
-            total_items=None,
-        )
-"""
-
-                # Execute the function definition
-                namespace = {
-                    "Context": Context,
-                    "get_enrich_context": get_enrich_context,
-                    "PageResult": PageResult,
-                    "target": target,
-                    "session_key": session_key,
-                    "inspect": inspect,
-                    "model": model,
-                    "target_sa": target_sa,
-                    "relation": relation,
-                    "select": select,
-                    "_sa_to_enrich": _sa_to_enrich,
-                }
-                exec(func_code, namespace)
-                return namespace["resolver_func"]
+                async def resolve_many(
+                    ident: Any,
+                    page: int,
+                    page_size: int,
+                    ctx: Context | None,
+                ) -> PageResult[Any]:
+                    if page < 1 or page_size < 1:
+                        raise ValueError("page and page_size must be >= 1")
+                    if ctx is None:
+                        ctx = get_enrich_context()
+                    async with tool_session(ctx, session_key) as session:
+                        stmt = (
+                            _related_stmt(model, ident, relation)
+                            .offset((page - 1) * page_size)
+                            .limit(page_size + 1)
+                        )
+                        result = await session.execute(stmt)
+                        values = _retain(session, result.scalars().all())
+                    return PageResult.create(
+                        items=[_sa_to_enrich(v, target) for v in values[:page_size]],
+                        page=page,
+                        page_size=page_size,
+                        has_next=len(values) > page_size,
+                        total_items=None,
+                    )
+
+                return resolve_many
 
             resolver = _create_list_resolver()
+            parameters = [
+                (param_name, primary_key_type(sa_model)),
+                ("page", int, 1),
+                ("page_size", int, 20),
+                ("ctx", Context | None, None),
+            ]
+            returns: Any = PageResult[target_model]
         else:
 
             def _create_single_resolver(
-                f_name: str = field_name,
                 model: type = sa_model,
                 target: type = target_model,
-                param: str = param_name,
+                relation=rel,
             ) -> Callable[..., Awaitable[Any | None]]:
-                # Create function dynamically with the correct parameter name
-                func_code = f"""
-async def resolver_func({param}: int, ctx: Context | None = None) -> target | None:
-    if ctx is None:
-        ctx = get_enrich_context()
-    session_factory = ctx.request_context.lifespan_context[session_key]
-    async with session_factory() as session:
-        obj = await session.get(model, {param})
-        if not obj:
-            return None
-        await session.refresh(obj, [f_name])
-        value = getattr(obj, f_name)
-        return _sa_to_enrich(value, target) if value else None
-"""
-
-                # Execute the function definition
-                namespace = {
-                    "Context": Context,
-                    "get_enrich_context": get_enrich_context,
-                    "target": target,
-                    "session_key": session_key,
-                    "model": model,
-                    "f_name": f_name,
-                    "_sa_to_enrich": _sa_to_enrich,
-                }
-                exec(func_code, namespace)
-                return namespace["resolver_func"]
+                async def resolve_one(ident: Any, ctx: Context | None) -> Any:
+                    if ctx is None:
+                        ctx = get_enrich_context()
+                    async with tool_session(ctx, session_key) as session:
+                        value = await _load_related_one(session, model, ident, relation)
+                        _retain(session, [value])
+                        return _sa_to_enrich(value, target) if value else None
 
-            resolver = _create_single_resolver()
+                return resolve_one
 
-        resolver.__name__ = f"get_{sa_model.__name__.lower()}_{field_name}"
-        resolver.__doc__ = description
-        relationship.resolver(name="get")(resolver)
+            resolver = _create_single_resolver()
+            parameters = [
+                (param_name, primary_key_type(sa_model)),
+                ("ctx", Context | None, None),
+            ]
+            returns = target_model | None
+
+        relationship.resolver(name="get")(
+            make_tool_function(
+                resolver,
+                name=f"get_{sa_model.__name__.lower()}_{field_name}",
+                parameters=parameters,
+                returns=returns,
+                doc=description,
+            ),
+        )
 
 
 def include_sqlalchemy_models(
@@ -260,42 +479,57 @@ def include_sqlalchemy_models(
     base: type[DeclarativeBase],
     *,
     session_key: str = "session_factory",
+    aggregates: bool = False,
+    max_groups: int = DEFAULT_MAX_GROUPS,
+    streaming: bool = False,
 ) -> dict[str, type]:
     """Convert and register SQLAlchemy models on ``app``.
 
     The returned mapping contains both the original SQLAlchemy class names and
-    the generated EnrichModel classes for easy lookup.
+    the generated EnrichModel classes for easy lookup. With ``aggregates=True``
+    ``count_<model>s`` and ``aggregate_<model>s`` tools are generated as well;
+    ``max_groups`` caps how many groups a single aggregate call may return.
+    ``streaming=True`` adds ``stream_<model>s`` tools for large exports.
     """
+    install_session_scope(app)
+    profile = app.startup_profile
     models: dict[str, type] = {}
-    for mapper in base.registry.mappers:
-        sa_model = mapper.class_
-        if not issubclass(sa_model, EnrichSQLAlchemyMixin):
-            continue
-        enrich_cls = sa_model.__enrich_model__()
-        model = type(
-            enrich_cls.__name__,
-            (enrich_cls,),
-            {"__doc__": enrich_cls.__doc__},
-        )
-        app.entity(model)
-        models[sa_model.__name__] = model
-        models[model.__name__] = model
+    with profile.phase("model creation"):
+        for mapper in base.registry.mappers:
+            sa_model = mapper.class_
+            if not issubclass(sa_model, EnrichSQLAlchemyMixin):
+                continue
+            enrich_cls = sa_model.__enrich_model__()
+            model = type(
+                enrich_cls.__name__,
+                (enrich_cls,),
+                {"__doc__": enrich_cls.__doc__},
+            )
+            app.entity(model)
+            models[sa_model.__name__] = model
+            models[model.__name__] = model
 
     # First, rebuild all models to resolve forward references
-    for mapper in base.registry.mappers:
-        sa_model = mapper.class_
-        if sa_model.__name__ not in models:
-            continue
-        enrich_model = models[sa_model.__name__]
-        enrich_model.model_rebuild(_types_namespace=models)
+    with profile.phase("rebuild"):
+        for mapper in base.registry.mappers:
+            sa_model = mapper.class_
+            if sa_model.__name__ not in models:
+                continue
+            enrich_model = models[sa_model.__name__]
+            enrich_model.model_rebuild(_types_namespace=models)
 
     # Then register resources and resolvers
-    for mapper in base.registry.mappers:
-        sa_model = mapper.class_
-        if sa_model.__name__ not in models:
-            continue
-        enrich_model = models[sa_model.__name__]
-        _register_default_resources(app, sa_model, enrich_model, session_key)
-        _register_relationship_resolvers(app, sa_model, enrich_model, models, session_key)
+    with profile.phase("tool registration"):
+        for mapper in base.registry.mappers:
+            sa_model = mapper.class_
+            if sa_model.__name__ not in models:
+                continue
+            enrich_model = models[sa_model.__name__]
+            _register_default_resources(app, sa_model, enrich_model, session_key)
+            if aggregates:
+                _register_aggregate_resources(app, sa_model, session_key, max_groups)
+            if streaming:
+                _register_stream_resource(app, sa_model, enrich_model, session_key)
+            _register_relationship_resolvers(app, sa_model, enrich_model, models, session_key)
 
     return models
@@ -0,0 +1,136 @@
+"""Whitelisted filter and sort support for generated SQLAlchemy tools.
+
+Only columns that are indexed, unique or part of the primary key, or that are
+explicitly marked with ``info={"filterable": True}``, can be filtered or sorted
+on. Marking a column with ``info={"filterable": False}`` opts it out.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from sqlalchemy import inspect
+
+from .mixin import _sqlalchemy_type_to_python
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column, Select
+
+T = TypeVar("T")
+
+MAX_IN_VALUES = 500
+
+
+class ValueFilter(BaseModel, Generic[T]):
+    """Conditions on a single column. All given conditions must hold."""
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    eq: T | None = Field(None, description="Equal to")
+    in_: list[T] | None = Field(
+        None,
+        alias="in",
+        max_length=MAX_IN_VALUES,
+        description="Equal to any of these values",
+    )
+    gt: T | None = Field(None, description="Greater than")
+    gte: T | None = Field(None, description="Greater than or equal to")
+    lt: T | None = Field(None, description="Less than")
+    lte: T | None = Field(None, description="Less than or equal to")
+
+
+class StringFilter(ValueFilter[str]):
+    """Conditions on a text column."""
+
+    prefix: str | None = Field(None, description="Starts with")
+
+
+def filterable_columns(sa_model: type) -> dict[str, Column[Any]]:
+    """Return the columns of ``sa_model`` that may be filtered and sorted on."""
+    columns: dict[str, Column[Any]] = {}
+    for prop in inspect(sa_model).column_attrs:
+        column = prop.columns[0]
+        if column.info.get("exclude"):
+            continue
+        flag = column.info.get("filterable")
+        if flag is False:
+            continue
+        if flag or column.primary_key or column.index or column.unique:
+            columns[prop.key] = column
+    return columns
+
+
+def build_filter_model(sa_model: type) -> type[BaseModel]:
+    """Create the ``<Model>Filter`` input model for ``sa_model``."""
+    fields: dict[str, Any] = {}
+    for name, column in filterable_columns(sa_model).items():
+        python_type = _sqlalchemy_type_to_python(column.type)
+        filter_type = StringFilter if python_type is str else ValueFilter[python_type]
+        fields[name] = (
+            filter_type | None,
+            Field(None, description=column.info.get("description", f"{name} field")),
+        )
+    model = create_model(
+        f"{sa_model.__name__}Filter",
+        __config__=ConfigDict(extra="forbid"),
+        **fields,
+    )
+    model.__doc__ = f"Filters for {sa_model.__name__} records"
+    return model
+
+
+def order_by_type(sa_model: type) -> Any:
+    """Return a ``Literal`` of the columns ``sa_model`` can be sorted by."""
+    return Literal[tuple(filterable_columns(sa_model))]  # type: ignore[valid-type]
+
+
+def apply_filters(stmt: Select[Any], sa_model: type, filters: BaseModel | None) -> Select[Any]:
+    """Add ``WHERE`` clauses for every condition set on ``filters``."""
+    if filters is None:
+        return stmt
+    for name in filters.model_fields_set:
+        condition = getattr(filters, name)
+        if condition is None:
+            continue
+        column = getattr(sa_model, name)
+        for op in condition.model_fields_set:
+            value = getattr(condition, op)
+            if value is None:
+                continue
+            if op == "eq":
+                stmt = stmt.where(column == value)
+            elif op == "in_":
+                stmt = stmt.where(column.in_(value))
+            elif op == "gt":
+                stmt = stmt.where(column > value)
+            elif op == "gte":
+                stmt = stmt.where(column >= value)
+            elif op == "lt":
+                stmt = stmt.where(column < value)
+            elif op == "lte":
+                stmt = stmt.where(column <= value)
+            elif op == "prefix":
+                stmt = stmt.where(column.startswith(value, autoescape=True))
+    return stmt
+
+
+def apply_order(
+    stmt: Select[Any],
+    sa_model: type,
+    order_by: str | None,
+    order_direction: str = "asc",
+) -> Select[Any]:
+    """Order ``stmt`` by ``order_by`` with the primary key as a tie-breaker.
+
+    The tie-breaker keeps offset pagination stable across pages.
+    """
+    if order_direction not in ("asc", "desc"):
+        raise ValueError("order_direction must be 'asc' or 'desc'")
+    primary_keys = list(inspect(sa_model).primary_key)
+    if order_by is not None:
+        if order_by not in filterable_columns(sa_model):
+            raise ValueError(f"Cannot order {sa_model.__name__} by '{order_by}'")
+        column = getattr(sa_model, order_by)
+        stmt = stmt.order_by(column.desc() if order_direction == "desc" else column.asc())
+    return stmt.order_by(*primary_keys)
@@ -0,0 +1,55 @@
+"""Primary key helpers for generated SQLAlchemy tools.
+
+Single-column keys are passed around as plain values of the column's Python
+type. Composite keys are tuples ordered like the mapper's primary key.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, inspect, tuple_
+
+from .mixin import _sqlalchemy_type_to_python
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import ColumnElement
+
+
+def primary_key_type(sa_model: type) -> Any:
+    """Return the parameter type for a primary key of ``sa_model``."""
+    types = tuple(_sqlalchemy_type_to_python(col.type) for col in inspect(sa_model).primary_key)
+    if len(types) == 1:
+        return types[0]
+    return tuple[types]  # type: ignore[valid-type]
+
+
+def primary_key_where(sa_model: type, ident: Any) -> ColumnElement[bool]:
+    """Return a clause matching the row of ``sa_model`` identified by ``ident``."""
+    columns = inspect(sa_model).primary_key
+    if len(columns) == 1:
+        return columns[0] == ident
+    return and_(*(col == value for col, value in zip(columns, ident, strict=True)))
+
+
+def primary_key_in(sa_model: type, idents: Sequence[Any]) -> ColumnElement[bool]:
+    """Return a clause matching any of ``idents``, using a tuple ``IN`` for composite keys."""
+    columns = inspect(sa_model).primary_key
+    if len(columns) == 1:
+        return columns[0].in_(idents)
+    return tuple_(*columns).in_([tuple(ident) for ident in idents])
+
+
+def identity_of(sa_model: type, ident: Any) -> tuple[Any, ...]:
+    """Return ``ident`` as the tuple SQLAlchemy uses for identity keys."""
+    if len(inspect(sa_model).primary_key) == 1:
+        return (ident,)
+    return tuple(ident)
+
+
+def key_of(obj: Any) -> Any:
+    """Return the primary key of a loaded instance in parameter form."""
+    key = inspect(obj).identity
+    return key[0] if len(key) == 1 else key
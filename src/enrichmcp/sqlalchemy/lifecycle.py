@@ -2,55 +2,167 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Awaitable, Callable
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
+    create_async_engine,
 )  # pyright: ignore[reportMissingImports,reportAttributeAccessIssue]
+from sqlalchemy.orm import Session
 
 from enrichmcp.app import EnrichMCP
+from enrichmcp.tracing import get_tracer, start_span
+from enrichmcp.workers import runs_setup
+
+from .routing import ReplicaRouter, ReplicaStrategy, RoutingSession
+from .session import SessionScopeMiddleware, current_scope
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
     from sqlalchemy.orm import (
         DeclarativeBase,  # pyright: ignore[reportMissingImports,reportAttributeAccessIssue]
+        SessionTransaction,
     )
 
+    from enrichmcp.tool import ToolKind
+
 Lifespan = Callable[[EnrichMCP], AbstractAsyncContextManager[dict[str, Any]]]
 
 
 def sqlalchemy_lifespan(
     base: type[DeclarativeBase],
-    engine: AsyncEngine,
+    engine: AsyncEngine | str,
     *,
     seed: Callable[[AsyncSession], Awaitable[None]] | None = None,
     session_kwargs: dict[str, Any] | None = None,
     cleanup_db_file: bool = False,
+    replicas: Sequence[AsyncEngine] = (),
+    replica_strategy: ReplicaStrategy = "round_robin",
+    create_tables: bool | Literal["defer"] = True,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool | None = None,
+    statement_timeout: float | None = None,
+    statement_timeouts: Mapping[str | ToolKind, float] | None = None,
+    warm_connections: int = 0,
 ) -> Lifespan:
-    """Create a lifespan that sets up tables and yields a session factory."""
+    """Create a lifespan that sets up tables and yields a session factory.
+
+    With ``replicas`` the session factory routes retriever and resolver tool
+    calls to a replica, picked by ``replica_strategy``, and everything else to
+    ``engine``. A tool call that writes keeps reading from ``engine``.
+
+    ``create_tables`` runs ``metadata.create_all`` before serving (``True``),
+    in the background after startup (``"defer"``) or not at all (``False``).
+    The pool options are passed to :func:`create_async_engine` and require
+    ``engine`` to be a database URL. ``statement_timeout`` (seconds) applies to
+    every tool call; ``statement_timeouts`` overrides it per tool name or
+    :class:`ToolKind` and is enforced on PostgreSQL and MySQL.
+    ``warm_connections`` opens that many pooled connections on startup.
+
+    Replica routing and ``statement_timeouts`` depend on the tool call in
+    progress, so they need :class:`SessionScopeMiddleware` on the app.
+    :func:`include_sqlalchemy_models` installs it; apps with only
+    hand-written tools must add it themselves, or startup raises
+    :class:`RuntimeError`.
+
+    Under ``app.run(..., workers=N)`` every worker gets its own session
+    factory and pools, while tables are created and ``seed`` runs only in the
+    first worker (see :func:`enrichmcp.workers.runs_setup`).
+    """
     session_kwargs = session_kwargs or {}
+    if create_tables not in (True, False, "defer"):
+        raise ValueError("create_tables must be True, False or 'defer'")
+
+    pool_options = {
+        key: value
+        for key, value in {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+        }.items()
+        if value is not None
+    }
+    if isinstance(engine, str):
+        engine = create_async_engine(engine, **pool_options)
+    elif pool_options:
+        raise ValueError("Pool options require a database URL instead of an engine")
+
+    sync_session_class: type[Session] = RoutingSession if replicas else Session
+    if statement_timeout is not None or statement_timeouts:
+        sync_session_class = _timeout_session_class(
+            sync_session_class,
+            statement_timeout,
+            statement_timeouts or {},
+        )
+
+    for traced in (engine, *replicas):
+        _trace_statements(traced)
 
     @asynccontextmanager
     async def _lifespan(app: EnrichMCP) -> AsyncIterator[dict[str, Any]]:
-        async with engine.begin() as conn:
-            await conn.run_sync(base.metadata.create_all)
-        session_factory = async_sessionmaker(
+        if replicas or statement_timeouts:
+            _require_session_scope(app)
+        session_factory: Any = async_sessionmaker(
             engine,
             class_=AsyncSession,
             expire_on_commit=False,
+            sync_session_class=sync_session_class,
             **session_kwargs,
         )
-        if seed is not None:
-            async with session_factory() as session:
-                await seed(session)
-                await session.commit()
+
+        async def _prepare() -> None:
+            if not runs_setup():
+                return
+            if create_tables:
+                async with engine.begin() as conn:
+                    await conn.run_sync(base.metadata.create_all)
+            if seed is not None:
+                async with session_factory() as session:
+                    await seed(session)
+                    await session.commit()
+
+        ddl_task: asyncio.Task[None] | None = None
+        with start_span(
+            "enrichmcp.lifespan.startup",
+            {"enrichmcp.create_tables": str(create_tables), "db.system": engine.dialect.name},
+        ):
+            if create_tables == "defer":
+                ddl_task = asyncio.create_task(_prepare())
+            else:
+                await _prepare()
+            if warm_connections:
+                await asyncio.gather(
+                    *(_warm(e, warm_connections) for e in (engine, *replicas)),
+                )
+        if replicas:
+            session_factory = ReplicaRouter(
+                engine,
+                replicas,
+                strategy=replica_strategy,
+                sync_session_class=sync_session_class,  # type: ignore[arg-type]
+                expire_on_commit=False,
+                **session_kwargs,
+            )
         try:
             yield {"session_factory": session_factory}
         finally:
+            if ddl_task is not None:
+                ddl_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await ddl_task
             await engine.dispose()
+            for replica in replicas:
+                await replica.dispose()
             if (
                 cleanup_db_file
                 and engine.url.database
@@ -62,3 +174,149 @@ def sqlalchemy_lifespan(
                     os.remove(engine.url.database)
 
     return _lifespan
+
+
+def _require_session_scope(app: Any) -> None:
+    """Raise unless tool calls on ``app`` run inside a session scope."""
+    # FastMCP passes its server to the lifespan; tests may pass the app
+    mcp = app.mcp if isinstance(app, EnrichMCP) else app
+    if any(isinstance(m, SessionScopeMiddleware) for m in getattr(mcp, "middleware", ())):
+        return
+    raise RuntimeError(
+        "replicas and statement_timeouts need the tool call's session scope; "
+        "use include_sqlalchemy_models(app, ...) or "
+        "app.mcp.add_middleware(SessionScopeMiddleware(app))"
+    )
+
+
+def _trace_statements(engine: AsyncEngine) -> None:
+    """Emit a span for every statement executed on ``engine``."""
+    if get_tracer() is None:
+        return
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _start_statement_span):
+        event.listen(sync_engine, "before_cursor_execute", _start_statement_span)
+        event.listen(sync_engine, "after_cursor_execute", _end_statement_span)
+        event.listen(sync_engine, "handle_error", _fail_statement_span)
+
+
+def _start_statement_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    # Greenlet-run event hooks share the calling task's context, so the
+    # span is parented to the tool call that issued the statement.
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context._enrichmcp_span = get_tracer().start_span(
+        operation,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement,
+            "db.operation": operation,
+        },
+    )
+
+
+def _end_statement_span(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    span = getattr(context, "_enrichmcp_span", None)
+    if span is not None:
+        span.end()
+        context._enrichmcp_span = None
+
+
+def _fail_statement_span(exception_context: Any) -> None:
+    context = exception_context.execution_context
+    span = getattr(context, "_enrichmcp_span", None)
+    if span is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        context._enrichmcp_span = None
+
+
+async def _warm(engine: AsyncEngine, count: int) -> None:
+    """Open ``count`` connections at once so the pool keeps them."""
+    connections = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    for conn in connections:
+        await conn.close()
+
+
+def _statement_timeout(
+    default: float | None,
+    overrides: Mapping[str | ToolKind, float],
+) -> float | None:
+    """Return the statement timeout for the tool call in progress."""
+    scope = current_scope()
+    if scope is None:
+        return default
+    if scope.name is not None and scope.name in overrides:
+        return overrides[scope.name]
+    if scope.kind is not None and scope.kind in overrides:
+        return overrides[scope.kind]
+    return default
+
+
+# Connection info key holding MySQL's max_execution_time from before the tool call
+_PREVIOUS_MAX_EXECUTION_TIME = "enrichmcp_max_execution_time"
+
+
+def _apply_statement_timeout(conn: Connection, timeout: float) -> None:
+    """Limit statements on ``conn`` to ``timeout`` seconds for this transaction."""
+    millis = int(timeout * 1000)
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {millis}")
+    elif dialect in ("mysql", "mariadb"):
+        # MySQL has no transaction-scoped setting, so the session value is
+        # restored when the connection goes back to the pool
+        if _PREVIOUS_MAX_EXECUTION_TIME not in conn.info:
+            previous = conn.exec_driver_sql("SELECT @@SESSION.max_execution_time").scalar()
+            conn.info[_PREVIOUS_MAX_EXECUTION_TIME] = int(previous or 0)
+            pool = conn.engine.pool
+            if not event.contains(pool, "checkin", _restore_max_execution_time):
+                event.listen(pool, "checkin", _restore_max_execution_time)
+        conn.exec_driver_sql(f"SET SESSION max_execution_time = {millis}")
+
+
+def _restore_max_execution_time(dbapi_connection: Any, connection_record: Any) -> None:
+    previous = connection_record.info.pop(_PREVIOUS_MAX_EXECUTION_TIME, None)
+    if previous is None or dbapi_connection is None:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET SESSION max_execution_time = {int(previous)}")
+    finally:
+        cursor.close()
+
+
+def _timeout_session_class(
+    base_class: type[Session],
+    default: float | None,
+    overrides: Mapping[str | ToolKind, float],
+) -> type[Session]:
+    """Return a ``base_class`` subclass that sets a statement timeout per transaction.
+
+    Transactions of tool calls without a timeout keep the server's defaults.
+    """
+    session_class = type("StatementTimeoutSession", (base_class,), {})
+
+    def _apply(session: Session, transaction: SessionTransaction, conn: Connection) -> None:
+        timeout = _statement_timeout(default, overrides)
+        if timeout is not None:
+            _apply_statement_timeout(conn, timeout)
+
+    event.listen(session_class, "after_begin", _apply)
+    return session_class
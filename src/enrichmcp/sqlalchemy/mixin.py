@@ -153,6 +153,7 @@ def _sqlalchemy_type_to_python(sa_type: TypeEngine) -> type[Any]:
     """
     # Import here to avoid circular dependencies
     from datetime import date, datetime, time
+    from uuid import UUID
 
     from sqlalchemy import (
         JSON,
@@ -166,6 +167,7 @@ def _sqlalchemy_type_to_python(sa_type: TypeEngine) -> type[Any]:
         String,
         Text,
         Time,
+        Uuid,
     )
 
     type_map = {
@@ -180,6 +182,7 @@ def _sqlalchemy_type_to_python(sa_type: TypeEngine) -> type[Any]:
         JSON: dict,
         LargeBinary: bytes,
         BigInteger: int,
+        Uuid: UUID,
     }
 
     # Check for exact type matches first
@@ -0,0 +1,112 @@
+"""Read-replica routing for SQLAlchemy sessions.
+
+Sessions created for retriever and resolver tools read from a replica; all
+other sessions, and any session that has flushed changes, use the primary.
+Once a tool call writes, every later session in the same call stays on the
+primary so it reads its own writes.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from enrichmcp.tool import ToolKind
+
+from .session import current_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+ReplicaStrategy = Literal["round_robin", "least_connections"]
+
+READ_KINDS = frozenset({ToolKind.RETRIEVER, ToolKind.RESOLVER})
+
+
+class RoutingSession(Session):
+    """Session that sends reads to ``info["replica"]`` until it writes."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Engine | Connection:
+        replica = self.info.get("replica")
+        if replica is None or self._flushing or self.info.get("wrote"):
+            return super().get_bind(mapper, clause=clause, **kw)
+        if isinstance(clause, Insert | Update | Delete):
+            self._mark_written()
+            return super().get_bind(mapper, clause=clause, **kw)
+        return replica
+
+    def flush(self, objects: Any = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            self._mark_written()
+        super().flush(objects)
+
+    def close(self) -> None:
+        super().close()
+        router = self.info.pop("router", None)
+        if router is not None:
+            router.release(self.info["replica"])
+
+    def _mark_written(self) -> None:
+        self.info["wrote"] = True
+        scope = self.info.get("scope")
+        if scope is not None:
+            scope.wrote = True
+
+
+class ReplicaRouter:
+    """Session factory that routes read-only tool calls to replica engines.
+
+    Instances are callable like an ``async_sessionmaker`` and are what
+    :func:`sqlalchemy_lifespan` yields as ``session_factory`` when replicas
+    are configured.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        *,
+        strategy: ReplicaStrategy = "round_robin",
+        sync_session_class: type[RoutingSession] = RoutingSession,
+        **session_kwargs: Any,
+    ) -> None:
+        if strategy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.in_use: dict[Engine, int] = {r.sync_engine: 0 for r in self.replicas}
+        self._cycle = itertools.cycle(self.in_use)
+        self._sessionmaker = async_sessionmaker(
+            primary,
+            class_=AsyncSession,
+            sync_session_class=sync_session_class,
+            **session_kwargs,
+        )
+
+    def __call__(self, **kw: Any) -> AsyncSession:
+        scope = current_scope()
+        info: dict[str, Any] = {"scope": scope}
+        if self.replicas and scope is not None and scope.kind in READ_KINDS and not scope.wrote:
+            info["replica"] = self._acquire()
+            info["router"] = self
+        return self._sessionmaker(info=info, **kw)
+
+    def _acquire(self) -> Engine:
+        if self.strategy == "least_connections":
+            replica = min(self.in_use, key=self.in_use.__getitem__)
+        else:
+            replica = next(self._cycle)
+        self.in_use[replica] += 1
+        return replica
+
+    def release(self, replica: Engine) -> None:
+        """Return a replica slot taken by a closed session."""
+        self.in_use[replica] -= 1
@@ -0,0 +1,158 @@
+"""Request-scoped ``AsyncSession`` sharing for SQLAlchemy tools.
+
+Every tool call runs inside a session scope. The first resolver that asks for
+a session opens it lazily; nested resolver calls made during the same tool
+call reuse it, and it is closed when the tool call completes. This keeps a
+custom retriever that calls several generated resolvers on a single pooled
+connection instead of checking out one per resolver.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from fastmcp import Context
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from enrichmcp import EnrichMCP
+    from enrichmcp.tool import ToolKind
+
+
+class _ScopedSession:
+    """A lazily opened session and the task currently using it."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.owner: asyncio.Task[Any] | None = None
+        self.depth = 0
+
+
+class SessionScope:
+    """Sessions opened during a single tool call, keyed by lifespan key.
+
+    ``name`` and ``kind`` describe the tool being called, when known, and
+    ``wrote`` is set once any session in the scope has flushed changes.
+    Session factories use them to route reads and pick statement timeouts.
+    """
+
+    def __init__(self, kind: ToolKind | None = None, name: str | None = None) -> None:
+        self.kind = kind
+        self.name = name
+        self.wrote = False
+        self._sessions: dict[str, _ScopedSession] = {}
+
+    async def close(self) -> None:
+        sessions, self._sessions = self._sessions, {}
+        for scoped in sessions.values():
+            await scoped.session.close()
+
+    @asynccontextmanager
+    async def session(self, ctx: Context, session_key: str) -> AsyncIterator[AsyncSession]:
+        """Yield the shared session for ``session_key``.
+
+        An ``AsyncSession`` must not be used by two tasks at once, so a
+        concurrent resolver (e.g. one started through ``app.gather``) gets a
+        private session while the shared one is busy.
+        """
+        task = asyncio.current_task()
+        scoped = self._sessions.get(session_key)
+        if scoped is not None and scoped.depth and scoped.owner is not task:
+            async with _session_factory(ctx, session_key)() as session:
+                yield session
+            return
+
+        if scoped is None:
+            scoped = _ScopedSession(_session_factory(ctx, session_key)())
+            self._sessions[session_key] = scoped
+
+        scoped.owner = task
+        scoped.depth += 1
+        try:
+            yield scoped.session
+        finally:
+            scoped.depth -= 1
+            if not scoped.depth:
+                scoped.owner = None
+
+
+_current_scope: ContextVar[SessionScope | None] = ContextVar(
+    "enrichmcp_session_scope",
+    default=None,
+)
+
+
+def _session_factory(ctx: Context, session_key: str) -> Any:
+    if ctx.request_context is None:
+        raise RuntimeError("No request context available")
+    return ctx.request_context.lifespan_context[session_key]
+
+
+def current_scope() -> SessionScope | None:
+    """Return the active :class:`SessionScope`, if any."""
+    return _current_scope.get()
+
+
+@asynccontextmanager
+async def session_scope(
+    kind: ToolKind | None = None,
+    name: str | None = None,
+) -> AsyncIterator[SessionScope]:
+    """Enter a session scope, reusing the active one when nested."""
+    scope = _current_scope.get()
+    if scope is not None:
+        yield scope
+        return
+
+    scope = SessionScope(kind, name)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        await scope.close()
+
+
+@asynccontextmanager
+async def tool_session(
+    ctx: Context,
+    session_key: str = "session_factory",
+) -> AsyncIterator[AsyncSession]:
+    """Yield the session for the current tool call.
+
+    Outside of a scope (for example when a resolver is called directly in a
+    test) a scope is opened for the duration of the block.
+    """
+    async with session_scope() as scope, scope.session(ctx, session_key) as session:
+        yield session
+
+
+class SessionScopeMiddleware(Middleware):
+    """Run every tool call on ``app`` inside a :func:`session_scope`."""
+
+    def __init__(self, app: EnrichMCP) -> None:
+        self.app = app
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        name = context.message.name
+        tool_def = self.app.tool_defs.get(name)
+        async with session_scope(tool_def.kind if tool_def else None, name):
+            return await call_next(context)
+
+
+def install_session_scope(app: EnrichMCP) -> None:
+    """Add :class:`SessionScopeMiddleware` to ``app`` if it is not already installed."""
+    if not any(isinstance(m, SessionScopeMiddleware) for m in app.mcp.middleware):
+        app.mcp.add_middleware(SessionScopeMiddleware(app))
@@ -0,0 +1,95 @@
+"""Streaming support for generated SQLAlchemy tools.
+
+Rows are read through a server-side cursor in chunks of ``chunk_size`` and
+each chunk is sent to the client as an MCP progress notification whose
+message is a JSON array of entities. The next chunk is not fetched until the
+previous notification has been written, so memory stays bounded by one chunk
+and a slow client slows the cursor down rather than filling a buffer.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+    from fastmcp import Context
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 1000
+INLINE_LIMIT = 500
+
+
+class StreamResult(BaseModel, Generic[T]):
+    """Summary returned once a stream has finished."""
+
+    count: int = Field(description="Number of items produced")
+    streamed: bool = Field(
+        description="Whether items were sent as progress notifications instead of inline",
+    )
+    items: list[T] = Field(
+        default_factory=list,
+        description="Items, only when the client did not request progress notifications",
+    )
+    truncated: bool = Field(
+        default=False,
+        description="Whether inline items were cut off; request progress to stream all rows",
+    )
+
+
+def progress_requested(ctx: Context) -> bool:
+    """Return whether the client supplied a progress token for this request."""
+    meta = ctx.request_context.meta if ctx.request_context else None
+    return getattr(meta, "progressToken", None) is not None
+
+
+async def stream_entities(
+    ctx: Context,
+    session: AsyncSession,
+    stmt: Select[Any],
+    convert: Callable[[Any], BaseModel],
+    *,
+    limit: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    inline_limit: int = INLINE_LIMIT,
+) -> StreamResult[Any]:
+    """Run ``stmt`` and stream up to ``limit`` converted rows to the client."""
+    if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}")
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be >= 1")
+
+    if not progress_requested(ctx):
+        cap = inline_limit if limit is None else min(limit, inline_limit)
+        result = await session.execute(stmt.limit(cap + 1))
+        rows = result.scalars().all()
+        items = [convert(row) for row in rows[:cap]]
+        return StreamResult(
+            count=len(items),
+            streamed=False,
+            items=items,
+            truncated=len(rows) > cap and (limit is None or limit > inline_limit),
+        )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    count = 0
+    result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+    # partitions() is an async generator; SQLAlchemy annotates it as a coroutine
+    partitions = cast(
+        "AsyncIterator[Sequence[Any]]",
+        result.scalars().partitions(chunk_size),
+    )
+    async for partition in partitions:
+        chunk = [convert(row).model_dump(mode="json") for row in partition]
+        count += len(chunk)
+        await ctx.report_progress(count, None, json.dumps(chunk))
+    return StreamResult(count=count, streamed=True)
@@ -0,0 +1,10 @@
+"""Raw SQL integration for SQLite via aiosqlite.
+
+This module provides a read-connection pool and generated tools for entities
+stored in SQLite tables, without going through an ORM.
+"""
+
+from .auto import TableMapping, include_sqlite_entity
+from .pool import SQLitePool, sqlite_lifespan
+
+__all__ = ["SQLitePool", "TableMapping", "include_sqlite_entity", "sqlite_lifespan"]
@@ -0,0 +1,161 @@
+"""Automatic tool registration for entities stored in SQLite tables."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from fastmcp import Context
+
+from enrichmcp.context import get_enrich_context
+from enrichmcp.pagination import PageResult
+from enrichmcp.tool import make_tool_function
+
+if TYPE_CHECKING:
+    from enrichmcp.app import EnrichMCP
+
+    from .pool import SQLitePool
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+@dataclass
+class TableMapping:
+    """Precompiled SQL and row conversion for one entity.
+
+    The SQL text for every generated tool is built once so SQLite's
+    per-connection statement cache can reuse the prepared statements, and rows
+    are fetched as plain tuples whose positions are mapped to entity fields up
+    front.
+    """
+
+    entity: type
+    table: str
+    primary_key: str = "id"
+    columns: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.columns:
+            self.columns = {
+                name: name
+                for name in self.entity.model_fields
+                if name not in self.entity.relationship_fields()
+            }
+        if self.primary_key not in self.columns:
+            raise ValueError(
+                f"Primary key '{self.primary_key}' is not a field of {self.entity.__name__}"
+            )
+        self.fields = tuple(self.columns)
+        select_list = ", ".join(_quote(col) for col in self.columns.values())
+        table = _quote(self.table)
+        pk = _quote(self.columns[self.primary_key])
+        self.select_sql = f"SELECT {select_list} FROM {table}"
+        self.get_sql = f"{self.select_sql} WHERE {pk} = ?"
+        # ``json_each`` keeps a single statement for any number of IDs.
+        self.by_ids_sql = f"{self.select_sql} WHERE {pk} IN (SELECT value FROM json_each(?))"
+        self.page_sql = f"{self.select_sql} ORDER BY {pk} LIMIT ? OFFSET ?"
+
+    def to_entity(self, row: Any) -> Any:
+        """Convert a row tuple into the mapped entity."""
+        return self.entity.model_validate(dict(zip(self.fields, row, strict=True)))
+
+    async def get(self, pool: SQLitePool, entity_id: Any) -> Any | None:
+        """Fetch a single entity by primary key."""
+        row = await pool.fetchone(self.get_sql, (entity_id,))
+        return self.to_entity(row) if row is not None else None
+
+    async def by_ids(self, pool: SQLitePool, ids: list[Any]) -> list[Any]:
+        """Fetch entities for ``ids`` in the order the IDs were given."""
+        rows = await pool.fetchall(self.by_ids_sql, (json.dumps(ids),))
+        index = self.fields.index(self.primary_key)
+        by_pk = {row[index]: row for row in rows}
+        return [self.to_entity(by_pk[i]) for i in dict.fromkeys(ids) if i in by_pk]
+
+    async def page(self, pool: SQLitePool, page: int, page_size: int) -> PageResult[Any]:
+        """Return one page of entities ordered by primary key."""
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be >= 1")
+        rows = await pool.fetchall(self.page_sql, (page_size + 1, (page - 1) * page_size))
+        return PageResult.create(
+            items=[self.to_entity(row) for row in rows[:page_size]],
+            page=page,
+            page_size=page_size,
+            has_next=len(rows) > page_size,
+            total_items=None,
+        )
+
+
+def include_sqlite_entity(
+    app: EnrichMCP,
+    entity: type,
+    *,
+    table: str,
+    primary_key: str = "id",
+    columns: dict[str, str] | None = None,
+    pool_key: str = "sqlite_pool",
+) -> TableMapping:
+    """Register ``get``, ``list`` and ``by_ids`` tools for ``entity`` on ``app``.
+
+    ``columns`` maps entity field names to column names when they differ and
+    defaults to every non-relationship field. The tools read from the
+    :class:`~enrichmcp.sqlite.SQLitePool` stored under ``pool_key`` in the
+    lifespan context.
+    """
+    mapping = TableMapping(entity, table, primary_key, dict(columns or {}))
+    model_name = entity.__name__.lower()
+    param_name = f"{model_name}_id"
+    get_name = f"get_{model_name}"
+    by_ids_name = f"get_{model_name}s_by_ids"
+    list_name = f"list_{model_name}s"
+    pk_type = entity.model_fields[primary_key].annotation or Any
+
+    def _pool(ctx: Context | None) -> Any:
+        if ctx is None:
+            ctx = get_enrich_context()
+        if ctx.request_context is None:
+            raise RuntimeError("No request context available")
+        return ctx.request_context.lifespan_context[pool_key]
+
+    async def get_one(entity_id: Any, ctx: Context | None) -> Any:
+        return await mapping.get(_pool(ctx), entity_id)
+
+    async def get_many(ids: list[Any], ctx: Context | None) -> list[Any]:
+        return await mapping.by_ids(_pool(ctx), ids)
+
+    async def list_page(page: int, page_size: int, ctx: Context | None) -> PageResult[Any]:
+        return await mapping.page(_pool(ctx), page, page_size)
+
+    ctx_param = ("ctx", Context | None, None)
+    tools = {
+        get_name: make_tool_function(
+            get_one,
+            name=get_name,
+            parameters=[(param_name, pk_type), ctx_param],
+            returns=entity | None,
+        ),
+        by_ids_name: make_tool_function(
+            get_many,
+            name=by_ids_name,
+            parameters=[("ids", list[pk_type]), ctx_param],  # type: ignore[valid-type]
+            returns=list[entity],  # type: ignore[valid-type]
+        ),
+        list_name: make_tool_function(
+            list_page,
+            name=list_name,
+            parameters=[("page", int, 1), ("page_size", int, 20), ctx_param],
+            returns=PageResult[entity],  # type: ignore[valid-type]
+        ),
+    }
+
+    name = entity.__name__
+    app.retrieve(name=get_name, description=f"Get a single {name} by ID")(tools[get_name])
+    app.retrieve(
+        name=by_ids_name,
+        description=f"Get several {name} records by ID in one call",
+    )(tools[by_ids_name])
+    app.retrieve(name=list_name, description=f"List {name} records")(tools[list_name])
+    return mapping
@@ -0,0 +1,142 @@
+"""Connection pool for aiosqlite databases."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from enrichmcp.app import EnrichMCP
+
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+
+class SQLitePool:
+    """A single writer connection plus a pool of read-only connections.
+
+    Every aiosqlite connection runs on its own thread, so spreading reads over
+    several connections lets independent queries execute in parallel instead
+    of queueing behind one another. File databases are switched to WAL mode so
+    readers never block on the writer. ``:memory:`` databases cannot be shared
+    between connections and therefore use the writer for reads as well.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        *,
+        readers: int = 4,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        connect_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        if readers < 0:
+            raise ValueError("readers must be >= 0")
+        self.database = database
+        self.readers = 0 if database == ":memory:" else readers
+        self.statement_cache_size = statement_cache_size
+        self.connect_kwargs = connect_kwargs or {}
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(
+            self.database,
+            cached_statements=self.statement_cache_size,
+            **self.connect_kwargs,
+        )
+        self._connections.append(conn)
+        return conn
+
+    async def open(self) -> None:
+        """Open the writer and all reader connections."""
+        self._writer = await self._connect()
+        if self.readers:
+            await self._writer.execute("PRAGMA journal_mode=WAL")
+        for _ in range(self.readers):
+            conn = await self._connect()
+            await conn.execute("PRAGMA query_only=1")
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection owned by the pool."""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+        self._writer = None
+        self._idle = asyncio.Queue()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        if self._writer is None:
+            raise RuntimeError("SQLitePool is not open")
+        if not self.readers:
+            async with self.write() as conn:
+                yield conn
+            return
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection exclusively for the duration of the block."""
+        if self._writer is None:
+            raise RuntimeError("SQLitePool is not open")
+        async with self._write_lock:
+            yield self._writer
+
+    async def fetchall(self, sql: str, parameters: Any = ()) -> list[Any]:
+        """Run ``sql`` on a reader and return all rows as tuples."""
+        async with self.read() as conn:
+            return list(await conn.execute_fetchall(sql, parameters))
+
+    async def fetchone(self, sql: str, parameters: Any = ()) -> Any | None:
+        """Run ``sql`` on a reader and return the first row or ``None``."""
+        async with self.read() as conn, conn.execute(sql, parameters) as cursor:
+            return await cursor.fetchone()
+
+
+def sqlite_lifespan(
+    database: str,
+    *,
+    readers: int = 4,
+    statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    setup: Callable[[aiosqlite.Connection], Awaitable[None]] | None = None,
+    pool_key: str = "sqlite_pool",
+    connect_kwargs: dict[str, Any] | None = None,
+) -> Callable[[EnrichMCP], Any]:
+    """Create a lifespan that opens a :class:`SQLitePool` for ``database``.
+
+    ``setup`` runs on the writer connection before the server starts and is
+    committed afterwards, which is useful for creating tables or seeding data.
+    """
+
+    @asynccontextmanager
+    async def _lifespan(app: EnrichMCP) -> AsyncIterator[dict[str, Any]]:
+        pool = SQLitePool(
+            database,
+            readers=readers,
+            statement_cache_size=statement_cache_size,
+            connect_kwargs=connect_kwargs,
+        )
+        await pool.open()
+        try:
+            if setup is not None:
+                async with pool.write() as conn:
+                    await setup(conn)
+                    await conn.commit()
+            yield {pool_key: pool}
+        finally:
+            await pool.close()
+
+    return _lifespan
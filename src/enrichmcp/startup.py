@@ -0,0 +1,113 @@
+"""Startup profiling and deferred tool registration.
+
+Turning a function into a FastMCP tool generates its argument and output
+JSON schemas, which dominates startup for schemas with hundreds of models.
+With ``EnrichMCP(..., lazy_tools=True)`` tools are queued instead and built
+on the first ``tools/list`` request, or one at a time on the first call of a
+tool. The decorators then return a :class:`PendingTool`, which builds its
+tool when one of its attributes is read. :class:`StartupProfile` records
+where startup time was spent.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+    from fastmcp.tools import FunctionTool
+
+    from .app import EnrichMCP
+
+
+class StartupProfile:
+    """Wall-clock time spent in each startup phase.
+
+    Phases may nest; a phase's time excludes the time of phases nested in
+    it, so the totals add up to the overall time measured.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self._nested: list[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the time spent in the block to ``name``."""
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed - nested
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def report(self) -> str:
+        """Return a table of phases, slowest first."""
+        width = max((len(name) for name in self.seconds), default=5)
+        lines = [f"{'phase':<{width}}  {'seconds':>9}  {'count':>6}"]
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<{width}}  {seconds:>9.3f}  {self.counts[name]:>6}")
+        lines.append(f"{'total':<{width}}  {self.total:>9.3f}")
+        return "\n".join(lines)
+
+
+class PendingTool:
+    """Stand-in for the ``FunctionTool`` of a tool queued by ``lazy_tools``.
+
+    Reading an attribute, such as ``fn`` or ``parameters``, builds the tool
+    and forwards to it, so decorated functions behave the same with and
+    without ``lazy_tools``. Only ``isinstance`` checks tell them apart.
+    """
+
+    def __init__(self, app: EnrichMCP, name: str) -> None:
+        self._app = app
+        self._name = name
+
+    def _tool(self) -> FunctionTool:
+        self._app.register_pending_tools([self._name])
+        return self._app.resources[self._name]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tool(), name)
+
+    def __repr__(self) -> str:
+        return f"PendingTool({self._name!r})"
+
+
+class LazyToolsMiddleware(Middleware):
+    """Build tools queued on ``app`` when they are first listed or called."""
+
+    def __init__(self, app: EnrichMCP) -> None:
+        self.app = app
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        self.app.register_pending_tools()
+        return await call_next(context)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        self.app.register_pending_tools([context.message.name])
+        return await call_next(context)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover - for type checking only
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from .admission import ConcurrencyLimit
     from .app import EnrichMCP
+    from .encoding import Encoding
+    from .executors import Executor
+    from .limits import ResultLimits
 
 
 class ToolKind(str, Enum):
@@ -25,6 +32,10 @@ class ToolDef:
     kind: ToolKind
     name: str
     description: str
+    limits: ResultLimits | None = None
+    encoding: Encoding | None = None
+    executor: Executor | None = None
+    concurrency: ConcurrencyLimit | None = None
 
     def final_description(self, app: EnrichMCP) -> str:
         """Return the description with standard usage prefix."""
@@ -34,3 +45,46 @@ class ToolDef:
             "and keep its response in context before using this tool."
         )
         return f"{prefix} {self.description}".strip()
+
+
+def make_tool_function(
+    impl: Callable[..., Awaitable[Any]],
+    *,
+    name: str,
+    parameters: Sequence[tuple[str, Any] | tuple[str, Any, Any]],
+    returns: Any,
+    doc: str | None = None,
+) -> Callable[..., Awaitable[Any]]:
+    """Return an async function named ``name`` with a synthesized signature.
+
+    ``parameters`` are ``(name, annotation)`` or ``(name, annotation,
+    default)`` tuples. FastMCP reads the tool schema from the resulting
+    ``__signature__`` and ``__annotations__``; calls are bound against that
+    signature, defaults applied, and forwarded positionally to ``impl``. This
+    lets generated tools use per-model parameter names such as ``user_id``
+    without generating source code.
+    """
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(
+                param[0],
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=param[1],
+                default=param[2] if len(param) > 2 else inspect.Parameter.empty,
+            )
+            for param in parameters
+        ],
+        return_annotation=returns,
+    )
+
+    async def tool(*args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return await impl(*bound.args)
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    tool.__signature__ = signature  # type: ignore[attr-defined]
+    tool.__annotations__ = {param[0]: param[1] for param in parameters}
+    tool.__annotations__["return"] = returns
+    return tool
@@ -0,0 +1,133 @@
+"""Optional OpenTelemetry tracing.
+
+When ``opentelemetry-api`` is installed enrichmcp emits spans for tool calls
+(tagged with the :class:`~enrichmcp.tool.ToolKind`), ``ContextCache.get_or_set``
+(with a hit/miss attribute), SQLAlchemy statements run on engines managed by
+:func:`~enrichmcp.sqlalchemy.sqlalchemy_lifespan`, and lifespan startup.
+Like any instrumented library, the spans are no-ops until the application
+configures an OpenTelemetry SDK ``TracerProvider``.
+
+A W3C ``traceparent``/``tracestate`` sent in the ``_meta`` of an MCP request
+becomes the parent of the tool call span, so server spans join the agent's
+trace.
+"""
+
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+
+    from .app import EnrichMCP
+
+TRACER_NAME = "enrichmcp"
+
+_tracer_provider: Any = None
+
+
+@functools.cache
+def _opentelemetry() -> tuple[Any, Any] | None:
+    """Import the OpenTelemetry ``propagate`` and ``trace`` modules on first use.
+
+    Importing them takes several milliseconds, which ``import enrichmcp``
+    should not pay for until a span is started.
+    """
+    try:  # pragma: no cover - optional dependency
+        from opentelemetry import propagate, trace
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return propagate, trace
+
+
+def tracing_available() -> bool:
+    """Return whether the OpenTelemetry API is installed, without importing it."""
+    return find_spec("opentelemetry") is not None
+
+
+def set_tracer_provider(provider: Any) -> None:
+    """Use ``provider`` for enrichmcp spans instead of the global provider."""
+    global _tracer_provider
+    _tracer_provider = provider
+
+
+def get_tracer() -> Any:
+    """Return the enrichmcp tracer, or ``None`` without OpenTelemetry."""
+    opentelemetry = _opentelemetry()
+    if opentelemetry is None:
+        return None
+    _, trace = opentelemetry
+    return trace.get_tracer(TRACER_NAME, tracer_provider=_tracer_provider)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    *,
+    context: Any = None,
+    server: bool = False,
+) -> Iterator[Any]:
+    """Run the block in a span named ``name``; yields ``None`` without OpenTelemetry."""
+    opentelemetry = _opentelemetry()
+    if opentelemetry is None:
+        yield None
+        return
+    _, trace = opentelemetry
+    tracer = trace.get_tracer(TRACER_NAME, tracer_provider=_tracer_provider)
+    kind = trace.SpanKind.SERVER if server else trace.SpanKind.INTERNAL
+    with tracer.start_as_current_span(
+        name,
+        context=context,
+        kind=kind,
+        attributes=attributes,
+    ) as span:
+        yield span
+
+
+def extract_context(carrier: Mapping[str, Any] | None) -> Any:
+    """Return the trace context propagated in ``carrier`` (e.g. MCP request ``_meta``)."""
+    opentelemetry = _opentelemetry()
+    if opentelemetry is None or not carrier:
+        return None
+    propagate, _ = opentelemetry
+    return propagate.extract({k: v for k, v in carrier.items() if isinstance(v, str)})
+
+
+class TracingMiddleware(Middleware):
+    """Wrap every tool call on ``app`` in a server span."""
+
+    def __init__(self, app: EnrichMCP) -> None:
+        self.app = app
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        name = context.message.name
+        tool_def = self.app.tool_defs.get(name)
+        attributes = {"mcp.method.name": "tools/call", "mcp.tool.name": name}
+        if tool_def is not None:
+            attributes["enrichmcp.tool.kind"] = tool_def.kind.value
+
+        meta = None
+        fastmcp_context = context.fastmcp_context
+        if fastmcp_context is not None and fastmcp_context.request_context is not None:
+            meta = fastmcp_context.request_context.meta
+        carrier = meta.model_dump() if meta is not None else None
+
+        with start_span(
+            f"tools/call {name}",
+            attributes,
+            context=extract_context(carrier),
+            server=True,
+        ):
+            return await call_next(context)
@@ -0,0 +1,332 @@
+"""Pre-fork multi-worker serving for the streamable HTTP transport.
+
+``app.run(transport="streamable-http", workers=N)`` binds the listening
+socket once and forks ``N`` worker processes that accept connections from it.
+Each worker runs its own event loop and its own lifespan, so engines and
+pools opened by :func:`~enrichmcp.sqlalchemy.sqlalchemy_lifespan` (alone or
+inside :func:`~enrichmcp.combine_lifespans`) are per worker. One-time setup
+such as ``create_all`` and ``seed`` runs only in the first worker, which
+starts before the others are forked; lifespans can check
+:func:`runs_setup` for the same purpose.
+
+MCP sessions live in the memory of the worker that created them. Workers
+prefix the ``Mcp-Session-Id`` they issue with their index, and a request that
+reaches a different worker is forwarded to the owner over its private Unix
+socket (:class:`SessionAffinityMiddleware`). Pass ``stateless_http=True`` to
+skip sessions altogether. Caches are per worker unless the app uses a shared
+backend such as :class:`~enrichmcp.cache.RedisCache`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+import warnings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import httpx
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+    from .app import EnrichMCP
+    from .compression import Compression
+
+logger = logging.getLogger(__name__)
+
+SESSION_HEADER = b"mcp-session-id"
+
+_HOP_BY_HOP = {
+    b"connection",
+    b"keep-alive",
+    b"transfer-encoding",
+    b"content-length",
+    b"upgrade",
+}
+
+# Set in each worker process after fork
+_worker: int | None = None
+_setup = True
+
+
+def current_worker() -> int | None:
+    """Return the index of this worker process, or ``None`` outside a worker pool."""
+    return _worker
+
+
+def runs_setup() -> bool:
+    """Return whether one-time startup work such as creating tables belongs to this process.
+
+    True outside a worker pool and in the first worker a pool starts; false
+    in the other workers and in workers restarted after a crash.
+    """
+    return _setup
+
+
+class SessionAffinityMiddleware:
+    """Route requests of a stateful MCP session to the worker that owns it.
+
+    ``peers`` holds, for every worker index, the Unix socket path or httpx
+    transport used to reach that worker.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        worker: int,
+        peers: Sequence[str | httpx.AsyncBaseTransport],
+    ) -> None:
+        self.app = app
+        self.worker = worker
+        self.peers = peers
+        self._clients: dict[int, httpx.AsyncClient] = {}
+        self._prefix = f"{worker}-".encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        session = next((value for key, value in headers if key.lower() == SESSION_HEADER), None)
+        if session is not None:
+            owner, _, local_id = session.partition(b"-")
+            if owner.isdigit() and local_id and int(owner) < len(self.peers):
+                if int(owner) != self.worker:
+                    await self._forward(int(owner), scope, receive, send)
+                    return
+                scope = {
+                    **scope,
+                    "headers": [
+                        (key, local_id if key.lower() == SESSION_HEADER else value)
+                        for key, value in headers
+                    ],
+                }
+
+        async def send_with_owner(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        (key, self._prefix + value if key.lower() == SESSION_HEADER else value)
+                        for key, value in message.get("headers", [])
+                    ],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_owner)
+
+    def _client(self, worker: int) -> httpx.AsyncClient:
+        client = self._clients.get(worker)
+        if client is None:
+            import httpx
+
+            peer = self.peers[worker]
+            transport = httpx.AsyncHTTPTransport(uds=peer) if isinstance(peer, str) else peer
+            client = httpx.AsyncClient(transport=transport, base_url="http://worker", timeout=None)
+            self._clients[worker] = client
+        return client
+
+    async def _forward(self, worker: int, scope: Scope, receive: Receive, send: Send) -> None:
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        path = scope.get("raw_path") or scope["path"].encode()
+        if scope.get("query_string"):
+            path += b"?" + scope["query_string"]
+        client = self._client(worker)
+        request = client.build_request(
+            scope["method"],
+            path.decode("latin-1"),
+            headers=[(k, v) for k, v in scope["headers"] if k.lower() not in _HOP_BY_HOP],
+            content=bytes(body),
+        )
+        response = await client.send(request, stream=True)
+        try:
+            headers = [(k, v) for k, v in response.headers.raw if k.lower() not in _HOP_BY_HOP]
+            await send(
+                {"type": "http.response.start", "status": response.status_code, "headers": headers}
+            )
+            # Raw bytes keep the owner's content encoding intact
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            await response.aclose()
+
+
+def serve_workers(
+    app: EnrichMCP,
+    *,
+    workers: int,
+    host: str | None = None,
+    port: int | None = None,
+    path: str | None = None,
+    json_response: bool | None = None,
+    stateless_http: bool | None = None,
+    middleware: list[Any] | None = None,
+    log_level: str | None = None,
+    uvicorn_config: dict[str, Any] | None = None,
+    compression: bool | Compression = False,
+    show_banner: bool = True,
+) -> None:
+    """Serve ``app`` over streamable HTTP from ``workers`` forked processes.
+
+    Blocks until SIGINT or SIGTERM, restarting workers that exit unexpectedly.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Multiple workers require a platform with os.fork")
+
+    import fastmcp
+    import uvicorn
+    from starlette.middleware import Middleware
+
+    from .cache import MemoryCache
+
+    if isinstance(app.cache_backend, MemoryCache):
+        warnings.warn(
+            "MemoryCache is not shared between workers; use RedisCache to share "
+            "cached values and truncated result pages",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    # Build every tool once so workers share the schemas copy-on-write
+    app.register_pending_tools()
+
+    listener = socket.create_server(
+        (host or fastmcp.settings.host, port or fastmcp.settings.port),
+        backlog=2048,
+    )
+    directory = tempfile.mkdtemp(prefix="enrichmcp-workers-")
+    peers = [os.path.join(directory, f"worker-{index}.sock") for index in range(workers)]
+
+    def run_worker(index: int, ready: int) -> None:
+        asgi_middleware = list(middleware or [])
+        if not stateless_http:
+            asgi_middleware.insert(
+                0,
+                Middleware(SessionAffinityMiddleware, worker=index, peers=peers),
+            )
+        asgi = app.http_app(
+            compression=compression,
+            path=path,
+            json_response=json_response,
+            stateless_http=stateless_http,
+            middleware=asgi_middleware,
+            transport="streamable-http",
+        )
+        # Same defaults as FastMCP.run_http_async
+        config_kwargs: dict[str, Any] = {"timeout_graceful_shutdown": 0, "lifespan": "on"}
+        config_kwargs.update(uvicorn_config or {})
+        if "log_config" not in config_kwargs and "log_level" not in config_kwargs:
+            config_kwargs["log_level"] = (log_level or fastmcp.settings.log_level).lower()
+        config = uvicorn.Config(asgi, **config_kwargs)
+        server = uvicorn.Server(config)
+        private = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(peers[index]):
+            os.unlink(peers[index])
+        private.bind(peers[index])
+        private.listen(128)
+
+        async def serve() -> None:
+            async def announce() -> None:
+                try:
+                    while not server.started:
+                        await asyncio.sleep(0.01)
+                    with contextlib.suppress(BrokenPipeError):
+                        os.write(ready, b"1")
+                finally:
+                    os.close(ready)
+
+            task = asyncio.create_task(announce())
+            try:
+                await server.serve(sockets=[listener, private])
+            finally:
+                task.cancel()
+
+        asyncio.run(serve())
+
+    children: dict[int, int] = {}
+    stopping = False
+
+    def spawn(index: int, setup: bool) -> int:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            global _worker, _setup
+            _worker, _setup = index, setup
+            os.close(read)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(index, write)
+            except BaseException:
+                logger.exception("Worker %d failed", index)
+                code = 1
+            finally:
+                os._exit(code)
+        os.close(write)
+        children[pid] = index
+        return read
+
+    def started(ready: int) -> bool:
+        """Wait until the worker owning ``ready`` serves or exits."""
+        with os.fdopen(ready, "rb") as pipe:
+            return bool(pipe.read(1))
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        # The first worker runs one-time setup before the others start
+        for index in range(workers):
+            if not started(spawn(index, setup=index == 0)) and not stopping:
+                stop(signal.SIGTERM, None)
+                raise RuntimeError(f"Worker {index} failed to start")
+            if stopping:
+                break
+        if show_banner:
+            logger.info("Serving %s with %d workers", app.title, workers)
+
+        while children:
+            pid, status = os.wait()
+            index = children.pop(pid, None)
+            if index is None or stopping:
+                continue
+            logger.warning("Worker %d exited with status %d; restarting", index, status)
+            time.sleep(0.5)
+            # A worker that fails to start is reaped and restarted by this loop
+            started(spawn(index, setup=False))
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        for pid in children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        while children:
+            pid, _ = os.wait()
+            children.pop(pid, None)
+        listener.close()
+        shutil.rmtree(directory, ignore_errors=True)
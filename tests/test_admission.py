@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from enrichmcp import ConcurrencyLimit, EnrichMCP, ToolKind
+from enrichmcp.errors import ToolOverloadedError
+
+
+def create_app(release: asyncio.Event, **kwargs) -> EnrichMCP:
+    app = EnrichMCP("Admission API", instructions="desc", **kwargs)
+
+    @app.retrieve(
+        description="Expensive report",
+        concurrency=ConcurrencyLimit(max_concurrent=1, max_waiting=1, wait_timeout=0.05),
+    )
+    async def report() -> str:
+        await release.wait()
+        return "done"
+
+    @app.retrieve(description="Aggregate")
+    async def aggregate() -> str:
+        await release.wait()
+        return "done"
+
+    @app.retrieve(description="Cheap lookup")
+    async def lookup() -> str:
+        return "found"
+
+    @app.create(description="Create a thing")
+    async def create_thing() -> str:
+        return "created"
+
+    return app
+
+
+def overloaded(error: ToolError) -> dict:
+    return json.loads(str(error))
+
+
+@pytest.mark.asyncio
+async def test_tool_limit_queues_then_rejects() -> None:
+    release = asyncio.Event()
+    app = create_app(release)
+    async with Client(app.mcp) as client:
+        first = asyncio.create_task(client.call_tool("report", {}))
+        await asyncio.sleep(0.01)
+
+        # One call may wait for the slot; it gives up after wait_timeout
+        with pytest.raises(ToolError) as waited:
+            await client.call_tool("report", {})
+        assert overloaded(waited.value) == {
+            "error": "tool_overloaded",
+            "tool": "report",
+            "retry_after": 1.0,
+            "message": "Too many concurrent calls of report; retry later",
+        }
+
+        # A waiting call is admitted once the slot frees up
+        second = asyncio.create_task(client.call_tool("report", {}))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolError, match="tool_overloaded"):
+            await client.call_tool("report", {})
+        assert (await client.call_tool("lookup", {})).data == "found"
+
+        release.set()
+        assert (await first).data == "done"
+        assert (await second).data == "done"
+        assert (await client.call_tool("report", {})).data == "done"
+
+
+@pytest.mark.asyncio
+async def test_kind_and_name_limits() -> None:
+    release = asyncio.Event()
+    app = create_app(
+        release,
+        metrics=True,
+        concurrency={
+            ToolKind.RETRIEVER: ConcurrencyLimit(max_concurrent=2, retry_after=5),
+            "aggregate": ConcurrencyLimit(max_concurrent=1),
+        },
+    )
+    async with Client(app.mcp) as client:
+        first = asyncio.create_task(client.call_tool("aggregate", {}))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolError, match='"tool": "aggregate"'):
+            await client.call_tool("aggregate", {})
+
+        second = asyncio.create_task(client.call_tool("report", {}))
+        await asyncio.sleep(0.01)
+        # Both retriever slots are taken
+        with pytest.raises(ToolError) as rejected:
+            await client.call_tool("lookup", {})
+        assert overloaded(rejected.value)["retry_after"] == 5
+        assert (await client.call_tool("create_thing", {})).data == "created"
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert (await client.call_tool("lookup", {})).data == "found"
+
+    assert app.metrics.snapshot()["aggregate"]["errors"] == 1
+
+
+def test_limit_validation() -> None:
+    with pytest.raises(ValueError, match="max_concurrent"):
+        ConcurrencyLimit(max_concurrent=0)
+    error = ToolOverloadedError("report", 2.5)
+    assert isinstance(error, ToolError)
+    assert error.retry_after == 2.5
@@ -0,0 +1,146 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import Field
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from enrichmcp import EnrichMCP, EnrichModel, PageResult
+from enrichmcp.compression import (
+    Compression,
+    CompressionMiddleware,
+    available_encodings,
+    negotiate,
+)
+
+ACCEPT_JSON = "application/json, text/event-stream"
+
+
+def create_app() -> EnrichMCP:
+    app = EnrichMCP("Compression API", instructions="desc")
+
+    @app.entity
+    class Row(EnrichModel):
+        """Row."""
+
+        id: int = Field(description="ID")
+        label: str = Field(description="Label")
+
+    @app.retrieve(description="List rows")
+    async def list_rows(count: int) -> PageResult[Row]:
+        items = [Row(id=i, label=f"row number {i}") for i in range(count)]
+        return PageResult.create(items=items, page=1, page_size=count, has_next=False)
+
+    return app
+
+
+def test_negotiate() -> None:
+    offered = ["zstd", "br", "gzip"]
+    assert negotiate("gzip, deflate", offered) == "gzip"
+    assert negotiate("gzip;q=0.5, zstd", offered) == "zstd"
+    assert negotiate("zstd;q=0, gzip", offered) == "gzip"
+    assert negotiate("*", offered) == "zstd"
+    assert negotiate("identity", offered) is None
+    assert negotiate("", offered) is None
+
+
+def test_unavailable_encoding_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported"):
+        Compression(encodings=["deflate"]).resolved_encodings()
+    if "br" not in available_encodings():
+        with pytest.raises(ImportError, match="brotli"):
+            Compression(encodings=["br"]).resolved_encodings()
+
+
+@pytest.mark.asyncio
+async def test_minimum_size_and_streaming() -> None:
+    async def small(request):
+        return PlainTextResponse("ok")
+
+    async def large(request):
+        return PlainTextResponse("x" * 5000)
+
+    async def stream(request):
+        async def events():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    routes = [Route("/small", small), Route("/large", large), Route("/stream", stream)]
+    asgi = CompressionMiddleware(
+        Starlette(routes=routes),
+        Compression(encodings=["gzip"], minimum_size=100),
+    )
+    transport = httpx.ASGITransport(app=asgi)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        response = await http.get("/small", headers={"accept-encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == "ok"
+
+        response = await http.get("/large", headers={"accept-encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < 100
+        assert response.text == "x" * 5000
+
+        response = await http.get("/stream", headers={"accept-encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+        response = await http.get("/large", headers={"accept-encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", available_encodings())
+async def test_tool_results_are_compressed(encoding) -> None:
+    app = create_app()
+    asgi = app.http_app(compression=Compression(encodings=[encoding]), json_response=True)
+    headers = {"accept": ACCEPT_JSON, "accept-encoding": encoding}
+    call = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/call",
+        "params": {"name": "list_rows", "arguments": {"count": 500}},
+    }
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1"},
+        },
+    }
+
+    transport = httpx.ASGITransport(app=asgi)
+    async with (
+        asgi.router.lifespan_context(asgi),
+        httpx.AsyncClient(transport=transport, base_url="http://test") as http,
+    ):
+        response = await http.post("/mcp", json=initialize, headers=headers)
+        headers["mcp-session-id"] = response.headers["mcp-session-id"]
+        response = await http.post("/mcp", json=call, headers=headers)
+
+    assert response.headers["content-encoding"] == encoding
+    result = json.loads(response.content)["result"]
+    assert len(result["structuredContent"]["items"]) == 500
+    assert int(response.headers["content-length"]) < len(response.content) / 4
+
+
+def test_run_adds_middleware() -> None:
+    app = create_app()
+    with patch.object(app.mcp, "run") as run:
+        app.run(transport="streamable-http", compression=True)
+    (middleware,) = run.call_args.kwargs["middleware"]
+    assert middleware.cls is CompressionMiddleware
+
+    with pytest.raises(ValueError, match="HTTP transport"):
+        app.run(compression=True)
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from enrichmcp import EnrichMCP, gather_bounded
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_preserves_order_and_limits_concurrency():
+    running = 0
+    peak = 0
+
+    async def work(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - i % 5))
+        running -= 1
+        return i
+
+    result = await gather_bounded((work(i) for i in range(10)), limit=3)
+    assert result == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_cancels_on_first_error():
+    cancelled = []
+
+    async def slow(i: int) -> int:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return i
+
+    async def boom() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(RuntimeError, match="boom"):
+        await gather_bounded([slow(1), boom(), slow(2), slow(3)], limit=2)
+    assert 1 in cancelled
+    assert loop.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_timeout_and_validation():
+    with pytest.raises(TimeoutError):
+        await gather_bounded([asyncio.sleep(1)], timeout=0.01)
+    with pytest.raises(ValueError):
+        await gather_bounded([], limit=0)
+    assert await gather_bounded([]) == []
+
+
+@pytest.mark.asyncio
+async def test_app_gather_uses_fanout_limit():
+    app = EnrichMCP("Test", "Desc", fanout_limit=2)
+    running = 0
+    peak = 0
+
+    async def work(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i * 2
+
+    assert await app.gather(work(i) for i in range(5)) == [0, 2, 4, 6, 8]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_app_gather_limit_is_per_call():
+    app = EnrichMCP("Test", "Desc", fanout_limit=2)
+    running = 0
+    peak = 0
+
+    async def work(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    first, second = await asyncio.gather(
+        app.gather(work(i) for i in range(4)),
+        app.gather(work(i) for i in range(4)),
+    )
+    assert first == second == [0, 1, 2, 3]
+    assert peak == 4
@@ -0,0 +1,109 @@
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, PageResult, ResultLimits
+from enrichmcp.encoding import ENCODING_META_KEY, CompactResult, compact
+
+COMPACT = {ENCODING_META_KEY: "compact"}
+
+
+class Product(EnrichModel):
+    """Product."""
+
+    id: int = Field(description="ID")
+    name: str = Field(description="Name")
+    discontinued: bool = Field(False, description="No longer sold")
+    notes: str | None = Field(None, description="Notes")
+
+
+def products(count: int) -> list[Product]:
+    return [Product(id=i, name=f"Product {i}") for i in range(count)]
+
+
+def create_app(**kwargs) -> EnrichMCP:
+    app = EnrichMCP("Encoding API", instructions="desc", **kwargs)
+    app.entity(Product)
+
+    @app.retrieve(description="List products", encoding="compact")
+    async def list_products(count: int) -> list[Product]:
+        return products(count)
+
+    @app.retrieve(description="Page through products")
+    async def page_products(page: int = 1) -> PageResult[Product]:
+        return PageResult.create(items=products(3), page=page, page_size=3, has_next=True)
+
+    @app.retrieve(description="Get a product")
+    async def get_product(product_id: int) -> Product:
+        return Product(id=product_id, name="Widget", notes="fragile")
+
+    return app
+
+
+def test_compact_columns_and_constants() -> None:
+    items = products(2)
+    items[1].notes = "x"
+    encoded = compact(items)
+    assert encoded == {
+        "columns": ["id", "name", "notes"],
+        "rows": [[0, "Product 0", None], [1, "Product 1", "x"]],
+        "constants": {"discontinued": False},
+    }
+    CompactResult.model_validate(encoded)
+
+    assert compact(Product(id=1, name="Widget")) == {"id": 1, "name": "Widget"}
+    assert compact([1, 2]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_per_tool_and_per_request_encoding() -> None:
+    app = create_app(encoding="json")
+    async with Client(app.mcp) as client:
+        listed = await client.call_tool("list_products", {"count": 50})
+        table = listed.structured_content["result"]
+        assert table["columns"] == ["id", "name"]
+        assert table["rows"][3] == [3, "Product 3"]
+
+        full = await client.call_tool(
+            "list_products", {"count": 50}, meta={ENCODING_META_KEY: "json"}
+        )
+        assert full.structured_content["result"][3]["discontinued"] is False
+        assert len(listed.content[0].text) < len(full.content[0].text) / 2
+
+        page = await client.call_tool("page_products", {}, meta=COMPACT)
+        result = page.structured_content["result"]
+        assert result["pagination"] == {"page": 1, "page_size": 3, "has_next": True}
+        assert len(result["rows"]) == 3
+
+        single = await client.call_tool("get_product", {"product_id": 7}, meta=COMPACT)
+        assert single.structured_content == {"id": 7, "name": "Widget", "notes": "fragile"}
+
+        with pytest.raises(ToolError, match="Unknown enrichmcp/encoding"):
+            await client.call_tool("page_products", {}, meta={ENCODING_META_KEY: "xml"})
+
+
+@pytest.mark.asyncio
+async def test_compact_truncated_results() -> None:
+    app = create_app(result_limits=ResultLimits(max_items=10))
+    async with Client(app.mcp) as client:
+        listed = await client.call_tool("list_products", {"count": 25})
+        result = listed.structured_content["result"]
+        assert len(result["rows"]) == 10
+        cursor = result["pagination"]["next_cursor"]
+
+        # Tools without an encoding ignore the request
+        page = await client.call_tool("next_result_page", {"cursor": cursor}, meta=COMPACT)
+        assert page.structured_content["items"][0]["id"] == 10
+
+
+def test_unknown_encoding_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown encoding 'xml'"):
+        create_app(encoding="xml")
+
+    app = EnrichMCP("Encoding API", instructions="desc")
+    with pytest.raises(ValueError, match="Unknown encoding 'csv'"):
+
+        @app.retrieve(description="Products", encoding="csv")
+        async def products() -> list[str]:
+            return []
@@ -31,6 +31,7 @@ EXAMPLES = [
     "shop_api_sqlite/app.py",
     "sqlalchemy_shop/app.py",
     "shop_api_gateway/app.py",
+    "shop_api_gateway/declarative_app.py",
     "basic_memory/app.py",
     "caching/app.py",
     "mutable_crud/app.py",
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from fastmcp import Client, Context
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, ExecutorPools, Relationship
+
+
+class Report(EnrichModel):
+    """Report."""
+
+    id: int = Field(description="ID")
+    pid: int = Field(description="Process that built the report")
+    thread: str = Field(description="Thread that built the report")
+    checksum: int = Field(description="Checksum")
+
+
+class Account(EnrichModel):
+    """Account."""
+
+    id: int = Field(description="ID")
+    reports: list[Report] = Relationship(description="Reports")
+
+
+def build_report(report_id: int) -> Report:
+    """Build a report."""
+    checksum = sum(i * i for i in range(10_000)) % 997
+    return Report(
+        id=report_id,
+        pid=os.getpid(),
+        thread=threading.current_thread().name,
+        checksum=checksum,
+    )
+
+
+def get_reports(account_id: int) -> list[Report]:
+    """Build every report of an account."""
+    return [build_report(account_id * 10 + i) for i in range(3)]
+
+
+def slow_report(report_id: int) -> Report:
+    """Block for a while."""
+    time.sleep(0.3)
+    return build_report(report_id)
+
+
+async def async_report(report_id: int) -> Report:
+    """Build a report from a coroutine."""
+    await asyncio.sleep(0)
+    return build_report(report_id)
+
+
+def create_app(**kwargs) -> EnrichMCP:
+    app = EnrichMCP("Executor API", instructions="desc", **kwargs)
+    app.entity(Report)
+    app.entity(Account)
+    app.retrieve(executor="thread")(slow_report)
+    app.retrieve(executor="process")(build_report)
+    app.retrieve(executor="process")(async_report)
+    Account.reports.resolver(name="get", executor="process")(get_reports)
+
+    @app.retrieve(description="Answer right away")
+    async def ping() -> str:
+        return "pong"
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_keeps_loop_responsive() -> None:
+    app = create_app()
+    async with Client(app.mcp) as client:
+        slow = asyncio.create_task(client.call_tool("slow_report", {"report_id": 1}))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await client.call_tool("ping", {})
+        assert time.perf_counter() - started < 0.2
+        assert not slow.done()
+
+        report = (await slow).structured_content
+        assert report["thread"].startswith("enrichmcp")
+        assert report["pid"] == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_process_executor_pickles_arguments_and_results() -> None:
+    app = create_app(metrics=True, executors=ExecutorPools(max_processes=2))
+    async with Client(app.mcp) as client:
+        assert app.executors._pools.keys() == {"thread", "process"}
+
+        report = (await client.call_tool("build_report", {"report_id": 7})).structured_content
+        assert report["id"] == 7
+        assert report["pid"] != os.getpid()
+
+        report = (await client.call_tool("async_report", {"report_id": 8})).structured_content
+        assert report["pid"] != os.getpid()
+
+        reports = await client.call_tool("get_account_reports", {"account_id": 2})
+        assert [r["id"] for r in reports.structured_content["result"]] == [20, 21, 22]
+
+    assert app.executors._pools == {}
+    stats = app.metrics.snapshot()
+    assert stats["build_report"]["queue_wait_seconds"]["count"] == 1
+    assert stats["get_account_reports"]["queue_wait_seconds"]["count"] == 1
+    assert "enrichmcp_tool_queue_wait_seconds_bucket" in app.metrics.render_prometheus()
+
+
+def test_process_executor_rejects_unpicklable_tools() -> None:
+    app = EnrichMCP("Executor API", instructions="desc")
+
+    with pytest.raises(ValueError, match="module level"):
+
+        @app.retrieve(description="Local", executor="process")
+        def local() -> int:
+            return 1
+
+    def with_context(ctx: Context) -> int:
+        return 1
+
+    with pytest.raises(ValueError, match="Context"):
+        app.retrieve(description="Context", executor="process")(with_context)
+
+    with pytest.raises(ValueError, match="Unknown executor"):
+        app.retrieve(description="Pool", executor="greenlet")(build_report)
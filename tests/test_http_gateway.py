@@ -0,0 +1,160 @@
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastmcp import Context
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship
+from enrichmcp.http import HTTPGateway, parse_cache_control
+
+USERS = {1: {"id": 1, "name": "Alice"}, 2: {"id": 2, "name": "Bob"}}
+ORDERS = {
+    10: {"id": 10, "user_id": 1, "product_ids": [100, 101]},
+    11: {"id": 11, "user_id": 2, "product_ids": []},
+}
+PRODUCTS = {100: {"id": 100, "name": "Pen"}, 101: {"id": 101, "name": "Ink"}}
+
+
+def create_app(calls: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.raw_path.decode())
+        await asyncio.sleep(0.01)
+        path = request.url.path
+        if path == "/users":
+            return httpx.Response(200, json=list(USERS.values()))
+        if path.startswith("/users/"):
+            user = USERS.get(int(path.rsplit("/", 1)[1]))
+            if user is None:
+                return httpx.Response(404)
+            if request.headers.get("If-None-Match") == '"u1"':
+                return httpx.Response(304, headers={"ETag": '"u1"'})
+            return httpx.Response(200, json=user, headers={"ETag": '"u1"'})
+        if path == "/products":
+            ids = [int(i) for i in request.url.params["ids"].split(",")]
+            return httpx.Response(
+                200,
+                json=[PRODUCTS[i] for i in ids if i in PRODUCTS],
+                headers={"Cache-Control": "max-age=60"},
+            )
+        if path == "/orders":
+            user_id = int(request.url.params["user_id"])
+            return httpx.Response(200, json=[o for o in ORDERS.values() if o["user_id"] == user_id])
+        if path.startswith("/orders/"):
+            return httpx.Response(200, json=ORDERS[int(path.rsplit("/", 1)[1])])
+        return httpx.Response(404)
+
+    gateway = HTTPGateway(
+        "http://backend",
+        client_kwargs={"transport": httpx.MockTransport(handler)},
+    )
+    app = EnrichMCP("Gateway", "Desc", lifespan=gateway.lifespan)
+
+    @app.entity
+    class User(EnrichModel):
+        """User."""
+
+        id: int = Field(description="ID")
+        name: str = Field(description="Name")
+        orders: list["Order"] = Relationship(description="Orders")
+
+    @app.entity
+    class Product(EnrichModel):
+        """Product."""
+
+        id: int = Field(description="ID")
+        name: str = Field(description="Name")
+
+    @app.entity
+    class Order(EnrichModel):
+        """Order."""
+
+        id: int = Field(description="ID")
+        user_id: int = Field(description="User ID")
+        user: User = Relationship(description="Owner")
+        products: list[Product] = Relationship(description="Products")
+
+    app.rebuild_models()
+    gateway.entity(User, path="/users")
+    gateway.entity(Product, path="/products", batch_param="ids", list_tool=False)
+    gateway.entity(Order, path="/orders", list_params={"user_id": int})
+    gateway.relationship(User.orders, path="/orders", params={"user_id": "{id}"})
+    gateway.relationship(Order.user, via="user_id")
+    gateway.relationship(Order.products, via="product_ids")
+    return app, gateway
+
+
+def mock_ctx(lifespan_context):
+    ctx = Mock(spec=Context)
+    ctx.request_context = Mock(lifespan_context=lifespan_context)
+    return ctx
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, no-cache, foo="bar"') == {
+        "max-age": "60",
+        "no-cache": None,
+        "foo": "bar",
+    }
+    assert parse_cache_control(None) == {}
+
+
+@pytest.mark.asyncio
+async def test_generated_tools_and_relationships():
+    calls: list[str] = []
+    app, gateway = create_app(calls)
+    assert {"get_user", "get_users_by_ids", "list_users", "get_product"} <= set(app.resources)
+    assert "list_products" not in app.resources
+
+    async with gateway.lifespan(app) as lifespan_context:
+        ctx = mock_ctx(lifespan_context)
+        users = await app.resources["list_users"].fn(ctx=ctx)
+        assert [u.name for u in users] == ["Alice", "Bob"]
+        assert await app.resources["get_user"].fn(user_id=99, ctx=ctx) is None
+
+        orders = await app.resources["get_user_orders"].fn(user_id=1, ctx=ctx)
+        assert [o.id for o in orders] == [10]
+        owner = await app.resources["get_order_user"].fn(order_id=10, ctx=ctx)
+        assert owner.name == "Alice"
+        products = await app.resources["get_order_products"].fn(order_id=10, ctx=ctx)
+        assert [p.name for p in products] == ["Pen", "Ink"]
+        assert "/products?ids=100%2C101" in calls
+        assert await app.resources["get_order_products"].fn(order_id=11, ctx=ctx) == []
+
+
+@pytest.mark.asyncio
+async def test_tools_require_request_context():
+    app, _ = create_app([])
+    ctx = Mock(spec=Context)
+    ctx.request_context = None
+    with pytest.raises(RuntimeError, match="No request context"):
+        await app.resources["get_user"].fn(user_id=1, ctx=ctx)
+
+
+@pytest.mark.asyncio
+async def test_coalescing_and_cache_revalidation():
+    calls: list[str] = []
+    app, gateway = create_app(calls)
+    async with gateway.lifespan(app) as lifespan_context:
+        client = lifespan_context["http_client"]
+        results = await asyncio.gather(*(client.get_json("/users/1") for _ in range(5)))
+        assert all(r == USERS[1] for r in results)
+        assert calls.count("/users/1") == 1
+
+        # ETag without max-age is revalidated on the next request
+        assert await client.get_json("/users/1") == USERS[1]
+        assert calls.count("/users/1") == 2
+
+        # max-age responses are served from the cache
+        await client.get_many("/products", [100], batch_param="ids")
+        await client.get_many("/products", [100], batch_param="ids")
+        assert calls.count("/products?ids=100") == 1
+
+
+def test_relationship_requires_mapping():
+    app, gateway = create_app([])
+    with pytest.raises(ValueError):
+        gateway.relationship(app.entities["User"].orders)
+    with pytest.raises(ValueError):
+        HTTPGateway("http://x").entity(type("Loose", (), {}), path="/x")
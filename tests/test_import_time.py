@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("fastmcp", "mcp", "pydantic", "sqlalchemy", "redis", "packaging")
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Run ``code`` with ``-X importtime`` and return cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def top_level(times: dict[str, int]) -> set[str]:
+    return {name.split(".")[0] for name in times}
+
+
+def test_import_enrichmcp_is_light() -> None:
+    times = import_times("import enrichmcp")
+    assert not top_level(times) & set(HEAVY_MODULES)
+    # Generous bound; the package itself takes about a millisecond to import.
+    assert times["enrichmcp"] < 100_000
+
+
+def test_core_import_skips_optional_integrations() -> None:
+    times = import_times("from enrichmcp import EnrichMCP, EnrichModel, MemoryCache")
+    assert "fastmcp" in top_level(times)
+    assert not top_level(times) & {"sqlalchemy", "redis", "opentelemetry"}
+    # HTTP compression, pre-forked workers and process pools load when used
+    assert not times.keys() & {
+        "enrichmcp.compression",
+        "enrichmcp.workers",
+        "concurrent.futures.process",
+    }
+
+
+def test_lazy_exports_resolve() -> None:
+    import enrichmcp
+
+    for name in enrichmcp.__all__:
+        assert getattr(enrichmcp, name) is not None
+    assert set(enrichmcp.__all__) <= set(dir(enrichmcp))
+    with pytest.raises(AttributeError):
+        enrichmcp.does_not_exist  # noqa: B018
@@ -0,0 +1,161 @@
+import fakeredis.aioredis
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from pydantic import Field
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship, ResultLimits
+from enrichmcp.cache import RedisCache
+from enrichmcp.manifest import build_manifest, schema_hash
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+)
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Item(Base):
+    """Item."""
+
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+
+
+class Order(EnrichModel):
+    """Order."""
+
+    id: int = Field(description="ID")
+    note: str = Field(description="Note")
+
+
+class Customer(EnrichModel):
+    """Customer."""
+
+    id: int = Field(description="ID")
+    orders: list[Order] = Relationship(description="Orders")
+
+
+def orders(count: int) -> list[Order]:
+    return [Order(id=i, note="x" * 20) for i in range(count)]
+
+
+def create_app(**kwargs) -> EnrichMCP:
+    app = EnrichMCP("Limits API", instructions="desc", **kwargs)
+    app.entity(Order)
+    app.entity(Customer)
+
+    @app.retrieve(description="List orders")
+    async def list_orders(count: int) -> list[Order]:
+        return orders(count)
+
+    @app.retrieve(description="Get an order")
+    async def get_order(order_id: int) -> Order:
+        return Order(id=order_id, note="")
+
+    @Customer.orders.resolver(name="get", limits=ResultLimits(max_items=2))
+    async def get_orders(customer_id: int) -> list[Order]:
+        return orders(5)
+
+    return app
+
+
+async def read_all(client: Client, result: dict) -> list[int]:
+    ids = [item["id"] for item in result["items"]]
+    cursor = result["next_cursor"]
+    while cursor is not None:
+        page = (await client.call_tool("next_result_page", {"cursor": cursor})).structured_content
+        assert len(page["items"]) == page["page_size"]
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_oversized_list_becomes_cursor_result() -> None:
+    app = create_app(result_limits=ResultLimits(max_items=10))
+    async with Client(app.mcp) as client:
+        small = await client.call_tool("list_orders", {"count": 10})
+        assert [item["id"] for item in small.structured_content["result"]] == list(range(10))
+
+        large = (await client.call_tool("list_orders", {"count": 25})).structured_content
+        page = large["result"]
+        assert page["page_size"] == 10
+        assert await read_all(client, page) == list(range(25))
+
+        single = await client.call_tool("get_order", {"order_id": 1})
+        assert single.structured_content["id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_byte_limit_and_per_tool_limits() -> None:
+    item_bytes = len(to_json(orders(1)[0])) + 1
+    app = create_app(result_limits=ResultLimits(max_bytes=item_bytes * 4))
+    async with Client(app.mcp) as client:
+        page = (await client.call_tool("list_orders", {"count": 9})).structured_content["result"]
+        assert page["page_size"] == 4
+        assert await read_all(client, page) == list(range(9))
+
+        resolved = await client.call_tool("get_customer_orders", {"customer_id": 1})
+        page = resolved.structured_content["result"]
+        assert page["page_size"] == 2
+        assert await read_all(client, page) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_single_use() -> None:
+    app = create_app()
+    async with Client(app.mcp) as client:
+        page = (
+            await client.call_tool("get_customer_orders", {"customer_id": 1})
+        ).structured_content
+        cursor = page["result"]["next_cursor"]
+        await client.call_tool("next_result_page", {"cursor": cursor})
+        with pytest.raises(ToolError, match="expired result cursor"):
+            await client.call_tool("next_result_page", {"cursor": cursor})
+
+        # Without app-wide limits only the resolver is wrapped
+        listed = await client.call_tool("list_orders", {"count": 50})
+        assert len(listed.structured_content["result"]) == 50
+
+
+@pytest.mark.asyncio
+async def test_generated_tool_pages_through_redis() -> None:
+    async def seed(session: AsyncSession) -> None:
+        session.add_all([Item(id=i, name=f"item {i}") for i in range(1, 5)])
+
+    app = EnrichMCP(
+        "Limits API",
+        instructions="desc",
+        lifespan=sqlalchemy_lifespan(Base, "sqlite+aiosqlite://", seed=seed),
+        cache_backend=RedisCache("redis://", redis_client=fakeredis.aioredis.FakeRedis()),
+        result_limits=ResultLimits(max_items=2),
+    )
+    include_sqlalchemy_models(app, Base)
+    async with Client(app.mcp) as client:
+        result = await client.call_tool("get_items_by_ids", {"ids": [1, 2, 3, 4]})
+        page = result.structured_content["result"]
+        assert page["page_size"] == 2
+        assert await read_all(client, page) == [1, 2, 3, 4]
+
+
+def test_limited_tools_keep_manifest_hash_stable() -> None:
+    lazy = create_app(result_limits=ResultLimits(max_items=10), lazy_tools=True)
+    pending_hash = schema_hash(lazy)
+    manifest = build_manifest(lazy)
+    assert manifest.schema_hash == pending_hash
+    output = manifest.tools["list_orders"].output_schema
+    assert len(output["properties"]["result"]["anyOf"]) == 2
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_items"):
+        ResultLimits(max_items=0)
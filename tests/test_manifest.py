@@ -0,0 +1,88 @@
+import pytest
+from fastmcp import Client
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship
+from enrichmcp.manifest import schema_hash, write_manifest
+
+
+def create_app(description: str = "Get a user", min_id: int = 0, **kwargs) -> EnrichMCP:
+    app = EnrichMCP("Manifest API", instructions="desc", **kwargs)
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        id: int = Field(description="ID")
+
+    @app.entity
+    class User(EnrichModel):
+        """User."""
+
+        id: int = Field(description="ID", ge=min_id)
+        items: list[Item] = Relationship(description="items")
+
+    @app.retrieve(description=description)
+    async def get_user(user_id: int) -> User:
+        return User(id=user_id)
+
+    @User.items.resolver
+    async def get_items(user_id: int) -> list[Item]:
+        return [Item(id=user_id)]
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_tools_built_from_manifest(tmp_path) -> None:
+    path = tmp_path / "tools.json"
+    source = create_app()
+    manifest = write_manifest(source, path)
+    assert set(manifest.tools) == set(source.tool_defs)
+
+    app = create_app(manifest=path)
+    assert schema_hash(app) == manifest.schema_hash
+    app.register_pending_tools()
+    assert "manifest" in app.startup_profile.seconds
+    assert "schema" not in app.startup_profile.seconds
+
+    async with Client(app.mcp) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        result = await client.call_tool("get_user", {"user_id": 7})
+        explore = await client.call_tool(app.data_model_tool_name(), {})
+
+    assert result.data.id == 7
+    for name, stored in manifest.tools.items():
+        assert tools[name].inputSchema == stored.parameters
+        assert tools[name].outputSchema == stored.output_schema
+    assert explore.structured_content["model"] == manifest.data_model
+
+
+def test_stale_manifest_falls_back_to_introspection(tmp_path) -> None:
+    path = tmp_path / "tools.json"
+    write_manifest(create_app(), path)
+
+    app = create_app("Get a single user", manifest=path)
+    with pytest.warns(RuntimeWarning, match="stale tool manifest"):
+        app.register_pending_tools()
+
+    assert app.startup_profile.counts["schema"] == len(app.tool_defs)
+    assert "Get a single user" in app.resources["get_user"].description
+
+
+def test_constraint_change_invalidates_manifest(tmp_path) -> None:
+    path = tmp_path / "tools.json"
+    write_manifest(create_app(), path)
+    assert schema_hash(create_app(min_id=18)) != schema_hash(create_app())
+
+    app = create_app(min_id=18, manifest=path)
+    with pytest.warns(RuntimeWarning, match="stale tool manifest"):
+        app.register_pending_tools()
+    assert app.resources["get_user"].output_schema["properties"]["id"]["minimum"] == 18
+
+
+def test_missing_manifest_warns(tmp_path) -> None:
+    app = create_app(manifest=tmp_path / "missing.json")
+    with pytest.warns(RuntimeWarning, match="Ignoring tool manifest"):
+        app.register_pending_tools()
+    assert set(app.resources) == set(app.tool_defs)
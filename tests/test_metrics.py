@@ -0,0 +1,104 @@
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel, PageResult
+from enrichmcp.metrics import OpenTelemetryExporter, ToolMetrics
+
+
+def create_app(metrics: bool | ToolMetrics = True) -> EnrichMCP:
+    app = EnrichMCP("Metrics API", instructions="desc", metrics=metrics)
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        id: int = Field(description="ID")
+
+    @app.retrieve(description="List items")
+    async def list_items(page: int = 1) -> PageResult[Item]:
+        return PageResult.create(
+            items=[Item(id=i) for i in range(3)], page=page, page_size=3, has_next=True
+        )
+
+    @app.retrieve(description="Always fails")
+    async def broken() -> Item:
+        raise ValueError("boom")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_recorded() -> None:
+    app = create_app()
+    async with Client(app.mcp) as client:
+        await client.call_tool("list_items", {})
+        await client.call_tool("list_items", {"page": 2})
+        with pytest.raises(ToolError):
+            await client.call_tool("broken", {})
+        for name in ("missing", "../missing"):
+            with pytest.raises(ToolError):
+                await client.call_tool(name, {})
+
+    snapshot = app.metrics.snapshot()
+    assert snapshot["unknown"]["calls"] == 2
+    assert "missing" not in snapshot
+    listed = snapshot["list_items"]
+    assert listed["kind"] == "retriever"
+    assert listed["calls"] == 2
+    assert listed["errors"] == 0
+    assert listed["items"] == 6
+    assert listed["latency_seconds"]["buckets"]["+Inf"] == 2
+    assert listed["result_bytes"]["count"] == 2
+    assert listed["result_bytes"]["sum"] > 0
+    assert snapshot["broken"]["calls"] == 1
+    assert snapshot["broken"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prometheus_route() -> None:
+    app = create_app()
+    async with Client(app.mcp) as client:
+        await client.call_tool("list_items", {})
+
+    transport = httpx.ASGITransport(app=app.mcp.http_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        response = await http.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE enrichmcp_tool_latency_seconds histogram" in body
+    assert 'enrichmcp_tool_calls_total{tool="list_items",kind="retriever"} 1' in body
+    assert 'enrichmcp_tool_result_items_total{tool="list_items",kind="retriever"} 3' in body
+    assert (
+        'enrichmcp_tool_latency_seconds_bucket{tool="list_items",kind="retriever",le="+Inf"} 1'
+        in body
+    )
+
+
+@pytest.mark.asyncio
+async def test_exporters_receive_observations() -> None:
+    meter = Mock()
+    meter.create_counter.side_effect = lambda *args, **kwargs: Mock()
+    exporter = OpenTelemetryExporter(meter)
+    app = create_app(ToolMetrics(route=None, exporters=[exporter]))
+    async with Client(app.mcp) as client:
+        await client.call_tool("list_items", {})
+        with pytest.raises(ToolError):
+            await client.call_tool("broken", {})
+
+    attributes = {"tool": "list_items", "kind": "retriever"}
+    exporter.items.add.assert_called_once_with(3, attributes)
+    exporter.errors.add.assert_called_once_with(
+        1,
+        {"tool": "broken", "kind": "retriever", "error": "ToolError"},
+    )
+    assert exporter.calls.add.call_count == 2
+    assert not any(
+        getattr(route, "path", None) == "/metrics" for route in app.mcp._additional_http_routes
+    )
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import time
+from collections import Counter
+
+import pytest
+from fastmcp import Client
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel
+from enrichmcp.profiling import SlowCallProfiler
+
+
+def create_app(profiler: SlowCallProfiler) -> EnrichMCP:
+    app = EnrichMCP("Profiled API", instructions="desc", profiler=profiler)
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        id: int = Field(description="ID")
+
+    def busy_loop(seconds: float) -> None:
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+    @app.retrieve(description="Slow item lookup")
+    async def slow_item(item_id: int) -> Item:
+        busy_loop(0.05)
+        await asyncio.sleep(0.05)
+        return Item(id=item_id)
+
+    @app.retrieve(description="Fast item lookup")
+    async def fast_item(item_id: int) -> Item:
+        return Item(id=item_id)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_are_profiled(tmp_path) -> None:
+    profiler = SlowCallProfiler(tmp_path, threshold=0.08, interval=0.002)
+    app = create_app(profiler)
+
+    async with Client(app.mcp) as client:
+        await client.call_tool("slow_item", {"item_id": 1})
+        await client.call_tool("fast_item", {"item_id": 1})
+
+    (record,) = [json.loads(line) for line in (tmp_path / "index.jsonl").read_text().splitlines()]
+    assert record["tool"] == "slow_item"
+    assert record["seconds"] >= 0.08
+    assert record["samples"] > 0
+
+    folded = (tmp_path / record["path"]).read_text().splitlines()
+    assert record["path"].startswith(f"{record['timestamp']}-slow_item-{record['arguments_hash']}")
+    stacks = [line.rsplit(" ", 1)[0] for line in folded]
+    assert all(stack.startswith("SlowCallProfiler.profile") for stack in stacks)
+    assert any("busy_loop" in stack for stack in stacks)
+    # Samples taken while suspended follow the await chain into the sleep
+    assert any("slow_item" in stack and "busy_loop" not in stack for stack in stacks)
+
+
+@pytest.mark.asyncio
+async def test_arguments_hash_distinguishes_calls(tmp_path) -> None:
+    profiler = SlowCallProfiler(tmp_path, threshold=0.0, interval=0.001)
+    app = create_app(profiler)
+
+    async with Client(app.mcp) as client:
+        await client.call_tool("slow_item", {"item_id": 1})
+        await client.call_tool("slow_item", {"item_id": 2})
+
+    records = [json.loads(line) for line in (tmp_path / "index.jsonl").read_text().splitlines()]
+    assert len({record["arguments_hash"] for record in records}) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_keep_separate_profiles(tmp_path) -> None:
+    profiler = SlowCallProfiler(tmp_path, threshold=0.0, interval=0.001)
+    app = create_app(profiler)
+
+    async with Client(app.mcp) as client:
+        await asyncio.gather(
+            *(client.call_tool("slow_item", {"item_id": 1}) for _ in range(3)),
+        )
+
+    records = [json.loads(line) for line in (tmp_path / "index.jsonl").read_text().splitlines()]
+    assert len({record["path"] for record in records}) == 3
+    assert len(list(tmp_path.glob("*.folded"))) == 3
+
+
+def test_tool_name_cannot_escape_directory(tmp_path) -> None:
+    profiler = SlowCallProfiler(tmp_path / "profiles")
+    path = profiler.write("../../evil/name", {}, 1.0, Counter({"main": 1}))
+    assert path.parent == tmp_path / "profiles"
+    assert "-______evil_name-" in path.name
+
+
+def test_interval_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        SlowCallProfiler(interval=0)
@@ -0,0 +1,107 @@
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Context
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+)
+from enrichmcp.sqlalchemy.aggregates import build_metric_model
+from enrichmcp.sqlalchemy.filters import build_filter_model
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    status: Mapped[str] = mapped_column(index=True, info={"description": "Status"})
+    region: Mapped[str] = mapped_column(index=True, info={"description": "Region"})
+    total: Mapped[float] = mapped_column(info={"description": "Total"})
+    note: Mapped[str] = mapped_column(info={"description": "Note"})
+
+
+async def seed(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Order(
+                id=i,
+                status="paid" if i % 2 else "new",
+                region=f"r{i % 3}",
+                total=i * 10.0,
+                note="",
+            )
+            for i in range(1, 11)
+        ],
+    )
+
+
+def mock_context(session_factory):
+    ctx = Mock(spec=Context)
+    ctx.request_context = Mock(lifespan_context={"session_factory": session_factory})
+    return ctx
+
+
+def test_aggregate_tools_are_opt_in():
+    app = EnrichMCP("Test", "Desc")
+    include_sqlalchemy_models(app, Base)
+    assert "count_orders" not in app.resources
+    assert "aggregate_orders" not in app.resources
+
+
+@pytest.mark.asyncio
+async def test_count_and_aggregate_tools():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    lifespan = sqlalchemy_lifespan(Base, engine, seed=seed)
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base, aggregates=True, max_groups=4)
+
+    filter_model = build_filter_model(Order)
+    metric_model = build_metric_model(Order)
+    async with lifespan(app) as lifespan_ctx:
+        ctx = mock_context(lifespan_ctx["session_factory"])
+
+        assert await app.resources["count_orders"].fn(ctx=ctx) == 10
+        paid = filter_model.model_validate({"status": {"eq": "paid"}})
+        assert await app.resources["count_orders"].fn(ctx=ctx, filters=paid) == 5
+
+        aggregate = app.resources["aggregate_orders"].fn
+        result = await aggregate(
+            group_by=["status"],
+            metrics=[
+                metric_model(fn="count"),
+                metric_model(fn="sum", field="total"),
+                metric_model(fn="max", field="total"),
+            ],
+            ctx=ctx,
+        )
+        assert result.truncated is False
+        assert result.groups == [
+            {"status": "new", "count": 5, "sum_total": 300.0, "max_total": 100.0},
+            {"status": "paid", "count": 5, "sum_total": 250.0, "max_total": 90.0},
+        ]
+
+        result = await aggregate(group_by=["status", "region"], ctx=ctx, filters=paid)
+        assert len(result.groups) == 3
+        assert sum(group["count"] for group in result.groups) == 5
+
+        result = await aggregate(group_by=["id"], ctx=ctx)
+        assert len(result.groups) == 4
+        assert result.truncated is True
+
+        with pytest.raises(ValueError):
+            await aggregate(group_by=["note"], ctx=ctx)
+        with pytest.raises(ValueError):
+            await aggregate(group_by=["status"], metrics=[metric_model(fn="sum")], ctx=ctx)
+        with pytest.raises(ValueError):
+            await aggregate(group_by=["status"], ctx=ctx, limit=5)
+        with pytest.raises(ValueError):
+            metric_model(fn="sum", field="note")
@@ -0,0 +1,98 @@
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Context
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+)
+from enrichmcp.sqlalchemy.filters import build_filter_model, filterable_columns
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    status: Mapped[str] = mapped_column(index=True, info={"description": "Status"})
+    total: Mapped[float] = mapped_column(info={"description": "Total", "filterable": True})
+    note: Mapped[str] = mapped_column(info={"description": "Note"})
+    code: Mapped[str] = mapped_column(
+        unique=True,
+        info={"description": "Code", "filterable": False},
+    )
+
+
+async def seed(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Order(id=i, status="paid" if i % 2 else "new", total=i * 10.0, note="", code=f"c{i}")
+            for i in range(1, 11)
+        ],
+    )
+
+
+def create_app():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    lifespan = sqlalchemy_lifespan(Base, engine, seed=seed)
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base)
+    return app, lifespan
+
+
+def test_filterable_columns_whitelist():
+    assert list(filterable_columns(Order)) == ["id", "status", "total"]
+    model = build_filter_model(Order)
+    parsed = model.model_validate({"status": {"in": ["paid"], "prefix": "p"}})
+    assert parsed.status.in_ == ["paid"]
+    with pytest.raises(ValueError):
+        model.model_validate({"note": {"eq": ""}})
+    with pytest.raises(ValueError):
+        model.model_validate({"id": {"prefix": "1"}})
+
+
+@pytest.mark.asyncio
+async def test_list_tool_filters_and_orders():
+    app, lifespan = create_app()
+    async with lifespan(app) as ctx:
+        mock_ctx = Mock(spec=Context)
+        mock_ctx.request_context = Mock(
+            lifespan_context={"session_factory": ctx["session_factory"]}
+        )
+        list_orders = app.resources["list_orders"]
+        filter_model = build_filter_model(Order)
+
+        filters = filter_model.model_validate(
+            {"status": {"eq": "paid"}, "total": {"gte": 30, "lt": 90}},
+        )
+        result = await list_orders.fn(
+            ctx=mock_ctx,
+            filters=filters,
+            order_by="total",
+            order_direction="desc",
+        )
+        assert [o.id for o in result.items] == [7, 5, 3]
+        assert result.total_items == 3
+
+        prefixed = await list_orders.fn(
+            ctx=mock_ctx,
+            filters=filter_model.model_validate({"status": {"prefix": "ne"}}),
+            page_size=2,
+        )
+        assert [o.id for o in prefixed.items] == [2, 4]
+        assert prefixed.total_items == 5
+        assert prefixed.has_next
+
+        with pytest.raises(ValueError):
+            await list_orders.fn(ctx=mock_ctx, order_by="note")
+
+        schema = list_orders.parameters
+        assert schema["properties"]["order_by"]["anyOf"][0]["enum"] == ["id", "status", "total"]
@@ -0,0 +1,130 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Client, Context
+from sqlalchemy import ForeignKey, ForeignKeyConstraint, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+)
+
+ALICE = uuid.UUID("00000000-0000-0000-0000-000000000001")
+BOB = uuid.UUID("00000000-0000-0000-0000-000000000002")
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Account(Base):
+    __tablename__ = "accounts"
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+    lines: Mapped[list["Line"]] = relationship(
+        back_populates="account",
+        info={"description": "Lines"},
+    )
+
+
+class Ledger(Base):
+    __tablename__ = "ledgers"
+    region: Mapped[str] = mapped_column(
+        String(2),
+        primary_key=True,
+        info={"description": "Region"},
+    )
+    number: Mapped[int] = mapped_column(primary_key=True, info={"description": "Number"})
+    lines: Mapped[list["Line"]] = relationship(
+        back_populates="ledger",
+        info={"description": "Lines"},
+    )
+
+
+class Line(Base):
+    __tablename__ = "lines"
+    __table_args__ = (
+        ForeignKeyConstraint(["region", "number"], ["ledgers.region", "ledgers.number"]),
+    )
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    region: Mapped[str] = mapped_column(info={"description": "Region"})
+    number: Mapped[int] = mapped_column(info={"description": "Number"})
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("accounts.id"),
+        info={"description": "Account"},
+    )
+    ledger: Mapped[Ledger] = relationship(back_populates="lines", info={"description": "Ledger"})
+    account: Mapped[Account] = relationship(
+        back_populates="lines",
+        info={"description": "Account"},
+    )
+
+
+async def seed(session: AsyncSession) -> None:
+    alice = Account(id=ALICE, name="Alice")
+    bob = Account(id=BOB, name="Bob")
+    eu = Ledger(region="eu", number=1)
+    us = Ledger(region="us", number=1)
+    session.add_all(
+        [
+            alice,
+            bob,
+            eu,
+            us,
+            Line(id=1, ledger=eu, account=alice),
+            Line(id=2, ledger=eu, account=bob),
+            Line(id=3, ledger=us, account=alice),
+        ],
+    )
+
+
+def create_app():
+    lifespan = sqlalchemy_lifespan(Base, "sqlite+aiosqlite://", seed=seed)
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base)
+    return app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_uuid_and_composite_key_tools():
+    app, lifespan = create_app()
+    async with lifespan(app.mcp) as lifespan_ctx:
+        ctx = Mock(spec=Context)
+        ctx.request_context = Mock(lifespan_context=lifespan_ctx)
+        tools = app.resources
+
+        assert (await tools["get_account"].fn(account_id=ALICE, ctx=ctx)).name == "Alice"
+        ledger = await tools["get_ledger"].fn(ledger_id=("us", 1), ctx=ctx)
+        assert (ledger.region, ledger.number) == ("us", 1)
+
+        accounts = await tools["get_accounts_by_ids"].fn(ids=[BOB, uuid.uuid4(), ALICE], ctx=ctx)
+        assert [a.name for a in accounts] == ["Bob", "Alice"]
+        ledgers = await tools["get_ledgers_by_ids"].fn(ids=[("us", 1), ("eu", 1)], ctx=ctx)
+        assert [lg.region for lg in ledgers] == ["us", "eu"]
+
+        lines = await tools["get_ledgerenrichmodel_lines"].fn(ledger_id=("eu", 1), ctx=ctx)
+        assert [line.id for line in lines.items] == [1, 2]
+        lines = await tools["get_accountenrichmodel_lines"].fn(account_id=ALICE, ctx=ctx)
+        assert [line.id for line in lines.items] == [1, 3]
+        ledger = await tools["get_lineenrichmodel_ledger"].fn(line_id=3, ctx=ctx)
+        assert ledger.region == "us"
+
+
+@pytest.mark.asyncio
+async def test_composite_keys_through_client():
+    app, _ = create_app()
+    async with Client(app.mcp) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        ids_schema = tools["get_ledgers_by_ids"].inputSchema["properties"]["ids"]
+        assert ids_schema["items"]["prefixItems"] == [{"type": "string"}, {"type": "integer"}]
+        assert ids_schema["maxItems"] == 500
+
+        result = await client.call_tool("get_ledger", {"ledger_id": ["eu", 1]})
+        assert result.structured_content["result"]["region"] == "eu"
+        result = await client.call_tool("get_account", {"account_id": str(BOB)})
+        assert result.structured_content["result"]["name"] == "Bob"
@@ -0,0 +1,165 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    SessionScopeMiddleware,
+    session_scope,
+    sqlalchemy_lifespan,
+)
+from enrichmcp.sqlalchemy.lifecycle import (
+    _apply_statement_timeout,
+    _restore_max_execution_time,
+    _statement_timeout,
+    _timeout_session_class,
+)
+from enrichmcp.tool import ToolKind
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+
+
+async def table_names(session: AsyncSession) -> list[str]:
+    conn = await session.connection()
+    return await conn.run_sync(lambda c: sa_inspect(c).get_table_names())
+
+
+@pytest.mark.asyncio
+async def test_create_tables_skip_and_defer(tmp_path: Path):
+    skip = sqlalchemy_lifespan(
+        Base, f"sqlite+aiosqlite:///{tmp_path / 'a.db'}", create_tables=False
+    )
+    async with skip(None) as ctx, ctx["session_factory"]() as session:
+        assert await table_names(session) == []
+
+    async def seed(session: AsyncSession) -> None:
+        session.add(Item(id=1))
+
+    defer = sqlalchemy_lifespan(
+        Base,
+        f"sqlite+aiosqlite:///{tmp_path / 'b.db'}",
+        create_tables="defer",
+        seed=seed,
+    )
+    async with defer(None) as ctx:
+        for _ in range(100):
+            async with ctx["session_factory"]() as session:
+                if await table_names(session) and await session.get(Item, 1):
+                    break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("deferred create_all and seed did not run")
+
+    with pytest.raises(ValueError):
+        sqlalchemy_lifespan(Base, "sqlite+aiosqlite://", create_tables="later")
+
+
+@pytest.mark.asyncio
+async def test_pool_options_and_warm_connections(tmp_path: Path):
+    lifespan = sqlalchemy_lifespan(
+        Base,
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        pool_size=3,
+        max_overflow=0,
+        pool_recycle=60,
+        pool_pre_ping=True,
+        warm_connections=3,
+        statement_timeout=1.0,
+    )
+    async with lifespan(None) as ctx:
+        async with ctx["session_factory"]() as session:
+            assert await table_names(session) == ["items"]
+        engine = ctx["session_factory"].kw["bind"]
+        assert engine.pool.size() == 3
+        assert engine.pool.checkedin() == 3
+        assert engine.pool._pre_ping is True
+
+    with pytest.raises(ValueError):
+        sqlalchemy_lifespan(Base, create_async_engine("sqlite+aiosqlite://"), pool_size=3)
+
+
+@pytest.mark.asyncio
+async def test_statement_timeout_resolution():
+    overrides = {ToolKind.RETRIEVER: 2.0, "aggregate_orders": 10.0}
+    assert _statement_timeout(5.0, overrides) == 5.0
+    async with session_scope(ToolKind.RETRIEVER, "list_orders"):
+        assert _statement_timeout(5.0, overrides) == 2.0
+    async with session_scope(ToolKind.RETRIEVER, "aggregate_orders"):
+        assert _statement_timeout(5.0, overrides) == 10.0
+    async with session_scope(ToolKind.CREATOR, "create_order"):
+        assert _statement_timeout(None, overrides) is None
+
+
+@pytest.mark.asyncio
+async def test_statement_timeout_overrides_need_session_scope():
+    app = EnrichMCP("Test", "Desc")
+    lifespan = sqlalchemy_lifespan(
+        Base,
+        "sqlite+aiosqlite://",
+        statement_timeout=5.0,
+        statement_timeouts={ToolKind.RETRIEVER: 2.0},
+    )
+    with pytest.raises(RuntimeError, match="SessionScopeMiddleware"):
+        async with lifespan(app.mcp):
+            pass
+
+    app.mcp.add_middleware(SessionScopeMiddleware(app))
+    async with lifespan(app.mcp) as ctx:
+        assert "session_factory" in ctx
+
+
+def fake_connection(dialect: str) -> MagicMock:
+    conn = MagicMock()
+    conn.dialect.name = dialect
+    conn.info = {}
+    conn.exec_driver_sql.return_value.scalar.return_value = 30000
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_statement_timeout_keeps_server_defaults():
+    session = _timeout_session_class(Session, None, {"aggregate_orders": 2.0})()
+    conn = fake_connection("postgresql")
+    async with session_scope(ToolKind.RETRIEVER, "list_orders"):
+        session.dispatch.after_begin(session, MagicMock(), conn)
+    conn.exec_driver_sql.assert_not_called()
+
+    async with session_scope(ToolKind.RETRIEVER, "aggregate_orders"):
+        session.dispatch.after_begin(session, MagicMock(), conn)
+    conn.exec_driver_sql.assert_called_once_with("SET LOCAL statement_timeout = 2000")
+
+
+def test_mysql_timeout_is_reset_on_checkin():
+    conn = fake_connection("mysql")
+    conn.engine = create_engine("sqlite://")
+    _apply_statement_timeout(conn, 1.5)
+    _apply_statement_timeout(conn, 1.5)
+    statements = [call.args[0] for call in conn.exec_driver_sql.call_args_list]
+    assert statements == [
+        "SELECT @@SESSION.max_execution_time",
+        "SET SESSION max_execution_time = 1500",
+        "SET SESSION max_execution_time = 1500",
+    ]
+    assert event.contains(conn.engine.pool, "checkin", _restore_max_execution_time)
+
+    record = MagicMock(info=conn.info)
+    dbapi_connection = MagicMock()
+    _restore_max_execution_time(dbapi_connection, record)
+    dbapi_connection.cursor().execute.assert_called_once_with(
+        "SET SESSION max_execution_time = 30000"
+    )
+    assert record.info == {}
@@ -0,0 +1,159 @@
+from pathlib import Path
+
+import pytest
+from fastmcp import Client, Context
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    SessionScopeMiddleware,
+    include_sqlalchemy_models,
+    session_scope,
+    sqlalchemy_lifespan,
+    tool_session,
+)
+from enrichmcp.tool import ToolKind
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class User(Base):
+    __tablename__ = "users"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+
+
+async def make_replica(path: Path, name: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(User(id=1, name=name))
+        await session.commit()
+    return engine
+
+
+async def create_app(tmp_path: Path, strategy: str = "round_robin"):
+    async def seed(session: AsyncSession) -> None:
+        session.add(User(id=1, name="primary"))
+
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replicas = [
+        await make_replica(tmp_path / "replica1.db", "replica1"),
+        await make_replica(tmp_path / "replica2.db", "replica2"),
+    ]
+    lifespan = sqlalchemy_lifespan(
+        Base,
+        primary,
+        seed=seed,
+        replicas=replicas,
+        replica_strategy=strategy,
+    )
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base)
+
+    @app.update
+    async def rename_user(user_id: int, name: str, ctx: Context) -> str:
+        """Rename a user and return the stored name."""
+        async with tool_session(ctx) as session:
+            user = await session.get(User, user_id)
+            user.name = name
+            await session.commit()
+        found = await app.resources["get_user"].fn(user_id=user_id, ctx=ctx)
+        return found.name
+
+    @app.retrieve
+    async def touch_and_read(user_id: int, ctx: Context) -> str:
+        """Write from a retriever, then read in a fresh session."""
+        async with tool_session(ctx) as session:
+            user = await session.get(User, user_id)
+            user.name = "touched"
+            await session.commit()
+        factory = ctx.request_context.lifespan_context["session_factory"]
+        async with factory() as session:
+            return (await session.get(User, user_id)).name
+
+    return app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replicas_round_robin(tmp_path: Path):
+    app, _ = await create_app(tmp_path)
+    async with Client(app.mcp) as client:
+        names = [
+            (await client.call_tool("get_user", {"user_id": 1})).structured_content["result"][
+                "name"
+            ]
+            for _ in range(4)
+        ]
+        assert names == ["replica1", "replica2", "replica1", "replica2"]
+
+
+@pytest.mark.asyncio
+async def test_writes_use_primary_and_stick(tmp_path: Path):
+    app, _ = await create_app(tmp_path, strategy="least_connections")
+    async with Client(app.mcp) as client:
+        result = await client.call_tool("rename_user", {"user_id": 1, "name": "renamed"})
+        assert result.data == "renamed"
+        result = await client.call_tool("touch_and_read", {"user_id": 1})
+        assert result.data == "touched"
+
+        result = await client.call_tool("get_user", {"user_id": 1})
+        assert result.structured_content["result"]["name"] in {"replica1", "replica2"}
+
+
+@pytest.mark.asyncio
+async def test_least_connections_balances_open_sessions(tmp_path: Path):
+    app, lifespan = await create_app(tmp_path, strategy="least_connections")
+    async with lifespan(app.mcp) as ctx:
+        router = ctx["session_factory"]
+        async with session_scope(ToolKind.RESOLVER):
+            first, second = router(), router()
+            names = {
+                (await first.get(User, 1)).name,
+                (await second.get(User, 1)).name,
+            }
+            assert names == {"replica1", "replica2"}
+            await first.close()
+            await second.close()
+        assert set(router.in_use.values()) == {0}
+
+        async with session_scope(ToolKind.CREATOR), router() as session:
+            assert (await session.get(User, 1)).name == "primary"
+
+
+@pytest.mark.asyncio
+async def test_hand_written_tools_need_session_scope(tmp_path: Path):
+    replica = await make_replica(tmp_path / "replica.db", "replica")
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+
+    async def seed(session: AsyncSession) -> None:
+        session.add(User(id=1, name="primary"))
+
+    lifespan = sqlalchemy_lifespan(Base, primary, seed=seed, replicas=[replica])
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+
+    @app.retrieve
+    async def read_name(user_id: int, ctx: Context) -> str:
+        """Read a user's name."""
+        async with tool_session(ctx) as session:
+            return (await session.get(User, user_id)).name
+
+    @app.update
+    async def read_for_update(user_id: int, ctx: Context) -> str:
+        """Read a user's name before updating it."""
+        async with tool_session(ctx) as session:
+            return (await session.get(User, user_id)).name
+
+    with pytest.raises(RuntimeError, match="SessionScopeMiddleware"):
+        async with lifespan(app.mcp):
+            pass
+
+    app.mcp.add_middleware(SessionScopeMiddleware(app))
+    async with Client(app.mcp) as client:
+        assert (await client.call_tool("read_name", {"user_id": 1})).data == "replica"
+        assert (await client.call_tool("read_for_update", {"user_id": 1})).data == "primary"
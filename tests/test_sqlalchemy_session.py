@@ -0,0 +1,110 @@
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Client, Context
+from sqlalchemy import ForeignKey
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    session_scope,
+    sqlalchemy_lifespan,
+    tool_session,
+)
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class User(Base):
+    __tablename__ = "users"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+    orders: Mapped[list["Order"]] = relationship(
+        back_populates="user",
+        info={"description": "Orders"},
+    )
+
+
+class Order(Base):
+    __tablename__ = "orders"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    user: Mapped[User] = relationship(back_populates="orders", info={"description": "User"})
+
+
+async def seed(session: AsyncSession) -> None:
+    user = User(id=1, name="Alice")
+    session.add_all([user, *(Order(id=i, user=user) for i in range(1, 4))])
+
+
+def create_app(opened: list[AsyncSession]):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    base_lifespan = sqlalchemy_lifespan(Base, engine, seed=seed)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with base_lifespan(app) as ctx:
+            factory = ctx["session_factory"]
+
+            def counting_factory():
+                session = factory()
+                opened.append(session)
+                return session
+
+            yield {"session_factory": counting_factory}
+
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base)
+
+    @app.retrieve
+    async def user_summary(user_id: int, ctx: Context) -> str:
+        """Summarize a user and their orders."""
+        user = await app.resources["get_user"].fn(user_id=user_id, ctx=ctx)
+        orders = await app.resources["get_userenrichmodel_orders"].fn(user_id=user_id, ctx=ctx)
+        async with tool_session(ctx) as session:
+            assert session is opened[0]
+        return f"{user.name}: {len(orders.items)} orders"
+
+    return app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_nested_resolvers_share_one_session_per_tool_call():
+    opened: list[AsyncSession] = []
+    app, _ = create_app(opened)
+    async with Client(app.mcp) as client:
+        result = await client.call_tool("user_summary", {"user_id": 1})
+        assert result.data == "Alice: 3 orders"
+        assert len(opened) == 1
+
+        await client.call_tool("get_user", {"user_id": 1})
+        assert len(opened) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolvers_do_not_share_a_busy_session():
+    opened: list[AsyncSession] = []
+    app, lifespan = create_app(opened)
+    async with lifespan(app.mcp) as lifespan_ctx:
+        ctx = Mock(spec=Context)
+        ctx.request_context = Mock(lifespan_context=lifespan_ctx)
+        get_user = app.resources["get_user"].fn
+
+        async with session_scope():
+            users = await app.gather(get_user(user_id=1, ctx=ctx) for _ in range(3))
+            assert [u.name for u in users] == ["Alice"] * 3
+            assert len(opened) <= 3
+            shared = opened[0]
+            await get_user(user_id=1, ctx=ctx)
+            async with tool_session(ctx) as session:
+                assert session is shared
+
+        # Outside a scope each call gets, and closes, its own session.
+        await get_user(user_id=1, ctx=ctx)
+        assert opened[-1] is not shared
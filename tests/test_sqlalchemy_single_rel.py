@@ -2,7 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 from fastmcp import Context
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -10,6 +10,7 @@ from enrichmcp import EnrichMCP
 from enrichmcp.sqlalchemy import (
     EnrichSQLAlchemyMixin,
     include_sqlalchemy_models,
+    session_scope,
     sqlalchemy_lifespan,
 )
 
@@ -64,3 +65,38 @@ async def test_single_relationship_resolver():
         assert none is None
         again = await resolver.fn(order_id=1, ctx=mctx)
         assert again.name == "Bob"
+
+
+@pytest.mark.asyncio
+async def test_single_relationship_resolver_query_count():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    lifespan = sqlalchemy_lifespan(Base, engine, seed=seed)
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base)
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    async with lifespan(app) as ctx:
+        mctx = Mock(spec=Context)
+        mctx.request_context = Mock(lifespan_context=ctx)
+        order_user = app.resources["get_orderenrichmodel_user"].fn
+        user_order = app.resources["get_userenrichmodel_order"].fn
+
+        statements.clear()
+        assert (await order_user(order_id=1, ctx=mctx)).name == "Bob"
+        assert (await user_order(user_id=1, ctx=mctx)).id == 1
+        assert len(statements) == 2
+        assert "JOIN" in statements[0]
+        assert "JOIN" not in statements[1]
+
+        async with session_scope():
+            await app.resources["get_order"].fn(order_id=1, ctx=mctx)
+            await app.resources["get_user"].fn(user_id=1, ctx=mctx)
+            statements.clear()
+            assert (await order_user(order_id=1, ctx=mctx)).name == "Bob"
+            assert statements == []
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Client, Context
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+    tool_session,
+)
+from enrichmcp.sqlalchemy.streaming import stream_entities
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Event(Base):
+    __tablename__ = "events"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    kind: Mapped[str] = mapped_column(index=True, info={"description": "Kind"})
+
+
+class EventModel(BaseModel):
+    id: int
+    kind: str
+
+
+async def seed(session: AsyncSession) -> None:
+    session.add_all(Event(id=i, kind="a" if i % 2 else "b") for i in range(1, 26))
+
+
+def create_app(tmp_path: Path):
+    lifespan = sqlalchemy_lifespan(Base, f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", seed=seed)
+    app = EnrichMCP("Test", "Desc", lifespan=lifespan)
+    include_sqlalchemy_models(app, Base, streaming=True)
+    return app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_stream_tool_sends_chunks_as_progress(tmp_path: Path):
+    app, _ = create_app(tmp_path)
+    chunks: list[tuple[float, list[dict]]] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        chunks.append((progress, json.loads(message)))
+
+    async with Client(app.mcp) as client:
+        result = await client.call_tool(
+            "stream_events",
+            {"chunk_size": 10, "filters": {"kind": {"eq": "a"}}, "order_by": "id"},
+            progress_handler=on_progress,
+        )
+        assert result.structured_content == {
+            "count": 13,
+            "streamed": True,
+            "items": [],
+            "truncated": False,
+        }
+        assert [progress for progress, _ in chunks] == [10, 13]
+        ids = [item["id"] for _, chunk in chunks for item in chunk]
+        assert ids == list(range(1, 26, 2))
+
+        chunks.clear()
+        result = await client.call_tool(
+            "stream_events",
+            {"limit": 5, "chunk_size": 2},
+            progress_handler=on_progress,
+        )
+        assert result.structured_content["count"] == 5
+        assert [progress for progress, _ in chunks] == [2, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_stream_tool_returns_items_inline_without_progress(tmp_path: Path):
+    app, lifespan = create_app(tmp_path)
+    async with lifespan(app.mcp) as lifespan_ctx:
+        ctx = Mock(spec=Context)
+        ctx.request_context = Mock(lifespan_context=lifespan_ctx, meta=None)
+        stream = app.resources["stream_events"].fn
+
+        result = await stream(ctx=ctx, limit=3)
+        assert result.streamed is False
+        assert [item.id for item in result.items] == [1, 2, 3]
+        assert result.truncated is False
+
+        async with tool_session(ctx) as session:
+            result = await stream_entities(
+                ctx,
+                session,
+                select(Event).order_by(Event.id),
+                lambda obj: EventModel(id=obj.id, kind=obj.kind),
+                inline_limit=10,
+            )
+        assert result.count == 10
+        assert result.truncated is True
+        ctx.report_progress.assert_not_called()
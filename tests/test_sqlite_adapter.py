@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fastmcp import Context
+from pydantic import Field
+
+from enrichmcp import EnrichMCP, EnrichModel
+from enrichmcp.sqlite import SQLitePool, include_sqlite_entity, sqlite_lifespan
+
+
+async def setup(conn):
+    await conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, user_name TEXT NOT NULL)")
+    await conn.executemany(
+        "INSERT INTO users (id, user_name) VALUES (?, ?)",
+        [(i, f"user{i}") for i in range(1, 6)],
+    )
+
+
+def create_app(database: str):
+    lifespan = sqlite_lifespan(database, readers=2, setup=setup)
+    app = EnrichMCP("SQLite", "Desc", lifespan=lifespan)
+
+    @app.entity
+    class User(EnrichModel):
+        """User."""
+
+        id: int = Field(description="ID")
+        name: str = Field(description="Name")
+
+    include_sqlite_entity(app, User, table="users", columns={"id": "id", "name": "user_name"})
+    return app, lifespan
+
+
+def mock_ctx(lifespan_context):
+    ctx = Mock(spec=Context)
+    ctx.request_context = Mock(lifespan_context=lifespan_context)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_generated_sqlite_tools(tmp_path):
+    app, lifespan = create_app(str(tmp_path / "db.sqlite"))
+    async with lifespan(app) as lifespan_context:
+        ctx = mock_ctx(lifespan_context)
+
+        user = await app.resources["get_user"].fn(user_id=2, ctx=ctx)
+        assert user.name == "user2"
+        assert await app.resources["get_user"].fn(user_id=99, ctx=ctx) is None
+
+        users = await app.resources["get_users_by_ids"].fn(ids=[3, 99, 1, 3], ctx=ctx)
+        assert [u.id for u in users] == [3, 1]
+
+        first = await app.resources["list_users"].fn(page=1, page_size=2, ctx=ctx)
+        assert [u.id for u in first.items] == [1, 2]
+        assert first.has_next
+        last = await app.resources["list_users"].fn(page=3, page_size=2, ctx=ctx)
+        assert [u.id for u in last.items] == [5]
+        assert not last.has_next
+        with pytest.raises(ValueError):
+            await app.resources["list_users"].fn(page=0, ctx=ctx)
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_reads_over_connections(tmp_path):
+    pool = SQLitePool(str(tmp_path / "db.sqlite"), readers=3)
+    await pool.open()
+    try:
+        async with pool.write() as conn:
+            await conn.execute("CREATE TABLE t (x INTEGER)")
+            await conn.commit()
+
+        seen = set()
+
+        async def borrow():
+            async with pool.read() as conn:
+                seen.add(id(conn))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(borrow() for _ in range(3)))
+        assert len(seen) == 3
+        assert await pool.fetchall("SELECT count(*) FROM t") == [(0,)]
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_must_be_open(tmp_path):
+    pool = SQLitePool(str(tmp_path / "db.sqlite"), readers=2)
+    with pytest.raises(RuntimeError, match="not open"):
+        await asyncio.wait_for(pool.fetchall("SELECT 1"), timeout=1)
+
+    await pool.open()
+    try:
+        async with pool.write() as conn:
+            await conn.execute("CREATE TABLE t (x INTEGER)")
+            await conn.commit()
+        assert await pool.fetchall("SELECT count(*) FROM t") == [(0,)]
+    finally:
+        await pool.close()
+    with pytest.raises(RuntimeError, match="not open"):
+        await asyncio.wait_for(pool.fetchone("SELECT 1"), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_memory_database_uses_writer_for_reads():
+    app, lifespan = create_app(":memory:")
+    async with lifespan(app) as lifespan_context:
+        pool = lifespan_context["sqlite_pool"]
+        assert pool.readers == 0
+        user = await app.resources["get_user"].fn(user_id=1, ctx=mock_ctx(lifespan_context))
+        assert user.name == "user1"
+
+
+def test_mapping_validates_primary_key():
+    app = EnrichMCP("SQLite", "Desc")
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        sku: str = Field(description="SKU")
+
+    with pytest.raises(ValueError):
+        include_sqlite_entity(app, Item, table="items")
+    with pytest.raises(ValueError):
+        SQLitePool("x.db", readers=-1)
@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+from fastmcp import Client
+from pydantic import Field, PydanticUserError
+
+from enrichmcp import EnrichMCP, EnrichModel, Relationship
+from enrichmcp.startup import PendingTool, StartupProfile
+
+
+def create_app() -> EnrichMCP:
+    app = EnrichMCP("Lazy API", instructions="desc", lazy_tools=True)
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        id: int = Field(description="ID")
+
+    @app.entity
+    class User(EnrichModel):
+        """User."""
+
+        id: int = Field(description="ID")
+        items: list[Item] = Relationship(description="items")
+
+    @app.retrieve(description="Get a user")
+    async def get_user(user_id: int) -> User:
+        return User(id=user_id)
+
+    @User.items.resolver
+    async def get_items(user_id: int) -> list[Item]:
+        return [Item(id=user_id)]
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_lazy_tools_built_on_first_request() -> None:
+    app = create_app()
+    assert "get_user" in app.tool_defs
+    assert app.resources == {}
+    assert await app.mcp.get_tools() == {}
+
+    async with Client(app.mcp) as client:
+        result = await client.call_tool("get_user", {"user_id": 3})
+        assert result.data.id == 3
+        tools = await client.list_tools()
+
+    assert {tool.name for tool in tools} == set(app.tool_defs)
+    assert set(app.resources) == set(app.tool_defs)
+
+
+@pytest.mark.asyncio
+async def test_register_pending_tools_by_name() -> None:
+    app = create_app()
+    app.register_pending_tools(["get_user", "missing"])
+    assert set(await app.mcp.get_tools()) == {"get_user"}
+
+    app.register_pending_tools()
+    assert set(await app.mcp.get_tools()) == set(app.tool_defs)
+    assert app.startup_profile.counts["schema"] == len(app.tool_defs)
+
+
+@pytest.mark.asyncio
+async def test_decorators_return_pending_tools() -> None:
+    app = EnrichMCP("Lazy API", instructions="desc", lazy_tools=True)
+
+    @app.retrieve(description="Ping")
+    async def ping(count: int) -> str:
+        return "pong" * count
+
+    assert isinstance(ping, PendingTool)
+    assert app.resources == {}
+    assert await ping.fn(count=2) == "pongpong"
+    assert ping.parameters["properties"]["count"]["type"] == "integer"
+    assert set(app.resources) == {"ping"}
+
+
+def test_schema_errors_are_not_retried(monkeypatch) -> None:
+    app = EnrichMCP("Lazy API", instructions="desc", lazy_tools=True)
+
+    @app.retrieve(description="Takes a lock")
+    async def locked(lock: threading.Lock) -> str:
+        return "locked"
+
+    rebuilds = []
+    monkeypatch.setattr(app, "rebuild_models", lambda: rebuilds.append(True))
+    with pytest.raises(PydanticUserError):
+        app.register_pending_tools()
+    assert rebuilds == []
+
+
+def test_startup_profile_excludes_nested_phases() -> None:
+    profile = StartupProfile()
+    with profile.phase("outer"):
+        with profile.phase("inner"):
+            pass
+        with profile.phase("inner"):
+            pass
+
+    assert profile.counts == {"outer": 1, "inner": 2}
+    assert profile.total == pytest.approx(sum(profile.seconds.values()))
+    lines = profile.report().splitlines()
+    assert lines[0].split() == ["phase", "seconds", "count"]
+    assert lines[-1].startswith("total")
@@ -1,9 +1,11 @@
+import inspect
 from unittest.mock import patch
 
 import pytest
 from pydantic import Field
 
 from enrichmcp import EnrichMCP, EnrichModel, Relationship
+from enrichmcp.tool import make_tool_function
 
 
 @pytest.mark.asyncio
@@ -49,3 +51,30 @@ async def test_tool_description_prefixes() -> None:
 
     desc = mock_tool.call_args.kwargs["description"]
     assert desc.startswith("This is a resolver for the My API server")
+
+
+@pytest.mark.asyncio
+async def test_make_tool_function_signature_and_defaults() -> None:
+    calls = []
+
+    async def impl(user_id: int, page: int) -> list[int]:
+        calls.append((user_id, page))
+        return [user_id, page]
+
+    tool = make_tool_function(
+        impl,
+        name="get_user_items",
+        parameters=[("user_id", int), ("page", int, 1)],
+        returns=list[int],
+        doc="Get items.",
+    )
+
+    assert tool.__name__ == "get_user_items"
+    assert tool.__doc__ == "Get items."
+    assert str(inspect.signature(tool)) == "(user_id: int, page: int = 1) -> list[int]"
+    assert tool.__annotations__["return"] == list[int]
+    assert await tool(5) == [5, 1]
+    assert await tool(page=3, user_id=2) == [2, 3]
+    with pytest.raises(TypeError):
+        await tool(page=2)
+    assert calls == [(5, 1), (2, 3)]
@@ -0,0 +1,111 @@
+import pytest
+from fastmcp import Client
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from enrichmcp import EnrichMCP, EnrichModel
+from enrichmcp.cache import ContextCache, MemoryCache
+from enrichmcp.sqlalchemy import (
+    EnrichSQLAlchemyMixin,
+    include_sqlalchemy_models,
+    sqlalchemy_lifespan,
+)
+from enrichmcp.tracing import set_tracer_provider
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TRACEPARENT = f"00-{TRACE_ID}-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def spans():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    set_tracer_provider(provider)
+    yield exporter
+    set_tracer_provider(None)
+
+
+class Base(DeclarativeBase, EnrichSQLAlchemyMixin):
+    pass
+
+
+class Product(Base):
+    """Product."""
+
+    __tablename__ = "products"
+    id: Mapped[int] = mapped_column(primary_key=True, info={"description": "ID"})
+    name: Mapped[str] = mapped_column(info={"description": "Name"})
+
+
+async def seed(session: AsyncSession) -> None:
+    session.add(Product(id=1, name="Widget"))
+
+
+@pytest.mark.asyncio
+async def test_tool_span_joins_request_trace(spans) -> None:
+    app = EnrichMCP("Tracing API", instructions="desc")
+
+    @app.entity
+    class Item(EnrichModel):
+        """Item."""
+
+        id: int = Field(description="ID")
+
+    @app.retrieve(description="Get an item")
+    async def get_item(item_id: int) -> Item:
+        return Item(id=item_id)
+
+    async with Client(app.mcp) as client:
+        await client.call_tool("get_item", {"item_id": 1}, meta={"traceparent": TRACEPARENT})
+
+    (span,) = [s for s in spans.get_finished_spans() if s.name == "tools/call get_item"]
+    assert span.attributes["mcp.tool.name"] == "get_item"
+    assert span.attributes["enrichmcp.tool.kind"] == "retriever"
+    assert format(span.context.trace_id, "032x") == TRACE_ID
+    assert format(span.parent.span_id, "016x") == "b7ad6b7169203331"
+
+
+@pytest.mark.asyncio
+async def test_cache_span_records_hit_and_miss(spans) -> None:
+    cache = ContextCache(MemoryCache(), "app", "req")
+
+    async def factory() -> str:
+        return "value"
+
+    await cache.get_or_set("key", factory)
+    await cache.get_or_set("key", factory)
+
+    hits = [s.attributes["enrichmcp.cache.hit"] for s in spans.get_finished_spans()]
+    assert hits == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_statement_and_startup_spans(spans) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    app = EnrichMCP(
+        "SQL", instructions="desc", lifespan=sqlalchemy_lifespan(Base, engine, seed=seed)
+    )
+    include_sqlalchemy_models(app, Base)
+
+    async with Client(app.mcp) as client:
+        result = await client.call_tool("get_product", {"product_id": 1})
+    assert result.structured_content["result"]["name"] == "Widget"
+
+    finished = spans.get_finished_spans()
+    (startup,) = [s for s in finished if s.name == "enrichmcp.lifespan.startup"]
+    assert startup.attributes["db.system"] == "sqlite"
+
+    (tool,) = [s for s in finished if s.name == "tools/call get_product"]
+    selects = [s for s in finished if s.name == "SELECT" and s.parent is not None]
+    assert any(s.parent.span_id == tool.context.span_id for s in selects)
+    assert all("products" in s.attributes["db.statement"] for s in selects)
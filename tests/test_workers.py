@@ -0,0 +1,189 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import httpx
+import pytest
+from pydantic import Field
+from starlette.middleware import Middleware
+
+from enrichmcp import EnrichMCP, EnrichModel
+from enrichmcp.workers import SessionAffinityMiddleware, current_worker, runs_setup
+
+ACCEPT = "application/json, text/event-stream"
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/call",
+    "params": {"name": "whoami", "arguments": {}},
+}
+
+
+def create_app(worker: int) -> EnrichMCP:
+    app = EnrichMCP("Workers API", instructions="desc")
+
+    @app.entity
+    class Worker(EnrichModel):
+        """Worker."""
+
+        index: int = Field(description="Worker index")
+
+    @app.retrieve(description="Return the serving worker")
+    async def whoami() -> Worker:
+        return Worker(index=worker)
+
+    return app
+
+
+def test_defaults_outside_pool() -> None:
+    assert current_worker() is None
+    assert runs_setup() is True
+
+
+def test_workers_require_streamable_http() -> None:
+    with pytest.raises(ValueError, match="streamable-http"):
+        create_app(0).run(transport="sse", workers=2)
+
+
+@pytest.mark.asyncio
+async def test_session_requests_reach_owner() -> None:
+    peers: list[httpx.AsyncBaseTransport] = []
+    apps = [
+        create_app(index).http_app(
+            json_response=True,
+            middleware=[Middleware(SessionAffinityMiddleware, worker=index, peers=peers)],
+        )
+        for index in range(2)
+    ]
+    peers.extend(httpx.ASGITransport(app=asgi) for asgi in apps)
+    headers = {"accept": ACCEPT}
+
+    async with (
+        apps[0].router.lifespan_context(apps[0]),
+        apps[1].router.lifespan_context(apps[1]),
+    ):
+        async with httpx.AsyncClient(transport=peers[1], base_url="http://test") as http:
+            response = await http.post("/mcp", json=INITIALIZE, headers=headers)
+        session = response.headers["mcp-session-id"]
+        assert session.startswith("1-")
+        headers["mcp-session-id"] = session
+
+        # Worker 0 does not know the session and forwards to worker 1
+        async with httpx.AsyncClient(transport=peers[0], base_url="http://test") as http:
+            response = await http.post("/mcp", json=CALL, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["result"]["structuredContent"] == {"index": 1}
+
+
+SERVER = """
+import os
+from pydantic import Field
+from enrichmcp import EnrichMCP, EnrichModel
+from enrichmcp.workers import current_worker
+
+app = EnrichMCP("Workers API", instructions="desc")
+
+@app.entity
+class Worker(EnrichModel):
+    \"\"\"Worker.\"\"\"
+
+    index: int = Field(description="Worker index")
+    pid: int = Field(description="Process ID")
+
+@app.retrieve(description="Return the serving worker")
+async def whoami() -> Worker:
+    return Worker(index=current_worker(), pid=os.getpid())
+
+app.run(
+    transport="streamable-http", port={port}, workers=2, json_response=True, log_level="warning"
+)
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(tmp_path) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    script = tmp_path / "server.py"
+    script.write_text(textwrap.dedent(SERVER.format(port=port)))
+    with open(tmp_path / "stderr.log", "wb") as stderr:
+        process = subprocess.Popen([sys.executable, "-W", "ignore", str(script)], stderr=stderr)
+    return process, f"http://127.0.0.1:{port}/mcp"
+
+
+def initialize(process: subprocess.Popen, url: str) -> str:
+    """Open a session once the server accepts connections and return its ID."""
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            response = httpx.post(url, json=INITIALIZE, headers={"accept": ACCEPT})
+            return response.headers["mcp-session-id"]
+        except httpx.TransportError:
+            assert process.poll() is None and time.monotonic() < deadline
+            time.sleep(0.1)
+
+
+def whoami(url: str, session: str) -> dict:
+    response = httpx.post(url, json=CALL, headers={"accept": ACCEPT, "mcp-session-id": session})
+    return response.json()["result"]["structuredContent"]
+
+
+def test_prefork_workers(tmp_path) -> None:
+    process, url = start_server(tmp_path)
+    try:
+        session = initialize(process, url)
+        owner = int(session.split("-")[0])
+
+        # Fresh connections land on either worker; the session stays on its owner
+        pids = set()
+        for _ in range(10):
+            result = whoami(url, session)
+            assert result["index"] == owner
+            pids.add(result["pid"])
+        assert len(pids) == 1 and os.getpid() not in pids
+    finally:
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+
+
+def test_crashed_worker_is_restarted(tmp_path) -> None:
+    process, url = start_server(tmp_path)
+    try:
+        session = initialize(process, url)
+        crashed = whoami(url, session)
+        os.kill(crashed["pid"], signal.SIGKILL)
+
+        # Sessions owned by the restarted worker reach a new process
+        deadline = time.monotonic() + 30
+        while True:
+            assert process.poll() is None and time.monotonic() < deadline
+            session = initialize(process, url)
+            if int(session.split("-")[0]) == crashed["index"]:
+                break
+        restarted = whoami(url, session)
+        assert restarted["index"] == crashed["index"]
+        assert restarted["pid"] != crashed["pid"]
+    finally:
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+    log = (tmp_path / "stderr.log").read_text()
+    assert f"Worker {crashed['index']} exited" in log
+    assert "Traceback" not in log